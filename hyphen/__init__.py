@@ -1,3 +1,21 @@
-from hyphen.client import HyphenClient
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hyphen.client import HyphenClient
 
 __all__ = ["HyphenClient"]
+
+
+def __getattr__(name: str) -> Any:
+    # the client pulls in httpx and pydantic, so `import hyphen` waits until it's used
+    if name == "HyphenClient":
+        from hyphen.client import (  # pylint: disable=import-outside-toplevel
+            HyphenClient,
+        )
+
+        return HyphenClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -1,13 +1,19 @@
-from typing import TYPE_CHECKING, List, Any
-from pydantic import BaseModel
+from typing import TYPE_CHECKING, List, Any, Dict, Type, Optional, Iterator
+from typing import AsyncIterator, Iterable
+from pydantic import BaseModel, Field, create_model
 from abc import ABC
 
+from hyphen.bulk import BulkResult, dedupe, fan_out, run_bulk, run_bulk_async
+
 if TYPE_CHECKING:
     from hyphen.client import HTTPRequestClient
 
 
 class CollectionList(BaseModel):
     data: List[Any]
+    total: Optional[int] = None
+    page_num: Optional[int] = Field(default=None, alias="pageNum")
+    page_size: Optional[int] = Field(default=None, alias="pageSize")
 
     def __iter__(self):
         return iter(self.data)
@@ -15,12 +21,56 @@ class CollectionList(BaseModel):
     def __getitem__(self, item):
         return self.data[item]
 
+    def has_next(self, page_num: int, page_size: int) -> bool:
+        """Is there another page after this one? Goes by the page size the engine
+        echoes back, since it may cap the one that was asked for.
+        """
+        size = self.page_size or page_size
+        if self.total is not None:
+            return page_num * size < self.total
+        return len(self.data) == size
+
+    def ids(self) -> tuple:
+        return tuple(getattr(item, "id", None) for item in self.data)
+
+    def repeats(self, page_num: int, previous_ids: Optional[tuple]) -> bool:
+        """Is this not page `page_num` at all? An engine that ignores paging hands back
+        the whole collection for every page, with its own page number or none, so a
+        collection of exactly `page_size` would otherwise be fetched forever.
+        """
+        if page_num > 1 and self.page_num is not None and self.page_num != page_num:
+            return True
+        ids = self.ids()
+        return any(ids) and ids == previous_ids
+
+
+# one prebuilt collection model per object class, shared by every list path
+_collection_registry: Dict[type, Type[CollectionList]] = {}
+
+
+def collection_for(object_class: type) -> Type[CollectionList]:
+    """Returns the shared `CollectionList` model for `object_class`.
+    The model (and its pydantic-core validator) is built on first use and reused after.
+    """
+    try:
+        return _collection_registry[object_class]
+    except KeyError:
+        collection = create_model(
+            f"{object_class.__name__}Collection",
+            __base__=CollectionList,
+            data=(List[object_class], ...),
+        )
+        return _collection_registry.setdefault(object_class, collection)
+
 
 class BaseFactory(ABC):
     """The common ancestor of all object factories"""
 
     _object_class: type
     url_path: str
+    page_size: int = 100
+    # how many requests the *_many methods keep in flight at once
+    bulk_concurrency: int = 8
 
     def __init__(self, client: "HTTPRequestClient"):
         """Initialize the object factory."""
@@ -35,21 +85,44 @@ class BaseFactory(ABC):
 
         return _create(**kwargs)
 
-    def read(self, id: str) -> "Any":
+    def read(self, id: str, trusted: Optional[bool] = None) -> "Any":
         """Read an object"""
 
         def _read(id: str) -> self._object_class:
-            return self.client.get(f"{self.url_path}/{id}", self._object_class)
+            return self.client.get(
+                f"{self.url_path}/{id}", self._object_class, trusted=trusted
+            )
 
         return _read(id)
 
-    def list(self) -> "CollectionList":
+    def list(self, trusted: Optional[bool] = None) -> "CollectionList":
         """List all objects"""
-
-        class HyphenCollection(CollectionList):
-            data: List[self._object_class]
-
-        return self.client.get(self.url_path, HyphenCollection)
+        return self.client.get(
+            self.url_path, collection_for(self._object_class), trusted=trusted
+        )
+
+    def iter_list(
+        self, page_size: Optional[int] = None, trusted: Optional[bool] = None
+    ) -> Iterator[Any]:
+        """Iterate over all objects, fetching one page at a time.
+        Only the current page is held in memory, however large the collection is.
+        Pass `trusted=True` to skip validation, see `hyphen.trusted.decode`.
+        """
+        page_num, page_size, previous_ids = 1, page_size or self.page_size, None
+        while True:
+            page = self.client.get(
+                self.url_path,
+                collection_for(self._object_class),
+                params={"pageNum": page_num, "pageSize": page_size},
+                trusted=trusted,
+            )
+            if page is None or page.repeats(page_num, previous_ids):
+                return
+            for item in page:
+                yield self._scope(item)
+            if not page.has_next(page_num, page_size):
+                return
+            page_num, previous_ids = page_num + 1, page.ids()
 
     def update(self, target: Any) -> "Any":
         """Update an object. Accepts an updated instance
@@ -71,16 +144,55 @@ class BaseFactory(ABC):
 
         return _delete(target)
 
+    def create_many(
+        self, items: Iterable[dict], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        """Create an object per dict of `create` arguments, see `hyphen.bulk.BulkResult`"""
+        return run_bulk(
+            lambda kwargs: self.create(**kwargs),
+            list(items),
+            concurrency or self.bulk_concurrency,
+        )
+
+    def read_many(
+        self, ids: Iterable[str], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        """Read objects by id, fetching each distinct id once"""
+        ids = list(ids)
+        unique = dedupe(ids)
+        result = run_bulk(self.read, unique, concurrency or self.bulk_concurrency)
+        return fan_out(ids, unique, result)
+
+    def update_many(
+        self, targets: Iterable[Any], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        """Update objects, see `hyphen.bulk.BulkResult`"""
+        return run_bulk(
+            self.update, list(targets), concurrency or self.bulk_concurrency
+        )
+
+    def delete_many(
+        self, targets: Iterable[Any], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        """Delete objects, see `hyphen.bulk.BulkResult`"""
+        return run_bulk(
+            self.delete, list(targets), concurrency or self.bulk_concurrency
+        )
+
+    def _scope(self, target: Any) -> Any:
+        """Hook for factories that attach context to the objects they return"""
+        return target
+
 
 class AsyncBaseFactory(BaseFactory):
+    """The async twin of `BaseFactory`.
+    Async factories list it before their sync counterpart, so every shared method is
+    a coroutine while the sync factory still supplies urls and scoping.
+    """
 
     _object_class: type
     url_path: str
 
-    async def __init__(self, client: "HTTPRequestClient"):
-        """Initialize the object factory."""
-        self.client = client
-
     async def create(self, **kwargs) -> "Any":
         """Create a new object, within the context of the current organization"""
 
@@ -90,21 +202,56 @@ class AsyncBaseFactory(BaseFactory):
 
         return await _create(**kwargs)
 
-    async def read(self, id: str) -> "Any":
+    async def read(self, id: str, trusted: Optional[bool] = None) -> "Any":
         """Read an object"""
 
         async def _read(id: str) -> self._object_class:
-            return await self.client.get(f"{self.url_path}/{id}", self._object_class)
+            return await self.client.get(
+                f"{self.url_path}/{id}", self._object_class, trusted=trusted
+            )
 
         return await _read(id)
 
-    async def list(self) -> "CollectionList":
+    async def list(self, trusted: Optional[bool] = None) -> "CollectionList":
         """List all objects"""
+        return await self.client.get(
+            self.url_path, collection_for(self._object_class), trusted=trusted
+        )
+
+    async def iter_list(
+        self, page_size: Optional[int] = None, trusted: Optional[bool] = None
+    ) -> AsyncIterator[Any]:
+        """Iterate over all objects with `async for`, fetching one page at a time.
+        Only the current page is held in memory, however large the collection is.
+        Pass `trusted=True` to skip validation, see `hyphen.trusted.decode`.
+        """
+        page_num, page_size, previous_ids = 1, page_size or self.page_size, None
+        while True:
+            page = await self.client.get(
+                self.url_path,
+                collection_for(self._object_class),
+                params={"pageNum": page_num, "pageSize": page_size},
+                trusted=trusted,
+            )
+            if page is None or page.repeats(page_num, previous_ids):
+                return
+            for item in page:
+                yield self._scope(item)
+            if not page.has_next(page_num, page_size):
+                return
+            page_num, previous_ids = page_num + 1, page.ids()
+
+    async def update(self, target: Any) -> "Any":
+        """Update an object. Accepts an updated instance
+        to persist.
+        """
 
-        class HyphenCollection(CollectionList):
-            data: List[self._object_class]
+        async def _update(target: self._object_class) -> self._object_class:
+            return await self.client.patch(
+                f"{self.url_path}/{target.id}", self._object_class, target
+            )
 
-        return await self.client.get(self.url_path, HyphenCollection)
+        return await _update(target)
 
     async def delete(self, target: Any) -> None:
         """Delete an object"""
@@ -113,3 +260,40 @@ class AsyncBaseFactory(BaseFactory):
             return await self.client.delete(f"{self.url_path}/{target.id}")
 
         return await _delete(target)
+
+    async def create_many(
+        self, items: Iterable[dict], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        """Create an object per dict of `create` arguments, see `hyphen.bulk.BulkResult`"""
+        return await run_bulk_async(
+            lambda kwargs: self.create(**kwargs),
+            list(items),
+            concurrency or self.bulk_concurrency,
+        )
+
+    async def read_many(
+        self, ids: Iterable[str], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        """Read objects by id, fetching each distinct id once"""
+        ids = list(ids)
+        unique = dedupe(ids)
+        result = await run_bulk_async(
+            self.read, unique, concurrency or self.bulk_concurrency
+        )
+        return fan_out(ids, unique, result)
+
+    async def update_many(
+        self, targets: Iterable[Any], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        """Update objects, see `hyphen.bulk.BulkResult`"""
+        return await run_bulk_async(
+            self.update, list(targets), concurrency or self.bulk_concurrency
+        )
+
+    async def delete_many(
+        self, targets: Iterable[Any], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        """Delete objects, see `hyphen.bulk.BulkResult`"""
+        return await run_bulk_async(
+            self.delete, list(targets), concurrency or self.bulk_concurrency
+        )
@@ -0,0 +1,211 @@
+from concurrent.futures import Future
+from threading import Condition, Timer
+from typing import TYPE_CHECKING, Dict, List, Tuple
+import asyncio
+
+from pydantic import BaseModel
+
+from hyphen.member import MemberIdsReference, copy_member
+
+if TYPE_CHECKING:
+    from hyphen.client import HTTPRequestClient, AsyncHTTPRequestClient
+    from hyphen.member import Member
+
+
+class RoleBatching(BaseModel):
+    """Opt-in coalescing of role assignments, set with `ClientConfig(role_batching=...)`.
+
+    Role assignments to the same team or organization are held for up to `window`
+    seconds, or until `max_batch_size` members are waiting, and then sent as one PUT.
+    With batching on, sync `assign_role` returns a `concurrent.futures.Future` of the
+    scoped members instead of the members themselves. Async `assign_role` is awaited as
+    before and simply resolves once its batch has been sent.
+
+    Pending assignments are sent by `flush()`, and when the client is closed. Both wait
+    for batches that are already being sent, so none is cut off by closing the pool.
+
+    Example:
+
+        client = HyphenClient(
+            organization_id="my_org_id",
+            config=ClientConfig(role_batching=RoleBatching(window=0.05, max_batch_size=200)),
+        )
+        future = team.member.assign_role("teamAdmin", [member])
+        client.flush()
+        members = future.result()
+    """
+
+    window: float = 0.05
+    max_batch_size: int = 100
+
+
+# the members of one assign_role call, and what its caller is waiting on
+Pending = Tuple[List["Member"], Future]
+
+
+def merge_members(members: List["Member"]) -> List["Member"]:
+    """one entry per member id, holding every role it was assigned across the batch"""
+    merged: Dict[str, "Member"] = {}
+    for member in members:
+        if member.id not in merged:
+            merged[member.id] = member
+            continue
+        existing = merged[member.id]
+        roles = existing.roles + [r for r in member.roles if r not in existing.roles]
+        if existing is not member:
+            # a copy, since callers get their own members back; works for trusted ones too
+            merged[member.id] = copy_member(existing)
+            merged[member.id].roles = roles
+    return list(merged.values())
+
+
+class RoleAssignmentBatcher:
+    """Buffers sync role assignments per url, sending each batch from a timer thread"""
+
+    def __init__(self, client: "HTTPRequestClient", batching: RoleBatching):
+        self.client = client
+        self.batching = batching
+        self._pending: Dict[str, List[Pending]] = {}
+        self._timers: Dict[str, Timer] = {}
+        # how many taken batches are still being sent, and a lock to wait for it on
+        self._sending = 0
+        self._lock = Condition()
+
+    def submit(self, url: str, members: List["Member"]) -> Future:
+        """queues `members` for a PUT to `url`, resolving to them once it's sent"""
+        future: Future = Future()
+        with self._lock:
+            batch = self._pending.setdefault(url, [])
+            batch.append((members, future))
+            if sum(len(queued) for queued, _ in batch) >= self.batching.max_batch_size:
+                batch = self._take(url)
+            else:
+                if url not in self._timers:
+                    timer = Timer(self.batching.window, self._flush_url, (url,))
+                    timer.daemon = True
+                    self._timers[url] = timer
+                    timer.start()
+                batch = None
+        if batch:
+            self._send(url, batch)
+        return future
+
+    def flush(self):
+        """sends every pending batch now, and waits for those already being sent"""
+        with self._lock:
+            batches = {url: self._take(url) for url in list(self._pending)}
+        for url, batch in batches.items():
+            self._send(url, batch)
+        with self._lock:
+            self._lock.wait_for(lambda: not self._sending)
+
+    def _flush_url(self, url: str):
+        with self._lock:
+            batch = self._take(url)
+        if batch:
+            self._send(url, batch)
+
+    def _take(self, url: str) -> List[Pending]:
+        """removes the pending batch for `url` to be sent; callers hold the lock"""
+        timer = self._timers.pop(url, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(url, [])
+        if batch:
+            self._sending += 1
+        return batch
+
+    def _send(self, url: str, batch: List[Pending]):
+        try:
+            self._put(url, batch)
+        finally:
+            with self._lock:
+                self._sending -= 1
+                self._lock.notify_all()
+
+    def _put(self, url: str, batch: List[Pending]):
+        try:
+            members = merge_members([m for queued, _ in batch for m in queued])
+            self.client.put(url, instance=MemberIdsReference(members=members))
+        except Exception as error:  # noqa pylint: disable=broad-except
+            for _, future in batch:
+                future.set_exception(error)
+            return
+        for queued, future in batch:
+            future.set_result(queued)
+
+
+class AsyncRoleAssignmentBatcher:
+    """Buffers async role assignments per url, sending each batch from a delayed task"""
+
+    def __init__(self, client: "AsyncHTTPRequestClient", batching: RoleBatching):
+        self.client = client
+        self.batching = batching
+        self._pending: Dict[str, List[Tuple[List["Member"], asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.Task] = {}
+        # how many taken batches are still being sent, and who's waiting for none to be
+        self._sending = 0
+        self._idle: List[asyncio.Future] = []
+
+    async def submit(self, url: str, members: List["Member"]) -> List["Member"]:
+        """queues `members` for a PUT to `url` and waits until it's sent"""
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.setdefault(url, [])
+        batch.append((members, future))
+        if sum(len(queued) for queued, _ in batch) >= self.batching.max_batch_size:
+            await self._send(url, self._take(url))
+        elif url not in self._timers:
+            self._timers[url] = asyncio.create_task(self._flush_later(url))
+        return await future
+
+    async def flush(self):
+        """sends every pending batch now, and waits for those already being sent"""
+        batches = {url: self._take(url) for url in list(self._pending)}
+        await asyncio.gather(
+            *(self._send(url, batch) for url, batch in batches.items())
+        )
+        while self._sending:
+            idle = asyncio.get_running_loop().create_future()
+            self._idle.append(idle)
+            await idle
+
+    async def _flush_later(self, url: str):
+        await asyncio.sleep(self.batching.window)
+        # this task is finishing on its own, so don't let _take cancel it
+        self._timers.pop(url, None)
+        await self._send(url, self._take(url))
+
+    def _take(self, url: str) -> list:
+        timer = self._timers.pop(url, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(url, [])
+        if batch:
+            self._sending += 1
+        return batch
+
+    async def _send(self, url: str, batch: list):
+        if not batch:
+            return
+        try:
+            await self._put(url, batch)
+        finally:
+            self._sending -= 1
+            if not self._sending:
+                idle, self._idle = self._idle, []
+                for waiter in idle:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+    async def _put(self, url: str, batch: list):
+        try:
+            members = merge_members([m for queued, _ in batch for m in queued])
+            await self.client.put(url, instance=MemberIdsReference(members=members))
+        except Exception as error:  # noqa pylint: disable=broad-except
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for queued, future in batch:
+            if not future.done():
+                future.set_result(queued)
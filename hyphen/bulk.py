@@ -0,0 +1,173 @@
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Sequence, Tuple
+import asyncio
+
+from hyphen.exceptions import BulkOperationException
+
+
+class BulkResult:
+    """The outcome of a bulk factory call, one entry per input item and in input order.
+
+    A failed item does not fail the batch: its exception is kept in `errors`, keyed on
+    the item's position, and its slot in `results` is None.
+
+    Example:
+
+        result = client.team.create_many([{"name": "marketing"}, {"name": "sales"}])
+        for team in result.successes:
+            print(team.name)
+        for index, error in result.errors.items():
+            print(f"item {index} failed: {error}")
+        result.raise_for_errors()  # or fail loudly if anything went wrong
+    """
+
+    def __init__(self, results: List[Any], errors: Dict[int, Exception]):
+        self.results = results
+        self.errors = errors
+
+    def __repr__(self):
+        return (
+            f"<BulkResult: {len(self.successes)} succeeded, {len(self.errors)} failed>"
+        )
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.results[index]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def successes(self) -> List[Any]:
+        """the results of the items that succeeded, in input order"""
+        return [
+            result
+            for index, result in enumerate(self.results)
+            if index not in self.errors
+        ]
+
+    def raise_for_errors(self):
+        if self.errors:
+            raise BulkOperationException(self.errors)
+
+
+def run_bulk(
+    call: Callable[[Any], Any], items: Sequence[Any], concurrency: int
+) -> BulkResult:
+    """Calls `call` on every item from at most `concurrency` threads"""
+    results: List[Any] = [None] * len(items)
+    errors: Dict[int, Exception] = {}
+
+    def run(index: int):
+        try:
+            results[index] = call(items[index])
+        except Exception as error:  # noqa pylint: disable=broad-except
+            errors[index] = error
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+        list(pool.map(run, range(len(items))))
+    return BulkResult(results, dict(sorted(errors.items())))
+
+
+async def run_bulk_async(
+    call: Callable[[Any], Awaitable[Any]], items: Sequence[Any], concurrency: int
+) -> BulkResult:
+    """Awaits `call` on every item, with at most `concurrency` in flight at once"""
+    results: List[Any] = [None] * len(items)
+    errors: Dict[int, Exception] = {}
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(index: int):
+        async with semaphore:
+            try:
+                results[index] = await call(items[index])
+            except Exception as error:  # noqa pylint: disable=broad-except
+                errors[index] = error
+
+    await asyncio.gather(*(run(index) for index in range(len(items))))
+    return BulkResult(results, dict(sorted(errors.items())))
+
+
+class Batch:
+    """Factory calls queued to run concurrently from a sync client, see `HyphenClient.batch`.
+
+    `add` queues a call and hands back a `concurrent.futures.Future` for its result. `run`
+    (or leaving a `with` block) sends every queued call from at most `concurrency` threads
+    over the client's shared connection pool, resolving each future as it finishes. A call
+    that raises fails only its own future, and its error is kept in the `BulkResult`.
+
+    Example:
+
+        with client.batch(concurrency=16) as batch:
+            roster = batch.add(team.member.list)
+            member = batch.add(client.member.read, member_id)
+        print(roster.result(), member.result())
+    """
+
+    def __init__(self, concurrency: int = 8):
+        self.concurrency = concurrency
+        self._calls: List[Tuple[Callable[..., Any], tuple, dict, Future]] = []
+
+    def __repr__(self):
+        return f"<Batch: {len(self._calls)} calls queued>"
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, error_type, *_):
+        # an exception inside the block abandons the batch rather than sending it
+        if error_type is None:
+            self.run()
+        else:
+            for _, _, _, future in self._calls:
+                future.cancel()
+            self._calls = []
+
+    def add(self, call: Callable[..., Any], *args, **kwargs) -> Future:
+        """queues `call(*args, **kwargs)`, resolving the returned future once it has run"""
+        future: Future = Future()
+        self._calls.append((call, args, kwargs, future))
+        return future
+
+    def run(self) -> BulkResult:
+        """Runs every queued call, returning their results in the order they were added"""
+        calls, self._calls = self._calls, []
+
+        def run_one(queued: tuple) -> Any:
+            call, args, kwargs, future = queued
+            if not future.set_running_or_notify_cancel():
+                raise CancelledError()
+            try:
+                result = call(*args, **kwargs)
+            except Exception as error:
+                future.set_exception(error)
+                raise
+            future.set_result(result)
+            return result
+
+        return run_bulk(run_one, calls, self.concurrency)
+
+
+def dedupe(ids: Sequence[str]) -> List[str]:
+    """`ids` without repeats, in first-seen order"""
+    return list(dict.fromkeys(ids))
+
+
+def fan_out(ids: Sequence[str], unique: List[str], result: BulkResult) -> BulkResult:
+    """maps a result over deduped ids back onto the original, possibly repeating, ids"""
+    position = {item_id: index for index, item_id in enumerate(unique)}
+    results, errors = [], {}
+    for index, item_id in enumerate(ids):
+        results.append(result.results[position[item_id]])
+        if position[item_id] in result.errors:
+            errors[index] = result.errors[position[item_id]]
+    return BulkResult(results, errors)
@@ -0,0 +1,207 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Set
+
+import httpx
+
+from hyphen.rate_limit import path_template
+
+# returned by `ResponseCache.get` on a miss, since None is a valid cached response
+MISSING = object()
+
+
+class CacheEntry:
+    __slots__ = ("expires", "path", "value", "etag", "last_modified")
+
+    def __init__(  # noqa pylint: disable=too-many-arguments
+        self,
+        expires: float,
+        path: str,
+        value: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.expires = expires
+        self.path = path
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class Fetch:
+    """A GET in flight, marked stale if a write invalidates its path before it lands"""
+
+    __slots__ = ("path", "stale")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stale = False
+
+
+class ResponseCache:
+    """A size-bounded LRU cache of parsed GET responses, with a TTL per resource.
+
+    Reads through a client with a cache skip the network (and validation) while their
+    entry is fresh. Any write the same client sends invalidates the cached paths it can
+    affect: the written path, its parents (such as the list it belongs to) and its children.
+    GETs still in flight for those paths when the write lands aren't cached either, since
+    they may carry the data from before it.
+
+    When the engine sends an `ETag` or `Last-Modified` header, expired entries are kept
+    and revalidated with a conditional GET. A `304 Not Modified` renews the entry and
+    hands back the already-parsed objects, saving the download and the validation.
+
+    Cached objects are shared between callers, so treat them as read-only. The SDK's own
+    writes, such as `add` and `assign_role`, send copies of the members they're given.
+
+    Example:
+
+        cache = ResponseCache(
+            max_entries=2048,
+            ttl=30,
+            ttls={"api/organizations/{id}/teams/{id}/members": 300},
+        )
+        client = HyphenClient(organization_id="my_org_id", config=ClientConfig(cache=cache))
+
+    Args:
+        max_entries: the least recently used entries are evicted past this size
+        ttl: default seconds an entry stays fresh
+        ttls: per-resource TTLs keyed on path template, see `hyphen.rate_limit.path_template`
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 30.0,
+        ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttls = {
+            template.strip("/"): seconds for template, seconds in (ttls or {}).items()
+        }
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._fetches: Set[Fetch] = set()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """The fresh cached value for `key`, or `MISSING`"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires < self.clock():
+                # expired entries are kept only if they can be revalidated
+                if entry is not None and not entry.revalidatable:
+                    del self._entries[key]
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(  # noqa pylint: disable=too-many-arguments
+        self,
+        key: Hashable,
+        path: str,
+        value: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        fetch: Optional[Fetch] = None,
+    ):
+        """Caches `value`, unless it came from a `fetch` a write has since made stale"""
+        entry = CacheEntry(
+            self._expiry(path), _normalize(path), value, etag, last_modified
+        )
+        with self._lock:
+            if fetch is not None and fetch.stale:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def conditional_headers(self, key: Hashable) -> dict:
+        """`If-None-Match`/`If-Modified-Since` headers to revalidate `key` with, if it can be"""
+        with self._lock:
+            entry = self._entries.get(key)
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidate(self, key: Hashable) -> Any:
+        """Renews `key` after a 304, returning its value, or `MISSING` if it was dropped"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            entry.expires = self._expiry(entry.path)
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+            return entry.value
+
+    def _expiry(self, path: str) -> float:
+        return self.clock() + self.ttls.get(path_template(path), self.ttl)
+
+    @contextmanager
+    def fetching(self, path: str) -> Iterator[Fetch]:
+        """Tracks a GET of `path` while it's in flight, pass it to `set` with its result"""
+        fetch = Fetch(_normalize(path))
+        with self._lock:
+            self._fetches.add(fetch)
+        try:
+            yield fetch
+        finally:
+            with self._lock:
+                self._fetches.discard(fetch)
+
+    def invalidate(self, path: str):
+        """Drops every entry for `path`, its parents and its children, and keeps the
+        results of GETs in flight for them out of the cache
+        """
+        path = _normalize(path)
+        with self._lock:
+            for fetch in self._fetches:
+                if _related(path, fetch.path):
+                    fetch.stale = True
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if _related(path, entry.path)
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "size": len(self._entries),
+            }
+
+
+def _normalize(path: str) -> str:
+    return httpx.URL(path).path.strip("/")
+
+
+def _related(path: str, other: str) -> bool:
+    """is one path the other, or an ancestor of it?"""
+    shorter, longer = sorted((path, other), key=len)
+    return longer == shorter or longer.startswith(f"{shorter}/")
@@ -1,22 +1,58 @@
 from pydantic import AnyHttpUrl, BaseModel, ValidationError
 from datetime import datetime
 import httpx
-from asyncio import get_event_loop
+import asyncio
+from contextlib import nullcontext, suppress
+from copy import copy
+from functools import cached_property
+from threading import Lock
+from time import monotonic, sleep
 from json.decoder import JSONDecodeError
-from typing import Optional, Union
+import json
+import pydantic_core
+import warnings
+from typing import Any, Callable, Dict, Iterable, Optional, Union
 
 from hyphen.loggers.hyphen_logger import get_logger
 from hyphen.base_object import RESTModel
-from hyphen.exceptions import AuthenticationException, HyphenApiException
+from hyphen.exceptions import (
+    AuthenticationException,
+    HyphenApiException,
+    IncorrectMethodException,
+)
 from hyphen.auth import Auth
-from hyphen.settings import settings
+from hyphen.batching import AsyncRoleAssignmentBatcher, RoleAssignmentBatcher
+from hyphen.bulk import Batch, BulkResult, run_bulk, run_bulk_async
+from hyphen.cache import MISSING, Fetch
+from hyphen.coalesce import AsyncSingleFlight, SingleFlight
+from hyphen.config import ClientConfig
+from hyphen.directory import AsyncOrgDirectory, OrgDirectory
+from hyphen.retry import RetryStats
+from hyphen.settings import env_m2m_credentials
+from hyphen.token_store import CachedToken, MemoryTokenStore, TokenStore
+from hyphen.trusted import decode, encode
 
 from hyphen.member import MemberFactory, AsyncMemberFactory
-from hyphen.movie_quote import MovieQuoteFactory, AsyncMovieQuoteFactory
+from hyphen.movie_quote import (
+    MovieQuote,
+    MovieQuoteFactory,
+    AsyncMovieQuoteFactory,
+)
 from hyphen.organization import OrganizationFactory, AsyncOrganizationFactory
 from hyphen.team import TeamFactory, AsyncTeamFactory
 
 
+# pydantic-core parses json itself (with jiter) from 2.18 on, which beats json.loads and
+# then validating the dicts. Older cores are faster going through json.loads.
+PYDANTIC_CORE_VERSION = tuple(
+    int(part) for part in pydantic_core.__version__.split(".")[:2]
+)
+VALIDATE_JSON = PYDANTIC_CORE_VERSION >= (2, 18)
+
+# sent on every request made on behalf of a member, see `HyphenClient.as_user`
+IMPERSONATE_HEADER = "x-hyphen-impersonate"
+
+
 def logger(level: Optional[str] = None):
     # deal with circular import
     return get_logger(__name__, level=level)
@@ -39,30 +75,71 @@ class HyphenClient:
 
         # async
         from hyphen import HyphenClient
-        client = HyphenClient(client_id="my_client_id", client_secret="my_client_secret", async_=True)
-        new_team = await client.team.create("My New Team")
+        async with HyphenClient(client_id="my_client_id", client_secret="my_client_secret", async_=True) as client:
+            new_team = await client.team.create("My New Team")
 
     This will generate a new team within the organization associated with the client's credentials.
 
+    Each client keeps one pooled connection for its lifetime. Close it when you're done, with
+    `with`/`client.close()`, or `async with`/`await client.aclose()` for async clients.
+
     Args:
         host: The base URL for the Hyphen api, defaults to https://engine.hyphen.ai
         client_id: The client id for m2m authentication
         client_secret: The client secret used for m2m authentication
-        impersonate_id: The id of the user to impersonate, used for "on behalf of" authentication
+        impersonate_id: The id of the user to impersonate, used for "on behalf of" authentication.
+            To act for many users from one client, use `client.as_user(member_id)` instead.
         organization_id: The id of the organization to act within.
         debug: if True, the client will log debug messages
         async_: if True returns an async client
         legacy_api_key: Generally unsupported.
+        background_token_refresh: if True (async only), m2m tokens are refreshed by a background
+            task ahead of expiry so requests never wait on a token round trip.
+        token_store: where m2m tokens are shared between clients and processes, see `hyphen.token_store`
+        config: connection pool, timeout, HTTP/2 and transport settings, see `hyphen.config.ClientConfig`
+
+    To reuse one client per set of credentials across a process, use `HyphenClient.shared(...)`
+    in place of `HyphenClient(...)`.
 
     """
 
     client: Union["HTTPRequestClient", "AsyncHTTPRequestClient"]
     organization_id: Optional[str]
 
+    _shared_clients: Dict[tuple, "HyphenClient"] = {}
+    _shared_lock = Lock()
+    _shared_token_store = MemoryTokenStore()
+
     @classmethod
     def helloworld(cls) -> str:
         return "Hello World!"
 
+    @classmethod
+    def shared(cls, organization_id: str, **kwargs) -> "HyphenClient":
+        """Returns the process-wide client for these arguments, creating it on first use.
+        Shared clients also share one in-memory token store unless given their own.
+        """
+        kwargs.setdefault("token_store", cls._shared_token_store)
+        key = (
+            organization_id,
+            *sorted((name, cls._shared_key(value)) for name, value in kwargs.items()),
+        )
+        with cls._shared_lock:
+            if key not in cls._shared_clients:
+                cls._shared_clients[key] = cls(organization_id, **kwargs)
+            return cls._shared_clients[key]
+
+    @staticmethod
+    def _shared_key(value: Any) -> Any:
+        """unhashable arguments (like a `ClientConfig`) are told apart by identity. The
+        shared client keeps them alive, so their ids can't be reused by other objects.
+        """
+        try:
+            hash(value)
+        except TypeError:
+            return (type(value), id(value))
+        return value
+
     def __init__(  # noqa pylint: disable=too-many-arguments
         self,
         organization_id: str,
@@ -73,6 +150,9 @@ class HyphenClient:
         impersonate_id: Optional[str] = None,
         debug: Optional[bool] = False,
         async_: Optional[bool] = False,
+        background_token_refresh: Optional[bool] = False,
+        token_store: Optional[TokenStore] = None,
+        config: Optional[ClientConfig] = None,
     ) -> str:
 
         self.logger = logger(**{"level": "DEBUG" if debug else None})
@@ -86,27 +166,132 @@ class HyphenClient:
             "client_id": client_id,
             "client_secret": client_secret,
             "impersonate_id": impersonate_id,
+            "token_store": token_store,
+            "config": config,
         }
         if async_:
-            # IMPORTANT: organization must be the first object imported!
-            self.client = AsyncHTTPRequestClient(**client_args)
-            self.organization = AsyncOrganizationFactory(self.client)
-
-            ## dependent factories ##
-            self.member = AsyncMemberFactory(self.client)
-            self.movie_quote = AsyncMovieQuoteFactory(self.client)
-            self.team = AsyncTeamFactory(self.client)
-            self.logger.debug("Async client created.")
-            return
-        # IMPORTANT: organization must be the first object imported!
-        self.client = HTTPRequestClient(**client_args)
-        self.organization = OrganizationFactory(self.client)
+            self.client = AsyncHTTPRequestClient(
+                background_token_refresh=background_token_refresh, **client_args
+            )
+        else:
+            self.client = HTTPRequestClient(**client_args)
+        self.logger.debug("%s client created.", "Async" if async_ else "Sync")
+
+    ### Factories, built on first access ###
+    @cached_property
+    def organization(self) -> "OrganizationFactory":
+        return self._factory(OrganizationFactory, AsyncOrganizationFactory)
+
+    @cached_property
+    def member(self) -> "MemberFactory":
+        return self._factory(MemberFactory, AsyncMemberFactory)
+
+    @cached_property
+    def movie_quote(self) -> "MovieQuoteFactory":
+        return self._factory(MovieQuoteFactory, AsyncMovieQuoteFactory)
+
+    @cached_property
+    def team(self) -> "TeamFactory":
+        return self._factory(TeamFactory, AsyncTeamFactory)
+
+    def _factory(self, sync_class: type, async_class: type):
+        if isinstance(self.client, AsyncHTTPRequestClient):
+            return async_class(self.client)
+        return sync_class(self.client)
+
+    def as_user(self, member_id: str) -> "HyphenClient":
+        """A view of this client that acts on behalf of member `member_id`.
+
+        Views send the impersonation header per request but share this client's connection
+        pool, m2m token, response cache, rate limiter and retry policy, so one client can
+        serve any number of users. They're cheap to create and need no closing; closing
+        the parent closes them all. Role assignments from a view are never batched.
+
+        Example:
+
+            client = HyphenClient(organization_id="my_org_id")
+            teams = client.as_user(member_id).team.list()
+        """
+        return self._view(self.client.impersonating(member_id))
+
+    def for_org(self, organization_id: str) -> "HyphenClient":
+        """A view of this client scoped to another organization.
+
+        Like `as_user` views, org views share this client's connection pool, m2m token,
+        cache and limits, cost next to nothing to create and need no closing. They can be
+        combined, as in `client.for_org(org_id).as_user(member_id)`.
+
+        Example:
 
-        ## dependent factories ##
-        self.member = MemberFactory(self.client)
-        self.movie_quote = MovieQuoteFactory(self.client)
-        self.team = TeamFactory(self.client)
-        self.logger.debug("Client created.")
+            client = HyphenClient(organization_id="my_org_id", client_id=..., client_secret=...)
+            teams = client.for_org("other_org_id").team.list()
+        """
+        return self._view(self.client.view(), organization_id)
+
+    def across_orgs(
+        self,
+        organization_ids: Iterable[str],
+        operation: Callable[["HyphenClient"], Any],
+        concurrency: int = 8,
+    ) -> BulkResult:
+        """Runs `operation` on a `for_org` view of each organization, at most `concurrency`
+        at a time. Results come back in `organization_ids` order, and a failing organization
+        doesn't stop the rest, see `hyphen.bulk.BulkResult`. Await it on an async client,
+        with an async `operation`.
+
+        Example:
+
+            result = await client.across_orgs(org_ids, lambda org: org.team.list())
+            for org_id, teams in zip(org_ids, result):
+                ...
+        """
+        views = [self.for_org(organization_id) for organization_id in organization_ids]
+        if isinstance(self.client, AsyncHTTPRequestClient):
+            return run_bulk_async(operation, views, concurrency)
+        return run_bulk(operation, views, concurrency)
+
+    def batch(self, concurrency: int = 8) -> "Batch":
+        """Queues factory calls to run concurrently on a sync client, see `hyphen.bulk.Batch`.
+        Async clients already run concurrently with `asyncio.gather`.
+        """
+        self._require_sync("batch", "asyncio.gather")
+        return Batch(concurrency)
+
+    def gather(self, *calls: Callable[[], Any], concurrency: int = 8) -> BulkResult:
+        """Runs zero-argument calls concurrently on a sync client, at most `concurrency` at
+        a time, and returns their results in order with per-call errors, see
+        `hyphen.bulk.BulkResult`.
+
+        Example:
+
+            rosters = client.gather(*(team.member.list for team in teams))
+            members = client.gather(*(partial(client.member.read, id) for id in ids))
+        """
+        self._require_sync("gather", "asyncio.gather")
+        batch = Batch(concurrency)
+        for call in calls:
+            batch.add(call)
+        return batch.run()
+
+    def _require_sync(self, method: str, instead: str):
+        if isinstance(self.client, AsyncHTTPRequestClient):
+            raise IncorrectMethodException(
+                f"`{method}` is for sync clients, on an async client use `{instead}`."
+            )
+
+    def _view(
+        self,
+        request_client: "HTTPRequestClient",
+        organization_id: Optional[str] = None,
+    ) -> "HyphenClient":
+        """a HyphenClient around `request_client`, without building a new one"""
+        view = object.__new__(type(self))
+        view.logger = self.logger
+        view.host = self.host
+        view.organization_id = organization_id or self.organization_id
+        view.client = request_client
+        request_client.hyphen_client = view
+        return view
 
     @property
     def debug_profile(self) -> dict:
@@ -127,7 +312,9 @@ class HyphenClient:
                 ]
             )
         )
-        auth_header = self.client.client.headers.get("Authorization", None)
+        auth_header = (
+            self.client._authorization  # noqa pylint: disable=protected-access
+        )
         auth_whole = None if not auth_header else str(auth_header)
         authorization = (
             None
@@ -141,25 +328,21 @@ class HyphenClient:
                 "m2m_credentials": safe_m2m,
                 "headers": {
                     k: v
-                    for k, v in self.client.client.headers.items()
-                    if not k == "authorization"
+                    for k, v in self.client.headers.items()
+                    if k.lower() != "authorization"
                 },
                 "authorization_header": authorization,
             },
             "host": str(self.host),
             "organization_id": self.organization_id,
-            "on_behalf_of": self.client.client.headers.get("x-hyphen-impersonate"),
+            "on_behalf_of": self.client.headers.get(IMPERSONATE_HEADER),
         }
 
     @property
     def authenticated(self) -> bool:
         """Returns true if the client is authenticated, false otherwise"""
-
-        class Quote(BaseModel):
-            quote: str
-
         try:
-            quote = self.client.get("api/quote", Quote)
+            quote = self.client.get("api/quote", MovieQuote)
             return quote.quote is not None
         except AuthenticationException as e:
             self.logger.error(e)
@@ -171,12 +354,8 @@ class HyphenClient:
     @property
     async def async_authenticated(self) -> bool:
         """Returns true if the client is authenticated, false otherwise"""
-
-        class Quote(BaseModel):
-            quote: str
-
         try:
-            quote = await self.client.get("api/quote", Quote)
+            quote = await self.client.get("api/quote", MovieQuote)
             return quote.quote is not None
         except AuthenticationException as e:
             self.logger.error(e)
@@ -189,10 +368,56 @@ class HyphenClient:
         """Returns true if the client is healthy, false otherwise"""
         return self.client.healthcheck()
 
+    @property
+    def retry_stats(self) -> dict:
+        """How many requests this client has retried, and why"""
+        return self.client.retry_stats.as_dict()
+
+    @property
+    def cache_stats(self) -> Optional[dict]:
+        """Hits, misses and size of the response cache, if the client has one"""
+        cache = self.client.config.cache
+        return cache.stats() if cache else None
+
     async def async_healthcheck(self) -> bool:
         """Returns true if the client is healthy, false otherwise"""
         return await self.client.healthcheck()
 
+    def directory(self) -> "OrgDirectory":
+        """Snapshots the organization's members and teams into an indexed `OrgDirectory`.
+        Await it on an async client.
+        """
+        if isinstance(self.client, AsyncHTTPRequestClient):
+            return AsyncOrgDirectory.load(self)
+        return OrgDirectory.load(self)
+
+    def flush(self):
+        """Sends any role assignments held back by `ClientConfig(role_batching=...)`.
+        Await it on an async client.
+        """
+        return self.client.flush()
+
+    def close(self):
+        """Flushes pending role assignments and closes the sync client's connections"""
+        self.client.close()
+
+    async def aclose(self):
+        """Flushes pending role assignments and closes the async client's connections"""
+        await self.client.aclose()
+
+    def __enter__(self) -> "HyphenClient":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    async def __aenter__(self) -> "HyphenClient":
+        """`async with HyphenClient(..., async_=True) as client:` closes it on exit"""
+        return self
+
+    async def __aexit__(self, *_):
+        await self.aclose()
+
     ### Pluralize factory accessors ###
     # because why not make everyone's life easier?
     @property
@@ -213,12 +438,26 @@ class HyphenClient:
 
 
 class HTTPRequestClient:
+    """Sync request client, safe to share between threads.
+    Concurrent threads that find the m2m token expired wait on a single locked refresh,
+    and the token is sent per request rather than stored on the shared `httpx.Client`,
+    so one client (and its connection pool) can serve a whole thread pool.
+    """
+
     host: "httpx.URL"
     hyphen_client: "HyphenClient"
-    client: Optional["httpx.Client"] = None
+    _http_client: Optional["httpx.Client"] = None
     headers: dict = None
     _m2m_credentials: Optional[tuple[str, str]] = None
     _auth_token_expires: Optional[float] = 0.0
+    _authorization: Optional[str] = None
+    _owns_client: bool = True
+    # set on views from `impersonating`, which share this client's pool and token
+    _parent: Optional["HTTPRequestClient"] = None
+    token_lease_ttl: float = 10.0
+    token_poll_interval: float = 0.05
+    _batcher_class = RoleAssignmentBatcher
+    _single_flight_class = SingleFlight
 
     def __init__(  # noqa pylint: disable=too-many-arguments
         self,
@@ -228,20 +467,31 @@ class HTTPRequestClient:
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
         impersonate_id: Optional[str] = None,
-        timeout: Optional[float] = 5.0,
+        token_store: Optional[TokenStore] = None,
+        config: Optional[ClientConfig] = None,
     ):
+        self.token_store = token_store
+        self.config = config or ClientConfig()
+        self.retry_stats = RetryStats()
+        self.role_batcher = (
+            self._batcher_class(self, self.config.role_batching)
+            if self.config.role_batching is not None
+            else None
+        )
+        self.single_flight = (
+            self._single_flight_class() if self.config.coalesce_gets else None
+        )
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
         self.hyphen_client = hyphen_client
         self.logger = self.hyphen_client.logger
-        if settings.hyphen_client_id and settings.hyphen_client_secret:
+        self._refresh_lock = Lock()
+        env_credentials = env_m2m_credentials()
+        if env_credentials:
             self.logger.debug("Using ENV settings for m2m authentication")
-            self._m2m_credentials = (  # noqa pylint: disable=protected-access
-                settings.hyphen_client_id,
-                settings.hyphen_client_secret,
-            )
+            self._m2m_credentials = env_credentials
         elif client_id and client_secret:
             self.logger.debug("Using user provided creds for m2m authentication")
             self._m2m_credentials = (
@@ -258,76 +508,349 @@ class HTTPRequestClient:
 
         if impersonate_id:
             self.logger.debug("Impersonating user %s", impersonate_id)
-            self.headers["x-hyphen-impersonate"] = impersonate_id
-        self._set_client(host, timeout)
+            self.headers[IMPERSONATE_HEADER] = impersonate_id
+        self.host = httpx.URL(str(host))
+        # the pool is built on the first request, see `client`
+        self._owns_client = self.config.http_client is None
+        self._client_lock = Lock()
+
+    def view(self) -> "HTTPRequestClient":
+        """A copy of this client to hand to another `HyphenClient` view.
+        It shares the pool, token, config (cache, limits, retries), retry stats and role
+        batcher, and closing it leaves them all open.
+        """
+        view = copy(self)
+        view._parent = self._parent or self  # noqa pylint: disable=protected-access
+        return view
+
+    def impersonating(self, member_id: str) -> "HTTPRequestClient":
+        """A view of this client that acts on behalf of `member_id`"""
+        view = self.view()
+        view.headers = {**self.headers, IMPERSONATE_HEADER: member_id}
+        # a batch is sent with one set of headers, so views send assignments directly
+        view.role_batcher = None
+        return view
 
     def auth_expired(self) -> bool:
         """is the current auth token expired? One minute buffer."""
+        if self._parent is not None:
+            return self._parent.auth_expired()
         # can't be expired if youre not using m2m
-        return self._m2m_credentials and (
-            self._auth_token_expires
-            < (datetime.now().timestamp() + 60)  # noqa pylint: disable=protected-access
-        )
+        return self._m2m_credentials and self._expiring(self._auth_token_expires)
+
+    @staticmethod
+    def _expiring(expires_at: float, within: float = 60) -> bool:
+        return expires_at < (datetime.now().timestamp() + within)
+
+    def _ensure_auth(self):
+        """refreshes the m2m token if it is expired, one thread at a time"""
+        if self._parent is not None:
+            self._parent._ensure_auth()  # noqa pylint: disable=protected-access
+            return
+        if not self.auth_expired():
+            return
+        with self._refresh_lock:
+            # another thread may have refreshed while we waited on the lock
+            if self.auth_expired():
+                self._refresh_m2m_token()
 
     def _refresh_m2m_token(self):
-        """refreshes a token if it is expired"""
+        """swaps in a new token, from the token store if it has a fresh one"""
+        if self.token_store is None:
+            self._adopt_token(self._fetch_m2m_token())
+            return
+        key = self._m2m_credentials[0]
+        while not self._adopt_stored_token(key):
+            # only the lease holder calls the engine, everyone else waits for its token
+            if self.token_store.acquire_lease(key, self.token_lease_ttl):
+                try:
+                    # the last lease holder may have stored a token since we looked
+                    if self._adopt_stored_token(key):
+                        return
+                    token = self._fetch_m2m_token()
+                    self.token_store.set(key, token)
+                finally:
+                    self.token_store.release_lease(key)
+                self._adopt_token(token)
+                return
+            sleep(self.token_poll_interval)
+
+    def _fetch_m2m_token(self) -> "CachedToken":
         self.logger.debug("Refreshing m2m token...")
         client_id, client_secret = self._m2m_credentials
-        try:
-            del self.client.headers["Authorization"]
-        except KeyError:
-            pass
         response = self.client.post(
-            "/api/auth/m2m",
+            self._url("/api/auth/m2m"),
+            headers=self.headers,
             json={
                 "clientId": client_id,
                 "clientSecret": client_secret,
             },
         )
+        return self._token_from_response(response)
+
+    def _token_from_response(self, response: "httpx.Response") -> "CachedToken":
         if response.status_code != 200:
             self.logger.error("Unable to refresh auth token: %s", response.text)
             raise AuthenticationException(response.text)
         auth = Auth.model_validate_json(response.text)
-        self._auth_token_expires = auth.expires_at.timestamp()
-        self.client.headers["Authorization"] = f"Bearer {auth.access_token}"
         self.logger.debug("M2M token refreshed")
+        return CachedToken(
+            authorization=f"Bearer {auth.access_token}",
+            expires_at=auth.expires_at.timestamp(),
+        )
+
+    def _adopt_stored_token(self, key: str, fresh_for: float = 60) -> bool:
+        """adopts the stored token if it won't expire in the next `fresh_for` seconds"""
+        return self._adopt_if_fresh(self.token_store.get(key), fresh_for)
+
+    def _adopt_if_fresh(self, token: Optional["CachedToken"], fresh_for: float) -> bool:
+        if token is None or self._expiring(token.expires_at, fresh_for):
+            return False
+        self.logger.debug("Using m2m token from the token store")
+        self._adopt_token(token)
+        return True
 
-    def _set_client(self, host: AnyHttpUrl, timeout: int):
+    def _adopt_token(self, token: "CachedToken"):
+        # token first, then expiry: anyone who sees the new expiry also sees the new token
+        self._authorization = token.authorization
+        self._auth_token_expires = token.expires_at
+
+    def _auth_headers(self) -> dict:
+        """the per-request auth header for the current token, if there is one"""
+        if self._parent is not None:
+            return self._parent._auth_headers()  # noqa pylint: disable=protected-access
+        if not self._authorization:
+            return {}
+        return {"Authorization": self._authorization}
+
+    def _request_headers(self) -> dict:
+        # sent per request so a shared or injected http client is never mutated
+        return {**self.headers, **self._auth_headers()}
+
+    def _url(self, path: str) -> str:
+        """paths are relative to our own client's base url, an injected client has none"""
+        if self._owns_client:
+            return path
+        return str(self.host.join(path))
+
+    @property
+    def client(self) -> "httpx.Client":
+        """The pooled http client, built on first use so creating a client stays cheap"""
+        if self._parent is not None:
+            return self._parent.client
+        if self._http_client is None:
+            with self._client_lock:
+                if self._http_client is None:
+                    self._http_client = self._build_client()
+        return self._http_client
+
+    def _build_client(self) -> "httpx.Client":
         """allows for opaque connection pooling"""
+        if self.config.http_client is not None:
+            self.logger.debug("using the provided http client for host %s", self.host)
+            return self.config.http_client
         self.logger.debug(
-            "attaching sync client with host %s and timeout %s and headers set %s",
-            host,
-            timeout,
+            "attaching sync client with host %s and config %s and headers set %s",
+            self.host,
+            self.config,
             str(self.headers.keys()),
         )
-        self.client = httpx.Client(
-            base_url=str(host), headers=self.headers, timeout=timeout
+        return httpx.Client(
+            base_url=str(self.host),
+            headers=self.headers,
+            **self.config.client_kwargs(),
         )
 
+    def _closable_client(self) -> Optional["httpx.Client"]:
+        """the pool this client should close, if it has built one of its own"""
+        if self._parent is not None or not self._owns_client:
+            return None
+        return self._http_client
+
+    def flush(self):
+        """sends any pending batched role assignments"""
+        if self.role_batcher is not None:
+            self.role_batcher.flush()
+
+    def close(self):
+        self.flush()
+        client = self._closable_client()
+        if client is not None:
+            client.close()
+
+    def __enter__(self) -> "HTTPRequestClient":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
     def __del__(self):
-        if self.client:
-            self.client.close()
+        client = self._closable_client()
+        if client is not None:
+            client.close()
+
+    def _request(
+        self, method: str, path: str, headers: Optional[dict] = None, **kwargs
+    ) -> "httpx.Response":
+        """sends one authenticated request through the shared connection pool,
+        retrying transient failures per the retry policy
+        """
+        attempt, started = 0, monotonic()
+        while True:
+            self._ensure_auth()
+            if self.config.rate_limiter:
+                self.config.rate_limiter.acquire(path)
+            try:
+                response = self.client.request(
+                    method,
+                    self._url(path),
+                    headers={**self._request_headers(), **(headers or {})},
+                    **kwargs,
+                )
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, path, attempt, started, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, path, attempt, started, response)
+                if delay is None:
+                    self._invalidate(method, path)
+                    return response
+            sleep(delay)
+            attempt += 1
+
+    def _invalidate(self, method: str, path: str):
+        """writes drop whatever cached (or in-flight) reads they may have changed"""
+        if method in ("GET", "HEAD", "OPTIONS"):
+            return
+        if self.config.cache is not None:
+            self.config.cache.invalidate(path)
+        if self.single_flight is not None:
+            self.single_flight.forget(path)
+
+    def _retry_delay(  # noqa pylint: disable=too-many-arguments
+        self,
+        method: str,
+        path: str,
+        attempt: int,
+        started: float,
+        response: Optional["httpx.Response"] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """how long to wait before retrying, or None to hand back the result as-is"""
+        retry = self.config.retry
+        if retry is None or not retry.retryable(method, response, error):
+            return None
+        delay = retry.delay(attempt, monotonic() - started, response)
+        if delay is None:
+            self.retry_stats.record_exhausted()
+            return None
+        reason = error.__class__.__name__ if error else str(response.status_code)
+        self.retry_stats.record_retry(reason)
+        self.logger.warning(
+            "%s %s failed (%s), retrying in %.2fs", method, path, reason, delay
+        )
+        return delay
 
     def healthcheck(self) -> bool:
-        if self.auth_expired():
-            self._refresh_m2m_token()
-        return self.client.get("/healthcheck").status_code == 200
+        return self._request("GET", "/healthcheck").status_code == 200
 
-    def get(self, path: str, model: "RESTModel"):
+    def get(
+        self,
+        path: str,
+        model: "RESTModel",
+        params: Optional[dict] = None,
+        trusted: Optional[bool] = None,
+    ):
         self.logger.debug("GET %s", path)
-        if self.auth_expired():
-            self._refresh_m2m_token()
-        response = self.client.get(path)
-        handled = self._handle_response(response, path=path, model=model)
+        trusted = self._trusted(trusted)
+        key = self._cache_key(path, model, params, trusted)
+        if self.single_flight is None:
+            return self._get(path, model, params, trusted, key)
+        return self.single_flight.do(
+            key, path, lambda: self._get(path, model, params, trusted, key)
+        )
+
+    def _get(  # noqa pylint: disable=too-many-arguments
+        self,
+        path: str,
+        model: "RESTModel",
+        params: Optional[dict],
+        trusted: bool,
+        key: tuple,
+    ):
+        cached = self._cached(key)
+        if cached is not MISSING:
+            self.logger.debug("GET served from cache")
+            return cached
+        with self._fetching(path) as fetch:
+            conditional = self._conditional_headers(key)
+            response = self._request("GET", path, params=params, headers=conditional)
+            if response.status_code == 304 and conditional:
+                revalidated = self._revalidated(key)
+                if revalidated is not MISSING:
+                    self.logger.debug("GET revalidated cached response")
+                    return revalidated
+                # evicted while we asked, so fetch it in full
+                response = self._request("GET", path, params=params)
+            handled = self._handle_response(
+                response, path=path, model=model, trusted=trusted
+            )
+            self._cache(key, path, handled, response, fetch)
         self.logger.debug("GET response complete: %s", handled)
         return handled
 
+    def _cache_key(
+        self, path: str, model: "RESTModel", params: Optional[dict], trusted: bool
+    ):
+        # impersonated requests may see different data, so they're cached apart
+        impersonating = self.headers.get(IMPERSONATE_HEADER)
+        params = tuple(sorted((params or {}).items()))
+        return (impersonating, path, params, model, trusted)
+
+    def _cached(self, key: tuple):
+        if self.config.cache is None:
+            return MISSING
+        return self.config.cache.get(key)
+
+    def _fetching(self, path: str):
+        """tracks the GET in the cache, so a write landing while it's in flight keeps
+        its (possibly outdated) result out
+        """
+        if self.config.cache is None:
+            return nullcontext()
+        return self.config.cache.fetching(path)
+
+    def _cache(  # noqa pylint: disable=too-many-arguments
+        self,
+        key: tuple,
+        path: str,
+        value,
+        response: "httpx.Response",
+        fetch: Optional["Fetch"] = None,
+    ):
+        if self.config.cache is not None:
+            self.config.cache.set(
+                key,
+                path,
+                value,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                fetch=fetch,
+            )
+
+    def _conditional_headers(self, key: tuple) -> dict:
+        if self.config.cache is None:
+            return {}
+        return self.config.cache.conditional_headers(key)
+
+    def _revalidated(self, key: tuple):
+        return self.config.cache.revalidate(key)
+
     def post(self, path: str, model: "BaseModel", instance: "RESTModel"):
         self.logger.debug("POST %s", path)
-        if self.auth_expired():
-            self._refresh_m2m_token()
-        instance_json = instance.model_dump_json(exclude_unset=True, by_alias=True)
-        response = self.client.post(path, data=instance_json)
+        instance_json = self._dump(instance, exclude_unset=True, by_alias=True)
+        response = self._request("POST", path, content=instance_json)
         handled = self._handle_response(response, path, model, instance)
         self.logger.debug("POST response complete: %s", handled)
         return handled
@@ -339,10 +862,8 @@ class HTTPRequestClient:
         instance: Optional["RESTModel"] = None,
     ):
         self.logger.debug("PUT %s", path)
-        instance_json = instance.model_dump_json(exclude_unset=True, by_alias=True)
-        if self.auth_expired():
-            self._refresh_m2m_token()
-        response = self.client.put(path, data=instance_json)
+        instance_json = self._dump(instance, exclude_unset=True, by_alias=True)
+        response = self._request("PUT", path, content=instance_json)
         handled = self._handle_response(
             response, path=path, model=model, instance=instance
         )
@@ -351,12 +872,10 @@ class HTTPRequestClient:
 
     def patch(self, path: str, model: "BaseModel", instance: "RESTModel"):
         self.logger.debug("PATCH %s", path)
-        instance_json = instance.model_dump_json(
-            exclude_unset=True, by_alias=True, exclude=("id",)
+        instance_json = self._dump(
+            instance, exclude_unset=True, by_alias=True, exclude=("id",)
         )
-        if self.auth_expired():
-            self._refresh_m2m_token()
-        response = self.client.patch(path, data=instance_json)
+        response = self._request("PATCH", path, content=instance_json)
         handled = self._handle_response(
             response, path=path, model=model, instance=instance
         )
@@ -365,26 +884,25 @@ class HTTPRequestClient:
 
     def delete(self, path: str, instance: Optional["RESTModel"] = None):
         self.logger.debug("DELETE %s", path)
-        if self.auth_expired():
-            self._refresh_m2m_token()
         delete_args = {}
         if instance:
-            delete_args["data"] = instance.model_dump_json(
-                exclude_unset=True, by_alias=True
+            delete_args["content"] = self._dump(
+                instance, exclude_unset=True, by_alias=True
             )
-        response = self.client.request(
+        response = self._request(
             "DELETE", path, **delete_args
-        )  # required to pass a body to delete in httpx
+        )  # request() is required to pass a body to delete in httpx
         handled = self._handle_response(response, path=path)
         self.logger.debug("DELETE response complete: %s", handled)
         return handled
 
-    def _handle_response(
+    def _handle_response(  # noqa pylint: disable=too-many-arguments
         self,
         response: "httpx.Response",
         path: Optional[str] = None,
         model: Optional["RESTModel"] = None,
         instance: Optional["RESTModel"] = None,
+        trusted: bool = False,
     ):
         if response.status_code in (
             401,
@@ -401,23 +919,28 @@ class HTTPRequestClient:
             )
             raise HyphenApiException(response.status_code, response.text)
         self.logger.debug("generating response model...")
-        if not all(
-            (
-                response.text,
-                model,
-            )
-        ):
+        if not (response.content and model):
             self.logger.debug("No response body or model to validate, returning None")
             return None
-        self.logger.debug("Parsing api response json...")
         try:
-            response_values = response.json()
+            self.logger.debug("parsing response into %s instance...", model.__name__)
+            parsed = self._parse(model, response.content, trusted)
+            self.logger.debug("Parsed model %s returned", parsed)
+            return parsed
         except JSONDecodeError as e:
             self.logger.error(
                 "Unexpected response body from Hyphen.ai that could not be decoded as valid json: %s",
                 response.text,
             )
             raise e
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                self._raise_json_error(response)
+            self.logger.error(
+                "Unable to parse: unexpected response body from Hyphen.ai: %s",
+                response.text,
+            )
+            raise e
         except Exception as e:
             self.logger.error(
                 "Another, unknown error occurred while parsing response body from Hyphen.ai: %s, %s",
@@ -425,68 +948,246 @@ class HTTPRequestClient:
                 e,
             )
             raise e
+
+    @staticmethod
+    def _dump(instance: "RESTModel", **kwargs) -> str:
+        """serializes a request body, including records built by trusted decoding"""
+        return encode(instance).model_dump_json(**kwargs)
+
+    def _trusted(self, trusted: Optional[bool]) -> bool:
+        """a per-call choice of trusted decoding, falling back on the client's"""
+        return self.config.trusted_decoding if trusted is None else trusted
+
+    @staticmethod
+    def _parse(model: "RESTModel", content: bytes, trusted: bool = False):
+        """validates the raw response bytes, never decoding them to text"""
+        if trusted:
+            return decode(model, json.loads(content))
+        if VALIDATE_JSON:
+            # one pass, with no dicts in between
+            return model.model_validate_json(content)
+        return model.model_validate(json.loads(content))
+
+    def _raise_json_error(self, response: "httpx.Response"):
+        """re-decodes an invalid body with the json module, for its JSONDecodeError"""
         try:
-            self.logger.debug("parsing response into %s instance...", model.__name__)
-            parsed = model.model_validate(response_values)
-            self.logger.debug("Parsed model %s returned", parsed)
-            return parsed
-        except ValidationError as e:
+            response.json()
+        except JSONDecodeError as e:
             self.logger.error(
-                "Unable to parse: unexpected response body from Hyphen.ai: %s",
-                response_values,
+                "Unexpected response body from Hyphen.ai that could not be decoded as valid json: %s",
+                response.text,
             )
             raise e
 
 
 class AsyncHTTPRequestClient(HTTPRequestClient):
-    client: Optional["httpx.AsyncClient"] = None
+    """Async request client.
+    The m2m token is refreshed single-flight: concurrent requests that find it expired
+    all wait on one shared refresh task instead of a lock.
+    """
 
-    def _set_client(self, host: AnyHttpUrl, timeout: int):
+    _http_client: Optional["httpx.AsyncClient"] = None
+    refresh_ahead: float = 300.0
+    # short-lived tokens are refreshed this fraction of their remaining life early at most,
+    # and background refreshes never run closer together than `min_refresh_interval`
+    refresh_ahead_fraction: float = 0.5
+    min_refresh_interval: float = 10.0
+    _refresh_task: Optional["asyncio.Task"] = None
+    _background_refresh_task: Optional["asyncio.Task"] = None
+    _batcher_class = AsyncRoleAssignmentBatcher
+    _single_flight_class = AsyncSingleFlight
+
+    def __init__(self, *args, background_token_refresh: bool = False, **kwargs):
+        self._background_token_refresh = background_token_refresh
+        super().__init__(*args, **kwargs)
+
+    def _build_client(self) -> "httpx.AsyncClient":
         """allows for opaque connection pooling"""
-        self.client = httpx.AsyncClient(
-            base_url=host, headers=self.headers, timeout=timeout
+        if self.config.http_client is not None:
+            return self.config.http_client
+        return httpx.AsyncClient(
+            base_url=str(self.host),
+            headers=self.headers,
+            **self.config.client_kwargs(),
         )
 
-    async def _refresh_m2m_token(self):
-        """refreshes a token if it is expired"""
+    async def _request(
+        self, method: str, path: str, headers: Optional[dict] = None, **kwargs
+    ) -> "httpx.Response":
+        """sends one authenticated request through the shared connection pool,
+        retrying transient failures per the retry policy
+        """
+        attempt, started = 0, monotonic()
+        while True:
+            await self._ensure_auth()
+            if self.config.rate_limiter:
+                await self.config.rate_limiter.acquire_async(path)
+            try:
+                response = await self.client.request(
+                    method,
+                    self._url(path),
+                    headers={**self._request_headers(), **(headers or {})},
+                    **kwargs,
+                )
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, path, attempt, started, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, path, attempt, started, response)
+                if delay is None:
+                    self._invalidate(method, path)
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _ensure_auth(self):
+        """refreshes the m2m token if it is expired, sharing one refresh between all callers"""
+        if self._parent is not None:
+            await self._parent._ensure_auth()  # noqa pylint: disable=protected-access
+            return
+        if self.auth_expired():
+            await self._shared_refresh()
+        # started once there's a token, so its first sleep is timed off a real expiry
+        if self._background_token_refresh and self._m2m_credentials:
+            self._start_background_refresh()
+
+    async def _shared_refresh(self, fresh_for: float = 60):
+        """joins the in-flight refresh, or starts one"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(
+                self._refresh_m2m_token(fresh_for)
+            )
+        # shielded so a cancelled caller doesn't cancel the refresh everyone else awaits
+        await asyncio.shield(self._refresh_task)
+
+    def _start_background_refresh(self):
+        task = self._background_refresh_task
+        if task is None or task.done():
+            self._background_refresh_task = asyncio.ensure_future(
+                self._refresh_in_background()
+            )
+
+    def _refresh_window(self) -> float:
+        """how many seconds before expiry the background refresh replaces the token"""
+        expires_in = self._auth_token_expires - datetime.now().timestamp()
+        return max(min(self.refresh_ahead, expires_in * self.refresh_ahead_fraction), 0)
+
+    async def _refresh_in_background(self):
+        """keeps the token fresh, refreshing it `_refresh_window()` seconds before it expires"""
+        while True:
+            expires_in = self._auth_token_expires - datetime.now().timestamp()
+            window = self._refresh_window()
+            await asyncio.sleep(max(expires_in - window, self.min_refresh_interval))
+            try:
+                # a stored token inside the window is the one we're replacing, so only a
+                # token that outlives it by `min_refresh_interval` will do
+                await self._shared_refresh(window + self.min_refresh_interval)
+            except Exception as e:  # noqa pylint: disable=broad-except
+                # requests still refresh on expiry themselves, so just back off and retry
+                self.logger.error("Background m2m token refresh failed: %s", e)
+                await asyncio.sleep(min(self.refresh_ahead, 30))
+
+    async def _refresh_m2m_token(self, fresh_for: float = 60):
+        """swaps in a new token, from the token store if it has one that won't expire
+        in the next `fresh_for` seconds
+        """
+        if self.token_store is None:
+            self._adopt_token(await self._fetch_m2m_token())
+            return
+        key = self._m2m_credentials[0]
+        store = self.token_store
+        while not await self._adopt_stored_token(key, fresh_for):
+            # only the lease holder calls the engine, everyone else waits for its token
+            if await self._in_thread(store.acquire_lease, key, self.token_lease_ttl):
+                try:
+                    # the last lease holder may have stored a token since we looked
+                    if await self._adopt_stored_token(key, fresh_for):
+                        return
+                    token = await self._fetch_m2m_token()
+                    await self._in_thread(store.set, key, token)
+                finally:
+                    await self._in_thread(store.release_lease, key)
+                self._adopt_token(token)
+                return
+            await asyncio.sleep(self.token_poll_interval)
+
+    async def _adopt_stored_token(self, key: str, fresh_for: float = 60) -> bool:
+        token = await self._in_thread(self.token_store.get, key)
+        return self._adopt_if_fresh(token, fresh_for)
+
+    @staticmethod
+    async def _in_thread(function: Callable, *args) -> Any:
+        """runs a blocking token store call off the event loop, a SQLite one may wait
+        on another process's lock for seconds
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    async def _fetch_m2m_token(self) -> "CachedToken":
         self.logger.debug("Refreshing m2m token...")
         client_id, client_secret = self._m2m_credentials
-        try:
-            del self.client.headers["Authorization"]
-        except KeyError:
-            pass
         response = await self.client.post(
-            "/api/auth/m2m",
+            self._url("/api/auth/m2m"),
+            headers=self.headers,
             json={
                 "clientId": client_id,
                 "clientSecret": client_secret,
             },
         )
-        if response.status_code != 200:
-            self.logger.error("Unable to refresh auth token: %s", response.text)
-            raise AuthenticationException(response.text)
-        auth = Auth.model_validate_json(response.text)
-        self._auth_token_expires = auth.expires_at.timestamp()
-        self.client.headers["Authorization"] = f"Bearer {auth.access_token}"
-        self.logger.debug("M2M token refreshed")
+        return self._token_from_response(response)
 
     async def healthcheck(self) -> bool:
-        if self.auth_expired():
-            await self._refresh_m2m_token()
-        return await self.client.get("/healthcheck").status_code == 200
+        return (await self._request("GET", "/healthcheck")).status_code == 200
 
-    async def get(self, path: str, model: "RESTModel"):
+    async def get(
+        self,
+        path: str,
+        model: "RESTModel",
+        params: Optional[dict] = None,
+        trusted: Optional[bool] = None,
+    ):
         self.logger.debug("getting GET %s", path)
-        if self.auth_expired():
-            await self._refresh_m2m_token()
-        response = await self.client.get(path)
-        return self._handle_response(response, path=path, model=model)
+        trusted = self._trusted(trusted)
+        key = self._cache_key(path, model, params, trusted)
+        if self.single_flight is None:
+            return await self._get(path, model, params, trusted, key)
+        return await self.single_flight.do(
+            key, path, lambda: self._get(path, model, params, trusted, key)
+        )
+
+    async def _get(  # noqa pylint: disable=too-many-arguments
+        self,
+        path: str,
+        model: "RESTModel",
+        params: Optional[dict],
+        trusted: bool,
+        key: tuple,
+    ):
+        cached = self._cached(key)
+        if cached is not MISSING:
+            self.logger.debug("GET served from cache")
+            return cached
+        with self._fetching(path) as fetch:
+            conditional = self._conditional_headers(key)
+            response = await self._request(
+                "GET", path, params=params, headers=conditional
+            )
+            if response.status_code == 304 and conditional:
+                revalidated = self._revalidated(key)
+                if revalidated is not MISSING:
+                    self.logger.debug("GET revalidated cached response")
+                    return revalidated
+                # evicted while we asked, so fetch it in full
+                response = await self._request("GET", path, params=params)
+            handled = self._handle_response(
+                response, path=path, model=model, trusted=trusted
+            )
+            self._cache(key, path, handled, response, fetch)
+        return handled
 
     async def post(self, path: str, model: "BaseModel", instance: "RESTModel"):
-        instance_json = instance.model_dump_json(exclude_unset=True, by_alias=True)
-        if self.auth_expired():
-            await self._refresh_m2m_token()
-        response = await self.client.post(path, data=instance_json)
+        instance_json = self._dump(instance, exclude_unset=True, by_alias=True)
+        response = await self._request("POST", path, content=instance_json)
         return self._handle_response(response, path, model, instance)
 
     async def put(
@@ -495,52 +1196,77 @@ class AsyncHTTPRequestClient(HTTPRequestClient):
         model: Optional["BaseModel"] = None,
         instance: Optional["RESTModel"] = None,
     ):
-        instance_json = instance.model_dump_json(exclude_unset=True, by_alias=True)
-        if self.auth_expired():
-            await self._refresh_m2m_token()
-        response = await self.client.put(path, data=instance_json)
+        instance_json = self._dump(instance, exclude_unset=True, by_alias=True)
+        response = await self._request("PUT", path, content=instance_json)
         return self._handle_response(
             response, path=path, model=model, instance=instance
         )
 
     async def delete(self, path: str, instance: Optional["RESTModel"] = None):
         self.logger.debug("DELETE %s", path)
-        if self.auth_expired():
-            await self._refresh_m2m_token()
         delete_args = {}
         if instance:
-            delete_args["data"] = instance.model_dump_json(
-                exclude_unset=True, by_alias=True
+            delete_args["content"] = self._dump(
+                instance, exclude_unset=True, by_alias=True
             )
-        response = await self.client.request(
+        response = await self._request(
             "DELETE", path, **delete_args
-        )  # required to pass a body to delete in httpx
+        )  # request() is required to pass a body to delete in httpx
         handled = self._handle_response(response, path=path)
         self.logger.debug("DELETE response complete: %s", handled)
         return handled
 
     async def patch(self, path: str, model: "BaseModel", instance: "RESTModel"):
         self.logger.debug("PATCH %s", path)
-        instance_json = instance.model_dump_json(
-            exclude_unset=True, by_alias=True, exclude=("id",)
+        instance_json = self._dump(
+            instance, exclude_unset=True, by_alias=True, exclude=("id",)
         )
-        if self.auth_expired():
-            await self._refresh_m2m_token()
-        response = await self.client.patch(path, data=instance_json)
+        response = await self._request("PATCH", path, content=instance_json)
         handled = self._handle_response(
             response, path=path, model=model, instance=instance
         )
         self.logger.debug("PATCH response complete: %s", handled)
         return handled
 
+    async def flush(self):
+        """sends any pending batched role assignments"""
+        if self.role_batcher is not None:
+            await self.role_batcher.flush()
+
+    def close(self):
+        raise IncorrectMethodException(
+            "To close an async client, use `await client.aclose()`."
+        )
+
+    async def aclose(self):
+        """sends pending role assignments, stops the token refresh and closes the pool.
+        Safe to call more than once.
+        """
+        await self.flush()
+        if self._parent is not None:
+            return
+        task, self._background_refresh_task = self._background_refresh_task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        client = self._closable_client()
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> "AsyncHTTPRequestClient":
+        return self
+
+    async def __aexit__(self, *_):
+        await self.aclose()
+
     def __del__(self):
-        """closes the async client safely"""
-        if self.client:
-            try:
-                loop = get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.client.aclose())
-                else:
-                    loop.run_until_complete(self.client.aclose())
-            except Exception:
-                pass
+        """a finalizer can't await, so an unclosed pool is only reported, never closed"""
+        client = self._closable_client()
+        if client is not None and not client.is_closed:
+            warnings.warn(
+                "An async Hyphen client was garbage collected without being closed. "
+                "Use `async with` or `await client.aclose()`.",
+                ResourceWarning,
+                stacklevel=2,
+            )
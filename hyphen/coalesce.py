@@ -0,0 +1,99 @@
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+import asyncio
+
+from hyphen.cache import _normalize, _related
+
+
+class SingleFlight:
+    """Shares one in-flight GET between threads asking for the same thing at once.
+
+    The first caller for a key makes the request, and everyone who asks for that key
+    before it finishes waits for the same parsed result (or exception). Nothing is kept
+    afterwards; that's what `hyphen.cache.ResponseCache` is for.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, Tuple[str, Future]] = {}
+        self._lock = Lock()
+
+    def do(self, key: Hashable, path: str, fetch: Callable[[], Any]) -> Any:
+        """`fetch()`, unless a call for `key` is already in flight, then its result"""
+        with self._lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = (_normalize(path), Future())
+        _, future = flight
+        if not leader:
+            return future.result()
+        try:
+            result = fetch()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._land(key, flight)
+
+    def forget(self, path: str):
+        """Detaches in-flight GETs a write to `path` may have made stale, so later
+        callers send their own request instead of joining them
+        """
+        path = _normalize(path)
+        with self._lock:
+            for key in [
+                key
+                for key, (flight_path, _) in self._in_flight.items()
+                if _related(path, flight_path)
+            ]:
+                del self._in_flight[key]
+
+    def _land(self, key: Hashable, flight: tuple):
+        with self._lock:
+            # `forget` may already have replaced it with a newer flight
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+
+
+class AsyncSingleFlight:
+    """Shares one in-flight GET between tasks asking for the same thing at once.
+
+    The request runs in its own task, so a caller that is cancelled doesn't cancel it
+    for everyone else waiting on it.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, Tuple[str, asyncio.Task]] = {}
+
+    async def do(
+        self, key: Hashable, path: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """`await fetch()`, unless a call for `key` is already in flight, then its result"""
+        flight = self._in_flight.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(fetch())
+            flight = self._in_flight[key] = (_normalize(path), task)
+            task.add_done_callback(lambda _: self._land(key, flight))
+        return await asyncio.shield(flight[1])
+
+    def forget(self, path: str):
+        """Detaches in-flight GETs a write to `path` may have made stale"""
+        path = _normalize(path)
+        for key in [
+            key
+            for key, (flight_path, _) in self._in_flight.items()
+            if _related(path, flight_path)
+        ]:
+            del self._in_flight[key]
+
+    def _land(self, key: Hashable, flight: tuple):
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        task = flight[1]
+        # every waiter may have been cancelled, so mark the exception as seen
+        if not task.cancelled():
+            task.exception()
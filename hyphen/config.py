@@ -0,0 +1,71 @@
+from typing import Optional, Union
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+from hyphen.batching import RoleBatching
+from hyphen.cache import ResponseCache
+from hyphen.rate_limit import RateLimiter
+from hyphen.retry import RetryPolicy
+
+
+class ClientConfig(BaseModel):
+    """Connection settings for the http client behind a `HyphenClient`.
+
+    Example:
+
+        import httpx
+        from hyphen import HyphenClient
+        from hyphen.config import ClientConfig
+
+        config = ClientConfig(
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            http2=True,  # requires `pip install httpx[http2]`
+        )
+        client = HyphenClient(organization_id="my_org_id", config=config, async_=True)
+
+    Args:
+        timeout: seconds, or an `httpx.Timeout` for per-phase (connect/read/write/pool) timeouts
+        limits: connection pool size and keep-alive limits
+        http2: if True, multiplex requests over HTTP/2 connections
+        transport: a custom httpx transport (sync or async to match the client)
+        http_client: an existing `httpx.Client`/`httpx.AsyncClient` to send requests through.
+            It is used as-is (the other settings here are ignored) and is never closed by Hyphen.
+        retry: how transient failures (429s, 502-504s, connection errors) are retried,
+            see `hyphen.retry.RetryPolicy`. None disables retries.
+        rate_limiter: keeps requests under a client-side rate limit, see `hyphen.rate_limit.RateLimiter`.
+            One limiter can be shared by several clients.
+        cache: an opt-in read-through cache for GETs, see `hyphen.cache.ResponseCache`
+        role_batching: opt-in coalescing of `assign_role` calls into fewer PUTs,
+            see `hyphen.batching.RoleBatching`
+        trusted_decoding: if True, members read are built as lightweight records without
+            validation, several times faster for bulk reads. Only for engines you trust,
+            see `hyphen.trusted.decode`. Reads can also opt in per call with `trusted=True`.
+        coalesce_gets: if True, identical GETs made while one is already in flight (same path,
+            params and impersonation) wait for it and share its parsed result instead of
+            sending their own, see `hyphen.coalesce.SingleFlight`. Like cached responses,
+            shared results should be treated as read-only.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    timeout: Union[float, httpx.Timeout] = 5.0
+    limits: httpx.Limits = Field(default_factory=httpx.Limits)
+    http2: bool = False
+    transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None
+    http_client: Optional[Union[httpx.Client, httpx.AsyncClient]] = None
+    retry: Optional[RetryPolicy] = Field(default_factory=RetryPolicy)
+    rate_limiter: Optional[RateLimiter] = None
+    cache: Optional[ResponseCache] = None
+    role_batching: Optional[RoleBatching] = None
+    trusted_decoding: bool = False
+    coalesce_gets: bool = False
+
+    def client_kwargs(self) -> dict:
+        """keyword arguments for building an httpx client from this config"""
+        return {
+            "timeout": self.timeout,
+            "limits": self.limits,
+            "http2": self.http2,
+            "transport": self.transport,
+        }
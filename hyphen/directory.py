@@ -0,0 +1,259 @@
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from hyphen.client import HyphenClient
+    from hyphen.member import Member
+    from hyphen.team import Team
+
+# (name, context, context_id), with None for "any"
+RoleKey = Tuple[str, Optional[str], Optional[str]]
+
+
+class DirectoryChanges:
+    """The member and team ids a `refresh` added, updated or removed"""
+
+    def __init__(self):
+        self.added: List[str] = []
+        self.updated: List[str] = []
+        self.removed: List[str] = []
+
+    def __repr__(self):
+        return (
+            f"<DirectoryChanges: {len(self.added)} added, {len(self.updated)} updated,"
+            f" {len(self.removed)} removed>"
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+def fingerprint(member: Any) -> tuple:
+    """everything the indexes are built from, to tell whether a member changed"""
+    return (
+        member.first_name,
+        member.last_name,
+        tuple((role.name, role.context, role.context_id) for role in member.roles),
+        tuple(
+            (
+                (account.type, account.id, account.team_id)
+                if getattr(account, "type", None) == "slack"
+                else repr(account)
+            )
+            for account in member.connected_accounts
+        ),
+    )
+
+
+def name_key(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+def _name_key(member_print: tuple) -> str:
+    first_name, last_name, _, _ = member_print
+    return name_key(f"{first_name} {last_name}")
+
+
+def _slack_keys(member_print: tuple) -> List[Tuple[str, Optional[str]]]:
+    keys = []
+    for account in member_print[3]:
+        if isinstance(account, tuple):
+            _, slack_id, team_id = account
+            keys += [(slack_id, team_id), (slack_id, None)]
+    return keys
+
+
+def _role_keys(member_print: tuple) -> set:
+    """every (name, context, context_id) prefix `with_role` can be asked for"""
+    keys = set()
+    for name, context, context_id in member_print[2]:
+        keys.add((name, None, None))
+        keys.add((name, context, None))
+        keys.add((name, context, context_id))
+    return keys
+
+
+class OrgDirectory:
+    """An indexed, in-memory snapshot of an organization's members and teams.
+
+    Built from one `member.list()` and one `team.list()`, it answers lookups by member
+    id, Slack identity, name and role from hash indexes instead of a fetch and a scan.
+    `refresh()` fetches a new snapshot and re-indexes only the members and teams that
+    were added, changed or removed.
+
+    Example:
+
+        directory = client.directory()
+        member = directory.by_slack(event["user"], event["team"])
+        admins = directory.with_role("teamAdmin", "team", team.id)
+        changes = directory.refresh()
+    """
+
+    def __init__(
+        self,
+        members: Iterable["Member"] = (),
+        teams: Iterable["Team"] = (),
+        client: Optional["HyphenClient"] = None,
+    ):
+        self.client = client
+        self._members: Dict[str, "Member"] = {}
+        self._fingerprints: Dict[str, tuple] = {}
+        self._slack: Dict[Tuple[str, Optional[str]], "Member"] = {}
+        self._names: Dict[str, Dict[str, "Member"]] = {}
+        self._roles: Dict[RoleKey, Dict[str, "Member"]] = {}
+        self._teams: Dict[str, "Team"] = {}
+        self._team_names: Dict[str, Dict[str, "Team"]] = {}
+        # like the member fingerprints, what each team was indexed under
+        self._team_keys: Dict[str, str] = {}
+        self._lock = Lock()
+        self.apply(members, teams)
+
+    @classmethod
+    def load(cls, client: "HyphenClient") -> "OrgDirectory":
+        """Builds a directory from the organization's current members and teams"""
+        return cls(client.member.list(), client.team.list(), client=client)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, member_id: str) -> bool:
+        return member_id in self._members
+
+    def __repr__(self):
+        return f"<OrgDirectory: {len(self._members)} members, {len(self._teams)} teams>"
+
+    @property
+    def members(self) -> List["Member"]:
+        return list(self._members.values())
+
+    @property
+    def teams(self) -> List["Team"]:
+        return list(self._teams.values())
+
+    def get(self, member_id: str) -> Optional["Member"]:
+        return self._members.get(member_id)
+
+    def by_slack(
+        self, slack_id: str, team_id: Optional[str] = None
+    ) -> Optional["Member"]:
+        """The member with this Slack user id, in Slack workspace `team_id` if given"""
+        return self._slack.get((slack_id, team_id))
+
+    def by_name(self, name: str) -> List["Member"]:
+        """Members whose "first last" name matches, ignoring case and spacing"""
+        return list(self._names.get(name_key(name), {}).values())
+
+    def with_role(
+        self,
+        name: str,
+        context: Optional[str] = None,
+        context_id: Optional[str] = None,
+    ) -> List["Member"]:
+        """Members holding role `name`, optionally narrowed to a context and its id"""
+        return list(self._roles.get((name, context, context_id), {}).values())
+
+    def team(self, team_id: str) -> Optional["Team"]:
+        return self._teams.get(team_id)
+
+    def team_by_name(self, name: str) -> List["Team"]:
+        return list(self._team_names.get(name_key(name), {}).values())
+
+    def refresh(self) -> DirectoryChanges:
+        """Fetches a new snapshot and applies only what changed"""
+        return self.apply(self.client.member.list(), self.client.team.list())
+
+    def apply(
+        self, members: Iterable["Member"], teams: Iterable["Team"]
+    ) -> DirectoryChanges:
+        """Brings the indexes in line with a full snapshot of members and teams"""
+        changes = DirectoryChanges()
+        with self._lock:
+            self._apply_members(members, changes)
+            self._apply_teams(teams, changes)
+        return changes
+
+    def _apply_members(self, members: Iterable["Member"], changes: DirectoryChanges):
+        seen = set()
+        for member in members:
+            seen.add(member.id)
+            member_print = fingerprint(member)
+            current = self._fingerprints.get(member.id)
+            if current == member_print:
+                # unchanged, so the indexed object answers lookups just as well
+                continue
+            if current is not None:
+                self._unindex_member(member.id)
+                changes.updated.append(member.id)
+            else:
+                changes.added.append(member.id)
+            self._index_member(member, member_print)
+        for member_id in [m for m in self._members if m not in seen]:
+            self._unindex_member(member_id)
+            changes.removed.append(member_id)
+
+    def _apply_teams(self, teams: Iterable["Team"], changes: DirectoryChanges):
+        seen = set()
+        for team in teams:
+            seen.add(team.id)
+            key = name_key(team.name)
+            current = self._team_keys.get(team.id)
+            if current == key:
+                continue
+            if current is not None:
+                _discard(self._team_names, current, team.id)
+                changes.updated.append(team.id)
+            else:
+                changes.added.append(team.id)
+            self._teams[team.id] = team
+            self._team_keys[team.id] = key
+            self._team_names.setdefault(key, {})[team.id] = team
+        for team_id in [t for t in self._teams if t not in seen]:
+            del self._teams[team_id]
+            _discard(self._team_names, self._team_keys.pop(team_id), team_id)
+            changes.removed.append(team_id)
+
+    def _index_member(self, member: "Member", member_print: tuple):
+        member_id = member.id
+        self._members[member_id] = member
+        self._fingerprints[member_id] = member_print
+        for key in _slack_keys(member_print):
+            self._slack[key] = member
+        self._names.setdefault(_name_key(member_print), {})[member_id] = member
+        for key in _role_keys(member_print):
+            self._roles.setdefault(key, {})[member_id] = member
+
+    def _unindex_member(self, member_id: str):
+        """drops a member using the fingerprint it was indexed with, so a member
+        changed in place since is still removed from every index it was put in"""
+        member = self._members.pop(member_id)
+        member_print = self._fingerprints.pop(member_id)
+        for key in _slack_keys(member_print):
+            if self._slack.get(key) is member:
+                del self._slack[key]
+        _discard(self._names, _name_key(member_print), member_id)
+        for key in _role_keys(member_print):
+            _discard(self._roles, key, member_id)
+
+
+class AsyncOrgDirectory(OrgDirectory):
+    """`OrgDirectory` for async clients, with awaitable `load` and `refresh`"""
+
+    @classmethod
+    async def load(cls, client: "HyphenClient") -> "AsyncOrgDirectory":
+        """Builds a directory from the organization's current members and teams"""
+        return cls(await client.member.list(), await client.team.list(), client=client)
+
+    async def refresh(self) -> DirectoryChanges:
+        """Fetches a new snapshot and applies only what changed"""
+        return self.apply(
+            await self.client.member.list(), await self.client.team.list()
+        )
+
+
+def _discard(index: Dict[Hashable, Dict[str, Any]], key: Hashable, item_id: str):
+    """drops `item_id` from a multi-valued index, and the key once it's empty"""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(item_id, None)
+        if not bucket:
+            del index[key]
@@ -27,3 +27,15 @@ class AuthenticationException(HyphenException):
         if self.code == 403:
             return f"Authentication required: {self.message}"
         return f"Authentication failed or required: {self.message}"
+
+
+class BulkOperationException(HyphenException):
+    """Raised by `BulkResult.raise_for_errors` when items in a bulk call failed"""
+
+    def __init__(self, errors: dict):
+        self.errors = errors
+
+    def __str__(self):
+        return f"{len(self.errors)} item(s) failed: " + "; ".join(
+            f"[{index}] {error!r}" for index, error in self.errors.items()
+        )
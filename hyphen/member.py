@@ -1,8 +1,13 @@
-from typing import TYPE_CHECKING, Optional, Union, List, Literal
+from copy import copy
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, Union, List
+from typing import Literal
 from pydantic import Field, field_validator
 
+# a module import, since hyphen.member_table imports this module in turn
+from hyphen import member_table
 from hyphen.base_object import RESTModel
-from hyphen.base_factory import BaseFactory, CollectionList
+from hyphen.base_factory import BaseFactory, AsyncBaseFactory, collection_for
+from hyphen.bulk import BulkResult, run_bulk, run_bulk_async
 from hyphen.exceptions import IncorrectMethodException
 from hyphen.roles import Role, LocalizedRole
 
@@ -12,6 +17,7 @@ if TYPE_CHECKING:
     from hyphen.client import HTTPRequestClient, AsyncHTTPRequestClient
     from hyphen.team import Team
     from hyphen.organization import Organization
+    from hyphen.member_table import MemberTable
 
 
 class MemberIdsReference(RESTModel):
@@ -28,6 +34,33 @@ class MemberIdsReference(RESTModel):
         return members
 
 
+def parse_connected_accounts(
+    value: List, build_slack: Callable[[dict], Slack]
+) -> List[Union[Slack, dict]]:
+    """turns the connected accounts we know about into their models"""
+    if not value:
+        return []
+    parsed_accounts = []
+    for account in value:
+        if isinstance(account, Slack):
+            parsed_accounts.append(account)
+            continue
+        if account.get("type", None) == "slack":
+            parsed_accounts.append(build_slack(account))
+            continue
+        parsed_accounts.append(account)
+    return parsed_accounts
+
+
+def copy_member(member: "Member") -> "Member":
+    """A copy of `member` whose roles can be changed without touching the original,
+    which may be shared with other callers through the response cache
+    """
+    member = copy(member)
+    member.roles = [copy(role) for role in member.roles]
+    return member
+
+
 class Member(RESTModel):
     id: Optional[str] = None
     first_name: str
@@ -42,23 +75,13 @@ class Member(RESTModel):
     @field_validator("connected_accounts", mode="before")
     @classmethod
     def parse_connected_accounts(cls, value: List) -> List[Union[Slack, dict]]:
-        if not value:
-            return []
-        parsed_accounts = []
-        for account in value:
-            if isinstance(account, Slack):
-                parsed_accounts.append(account)
-                continue
-            if account.get("type", None) == "slack":
-                parsed_accounts.append(Slack(**account))
-                continue
-            parsed_accounts.append(account)
-        return parsed_accounts
+        return parse_connected_accounts(value, lambda account: Slack(**account))
 
     @property
     def slack(self) -> Optional[Slack]:
         for account in self.connected_accounts:
-            if isinstance(account, Slack):
+            # matches trusted (unvalidated) Slack records too, see `hyphen.trusted`
+            if getattr(account, "type", None) == "slack":
                 return account
         return None
 
@@ -68,6 +91,8 @@ class Member(RESTModel):
 
 class MemberFactory(BaseFactory):
     _object_class = Member
+    # how many members `add_many` sends per PUT
+    add_chunk_size = 100
 
     def __init__(self, client: "HTTPRequestClient"):
         super().__init__(client)
@@ -75,34 +100,39 @@ class MemberFactory(BaseFactory):
             f"api/organizations/{self.client.hyphen_client.organization_id}/members"
         )
 
-    def list(self) -> List[Member]:
-        """List all members available with the provided credentials."""
-        members = super().list()
+    def list(self, trusted: Optional[bool] = None) -> List[Member]:
+        """List all members available with the provided credentials.
+        Pass `trusted=True` to skip validation, see `hyphen.trusted.decode`.
+        """
+        members = super().list(trusted=trusted)
         return [self._scope_member(member) for member in members]
 
-    def add(self, member: Member) -> None:
+    def table(self, page_size: Optional[int] = None) -> "MemberTable":
+        """All members as a compact `MemberTable`, for very large organizations.
+        Pages are decoded without validation and packed into the table as they arrive.
+        """
+        return member_table.MemberTable.from_members(
+            self.iter_list(page_size, trusted=True)
+        )
+
+    def add(self, member: Member) -> Optional[Member]:
         """Add a member to the team"""
-        if self.role_context == "organization":
-            raise IncorrectMethodException(
-                "To add a Member to an Organization, use `client.member.create()`. To add a Member to a Team, use `team.member.add()`."
-            )
+        return self.add_many([member]).get(member.id)
 
-        member.roles = [
-            Role(
-                name="teamMember",
-                context=self.role_context,
-                context_id=self.role_context_id,
+    def add_many(self, members: Iterable[Member]) -> Dict[str, Member]:
+        """Add members to the team, one PUT per `add_chunk_size` members.
+        Returns the added members, freshly scoped, keyed on id. Adding none sends nothing.
+        """
+        members = self._as_team_members(members)
+        if not members:
+            return {}
+        for chunk in self._chunks(members):
+            # put responds with None now
+            _ = self.client.put(
+                self.url_path, instance=MemberIdsReference(members=chunk)
             )
-        ]
-        # put responds with None now
-        _ = self.client.put(
-            self.url_path, instance=MemberIdsReference(members=[member])
-        )
         # the only way to get the full member scoped is via team list at the moment
-        for refreshed_member in self.list():
-            if member.id == refreshed_member.id:
-                return self._scope_member(refreshed_member)
-            return None
+        return self._added(members, self.list())
 
     def remove(self, member: "Member") -> None:
         """Remove a member from the team"""
@@ -121,6 +151,11 @@ class MemberFactory(BaseFactory):
                 "Members must be an iterable of Member objects, you passed a single instance Member."
             ) from e
         members = self._apply_role_to_members(role_name, members)
+        if self.client.role_batcher is not None:
+            # resolves to the scoped members once the batch is sent
+            return self.client.role_batcher.submit(
+                self.url_path, [self._scope_member(member) for member in members]
+            )
 
         # TODO: should verify the response object
         _ = self.client.put(
@@ -131,7 +166,8 @@ class MemberFactory(BaseFactory):
     def revoke_role(self, role: Union[Role, str], member: Member) -> None:
         """Remove a role from a member for either a team or an organization.
         Note: since this is not a bulk operation in the api we can't safely enforce ACID
-        transactions, so this method only supports one call at a time.
+        transactions, so this method only supports one call at a time. Use `revoke_roles`
+        to revoke from many members concurrently.
         """
         if self.role_context == "organization":
             raise NotImplementedError(
@@ -143,6 +179,25 @@ class MemberFactory(BaseFactory):
             f"{self.url_path}/{member.id}/roles", LocalizedRole(roles=[role_name])
         )
 
+    def revoke_roles(
+        self,
+        role_or_roles: Union[Role, str, Iterable[Union[Role, str]]],
+        members: Iterable[Member],
+        concurrency: Optional[int] = None,
+    ) -> BulkResult:
+        """Remove one or more roles from many members, one DELETE per member sent
+        concurrently. Results follow the order of the (deduplicated) members, with any
+        per-member failures in `errors`, see `hyphen.bulk.BulkResult`.
+        """
+        body, members = self._revocation(role_or_roles, members)
+        return run_bulk(
+            lambda member: self.client.delete(
+                f"{self.url_path}/{member.id}/roles", body
+            ),
+            members,
+            concurrency or self.bulk_concurrency,
+        )
+
     @property
     def role_context_id(self) -> str:
         return self.url_path.split("/")[-2]
@@ -151,6 +206,56 @@ class MemberFactory(BaseFactory):
     def role_context(self) -> str:
         return "team" if "team" in self.url_path else "organization"
 
+    def _scope(self, target: "Member") -> "Member":
+        return self._scope_member(target)
+
+    def _as_team_members(self, members: Iterable[Member]) -> List[Member]:
+        """Gives members the team member role, which is how they're added to a team"""
+        if self.role_context == "organization":
+            raise IncorrectMethodException(
+                "To add a Member to an Organization, use `client.member.create()`. To add a Member to a Team, use `team.member.add()`."
+            )
+        members = [copy_member(member) for member in members]
+        for member in members:
+            member.roles = [
+                Role(
+                    name="teamMember",
+                    context=self.role_context,
+                    context_id=self.role_context_id,
+                )
+            ]
+        return members
+
+    def _revocation(
+        self,
+        role_or_roles: Union[Role, str, Iterable[Union[Role, str]]],
+        members: Iterable[Member],
+    ):
+        """the single roles body every member gets, and the members to send it for"""
+        if self.role_context == "organization":
+            raise NotImplementedError(
+                "Revoking roles from an organization is not yet supported."
+            )
+        if isinstance(role_or_roles, (Role, str)):
+            role_or_roles = [role_or_roles]
+        role_names = list(dict.fromkeys(getattr(r, "name", r) for r in role_or_roles))
+        # each member's roles go in one request, however often it was passed
+        members = list({member.id: member for member in members}.values())
+        return LocalizedRole(roles=role_names), members
+
+    def _chunks(self, members: List[Member]) -> Iterable[List[Member]]:
+        for start in range(0, len(members), self.add_chunk_size):
+            yield members[start : start + self.add_chunk_size]
+
+    def _added(self, members: List[Member], roster: List[Member]) -> Dict[str, Member]:
+        """picks the just-added members out of the refreshed roster"""
+        added_ids = {member.id for member in members}
+        return {
+            member.id: self._scope_member(member)
+            for member in roster
+            if member.id in added_ids
+        }
+
     def _scope_member(self, member: "Member") -> List[Role]:
         """Scope roles to the current object"""
         member.roles_context = member.roles_context or self.role_context
@@ -162,17 +267,18 @@ class MemberFactory(BaseFactory):
     def _apply_role_to_members(
         self, role_name: str, members: List[Member]
     ) -> List[Member]:
-        """Apply a role to a member"""
+        """Copies of the members with the role applied"""
         role = Role(
             name=role_name, context=self.role_context, context_id=self.role_context_id
         )
+        members = [copy_member(member) for member in members]
         for member in members:
             if role not in member.roles:
                 member.roles.append(role)
         return members
 
 
-class AsyncMemberFactory(MemberFactory):
+class AsyncMemberFactory(AsyncBaseFactory, MemberFactory):
 
     _object_class = Member
 
@@ -182,38 +288,43 @@ class AsyncMemberFactory(MemberFactory):
             f"api/organizations/{self.client.hyphen_client.organization_id}/members"
         )
 
-    async def list(self) -> List[Member]:
-        """List all members available with the provided credentials."""
+    async def list(self, trusted: Optional[bool] = None) -> List[Member]:
+        """List all members available with the provided credentials.
+        Pass `trusted=True` to skip validation, see `hyphen.trusted.decode`.
+        """
         # since the parent list method does not return directly (which would give us a coroutine to await)
         # we need to redefine it to match async_base_factory here.
-
-        class HyphenCollection(CollectionList):
-            data: List[self._object_class]
-
-        members = await self.client.get(self.url_path, HyphenCollection)
+        members = await self.client.get(
+            self.url_path, collection_for(self._object_class), trusted=trusted
+        )
         return [self._scope_member(member) for member in members]
 
-    async def add(self, member: Union["Member", str]) -> None:
+    async def table(self, page_size: Optional[int] = None) -> "MemberTable":
+        """All members as a compact `MemberTable`, for very large organizations.
+        Pages are decoded without validation and packed into the table as they arrive.
+        """
+        table = member_table.MemberTable()
+        async for member in self.iter_list(page_size, trusted=True):
+            table.append(member)
+        return table
+
+    async def add(self, member: Union["Member", str]) -> Optional[Member]:
         """Add a member to the team"""
-        if self.role_context == "organization":
-            raise IncorrectMethodException(
-                "To add a Member to an Organization, use `client.member.create()`. To add a Member to a Team, use `team.member.add()`."
-            )
+        return (await self.add_many([member])).get(member.id)
 
-        member.roles = [
-            Role(
-                name="teamMember",
-                context=self.role_context,
-                context_id=self.role_context_id,
+    async def add_many(self, members: Iterable[Member]) -> Dict[str, Member]:
+        """Add members to the team, one PUT per `add_chunk_size` members.
+        Returns the added members, freshly scoped, keyed on id. Adding none sends nothing.
+        """
+        members = self._as_team_members(members)
+        if not members:
+            return {}
+        for chunk in self._chunks(members):
+            _ = await self.client.put(
+                self.url_path, instance=MemberIdsReference(members=chunk)
             )
-        ]
-        _ = await self.client.put(
-            self.url_path, instance=MemberIdsReference(members=[member])
-        )
         # the only way to get the full member scoped is via team list at the moment
-        for refreshed_member in await self.list():
-            if member.id == refreshed_member.id:
-                return self._scope_member(refreshed_member)
+        return self._added(members, await self.list())
 
     async def remove(self, member: Union["Member"]) -> None:
         """Remove a member from the team"""
@@ -226,6 +337,10 @@ class AsyncMemberFactory(MemberFactory):
     async def assign_role(self, role_name: str, members: List[Member]) -> None:
         """Assign a role to a member for either a team or an organization."""
         members = self._apply_role_to_members(role_name, members)
+        if self.client.role_batcher is not None:
+            return await self.client.role_batcher.submit(
+                self.url_path, [self._scope_member(member) for member in members]
+            )
 
         # TODO: should verify the response object
         _ = await self.client.put(
@@ -242,3 +357,22 @@ class AsyncMemberFactory(MemberFactory):
         return await self.client.delete(
             f"{self.url_path}/{member.id}/roles", LocalizedRole(roles=[role_name])
         )
+
+    async def revoke_roles(
+        self,
+        role_or_roles: Union[Role, str, Iterable[Union[Role, str]]],
+        members: Iterable[Member],
+        concurrency: Optional[int] = None,
+    ) -> BulkResult:
+        """Remove one or more roles from many members, one DELETE per member sent
+        concurrently. Results follow the order of the (deduplicated) members, with any
+        per-member failures in `errors`, see `hyphen.bulk.BulkResult`.
+        """
+        body, members = self._revocation(role_or_roles, members)
+        return await run_bulk_async(
+            lambda member: self.client.delete(
+                f"{self.url_path}/{member.id}/roles", body
+            ),
+            members,
+            concurrency or self.bulk_concurrency,
+        )
@@ -0,0 +1,190 @@
+from array import array
+from sys import intern
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# a module import, since hyphen.member imports this module in turn
+from hyphen import member as member_model
+from hyphen.roles import Role
+
+if TYPE_CHECKING:
+    from hyphen.member import Member
+
+# (name, context, context_id)
+RoleKey = Tuple[str, Optional[str], Optional[str]]
+
+
+class MemberTable:
+    """A compact, column-per-field table of members, for holding very large organizations.
+
+    Ids and names are kept in columns of interned strings, and roles as small integer
+    codes into a table of the distinct roles seen, so 100k members cost a fraction of
+    100k `Member` objects. A `Member` is only built when a row is read.
+
+    Example:
+
+        table = client.member.table()
+        admins = table.filter(role="teamAdmin", context="team")
+        for member in admins:
+            print(member.first_name, member.slack)
+        rows = admins.to_dicts()
+    """
+
+    def __init__(self, role_keys: Iterable[RoleKey] = ()):
+        """`role_keys` starts the table off with another table's role codes"""
+        self.ids: List[Optional[str]] = []
+        self.first_names: List[str] = []
+        self.last_names: List[str] = []
+        self.roles_contexts: List[Optional[str]] = []
+        # row i's role codes are role_codes[role_offsets[i]:role_offsets[i + 1]]
+        self.role_codes = array("I")
+        self.role_offsets = array("I", [0])
+        self.role_keys: List[RoleKey] = list(role_keys)
+        self._role_index: Dict[RoleKey, int] = {
+            key: code for code, key in enumerate(self.role_keys)
+        }
+        # most members have no connected accounts, so only those who do get an entry
+        self.connected_accounts: Dict[int, list] = {}
+
+    @classmethod
+    def from_members(cls, members: Iterable[Any]) -> "MemberTable":
+        table = cls()
+        table.extend(members)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __repr__(self):
+        return f"<MemberTable: {len(self)} members, {len(self.role_keys)} roles>"
+
+    def __getitem__(self, row: int) -> "Member":
+        """Builds the `Member` for `row`"""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("MemberTable row out of range")
+        return member_model.Member(
+            id=self.ids[row],
+            first_name=self.first_names[row],
+            last_name=self.last_names[row],
+            connected_accounts=self.connected_accounts.get(row, []),
+            roles=[
+                Role(name=name, context=context, context_id=context_id)
+                for name, context, context_id in self.row_roles(row)
+            ],
+            roles_context=self.roles_contexts[row],
+        )
+
+    def __iter__(self) -> Iterator["Member"]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def append(self, member: Any):
+        """Adds a member, or anything with the same attributes, as a new row"""
+        self.ids.append(intern(member.id) if member.id is not None else None)
+        self.first_names.append(intern(member.first_name))
+        self.last_names.append(intern(member.last_name))
+        self.roles_contexts.append(member.roles_context)
+        for role in member.roles:
+            self.role_codes.append(
+                self._role_code((role.name, role.context, role.context_id))
+            )
+        self.role_offsets.append(len(self.role_codes))
+        if member.connected_accounts:
+            self.connected_accounts[len(self.ids) - 1] = [
+                account if isinstance(account, dict) else _account_dict(account)
+                for account in member.connected_accounts
+            ]
+
+    def extend(self, members: Iterable[Any]):
+        for member in members:
+            self.append(member)
+
+    def row_roles(self, row: int) -> List[RoleKey]:
+        """(name, context, context_id) for each of `row`'s roles"""
+        codes = self.role_codes[self.role_offsets[row] : self.role_offsets[row + 1]]
+        return [self.role_keys[code] for code in codes]
+
+    def rows(
+        self,
+        role: Optional[str] = None,
+        context: Optional[str] = None,
+        context_id: Optional[str] = None,
+    ) -> List[int]:
+        """The rows with a role matching every filter given, without building members"""
+        codes = {
+            code
+            for code, (name, role_context, role_context_id) in enumerate(self.role_keys)
+            if (role is None or name == role)
+            and (context is None or role_context == context)
+            and (context_id is None or role_context_id == context_id)
+        }
+        offsets = self.role_offsets
+        return [
+            row
+            for row in range(len(self))
+            if not codes.isdisjoint(self.role_codes[offsets[row] : offsets[row + 1]])
+        ]
+
+    def filter(
+        self,
+        role: Optional[str] = None,
+        context: Optional[str] = None,
+        context_id: Optional[str] = None,
+    ) -> "MemberTable":
+        """A new table of the members with a role matching every filter given"""
+        return self.take(self.rows(role=role, context=context, context_id=context_id))
+
+    def take(self, rows: Iterable[int]) -> "MemberTable":
+        """A new table of just `rows`, in that order"""
+        # same roles, same codes, so each row's codes are copied over as they are
+        table = MemberTable(role_keys=self.role_keys)
+        for row in rows:
+            table.ids.append(self.ids[row])
+            table.first_names.append(self.first_names[row])
+            table.last_names.append(self.last_names[row])
+            table.roles_contexts.append(self.roles_contexts[row])
+            table.role_codes.extend(
+                self.role_codes[self.role_offsets[row] : self.role_offsets[row + 1]]
+            )
+            table.role_offsets.append(len(table.role_codes))
+            if row in self.connected_accounts:
+                table.connected_accounts[len(table.ids) - 1] = self.connected_accounts[
+                    row
+                ]
+        return table
+
+    def to_dicts(self) -> List[dict]:
+        """Exports every row as a plain dict, with roles and connected accounts as dicts"""
+        return [self._row_dict(row) for row in range(len(self))]
+
+    def _row_dict(self, row: int) -> dict:
+        return {
+            "id": self.ids[row],
+            "first_name": self.first_names[row],
+            "last_name": self.last_names[row],
+            "roles": [
+                {"name": name, "context": context, "context_id": context_id}
+                for name, context, context_id in self.row_roles(row)
+            ],
+            "connected_accounts": [
+                dict(account) for account in self.connected_accounts.get(row, [])
+            ],
+        }
+
+    def _role_code(self, key: RoleKey) -> int:
+        try:
+            return self._role_index[key]
+        except KeyError:
+            self.role_keys.append(key)
+            return self._role_index.setdefault(key, len(self.role_keys) - 1)
+
+
+def _account_dict(account: Any) -> dict:
+    """a parsed (Slack) account, back as a dict `Member` can parse again"""
+    return {
+        "type": account.type,
+        "id": account.id,
+        "team_id": intern(account.team_id),
+        "additional_prop_1": account.additional_prop_1,
+    }
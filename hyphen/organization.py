@@ -1,6 +1,6 @@
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 from pydantic import BaseModel
-from hyphen.base_factory import BaseFactory
+from hyphen.base_factory import BaseFactory, AsyncBaseFactory, collection_for
 
 
 if TYPE_CHECKING:
@@ -30,19 +30,11 @@ class OrganizationFactory(BaseFactory):
         super().__init__(client)
         self.url_path = "api/organizations"
 
-    def list(self) -> "Organization":
+    def list(self, trusted: Optional[bool] = None) -> "Organization":
         """List all organizations available with the provided credentials."""
-
-        class OrganizationList(BaseModel):
-            data: List[Organization]
-
-            def __iter__(self):
-                return iter(self.data)
-
-            def __getitem__(self, item):
-                return self.data[item]
-
-        return self.client.get(self.url_path, OrganizationList)
+        return self.client.get(
+            self.url_path, collection_for(Organization), trusted=trusted
+        )
 
     def expunge(self, organization: "Organization") -> None:
         """Delete an organization perminantly and forever"""
@@ -50,24 +42,16 @@ class OrganizationFactory(BaseFactory):
         return self.client.delete(expunge_url)
 
 
-class AsyncOrganizationFactory(OrganizationFactory):
+class AsyncOrganizationFactory(AsyncBaseFactory, OrganizationFactory):
 
     def __init__(self, client: "AsyncHTTPRequestClient"):
         super().__init__(client)
 
-    async def list(self) -> "Organization":
+    async def list(self, trusted: Optional[bool] = None) -> "Organization":
         """List all organizations"""
-
-        class OrganizationList(BaseModel):
-            data: List[Organization]
-
-            def __iter__(self):
-                return iter(self.data)
-
-            def __getitem__(self, item):
-                return self.data[item]
-
-        return await self.client.get(self.url_path, OrganizationList)
+        return await self.client.get(
+            self.url_path, collection_for(Organization), trusted=trusted
+        )
 
     async def expunge(self, organization: "Organization") -> None:
         """Delete an organization perminantly and forever"""
@@ -0,0 +1,101 @@
+from threading import Lock
+from time import monotonic, sleep
+from typing import Callable, Dict, Optional, Tuple
+import asyncio
+import re
+
+import httpx
+
+# object ids, uuids and plain numbers are collapsed to {id} in path templates
+_ID_SEGMENT = re.compile(
+    r"^([0-9a-fA-F]{24}|[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}|\d+)$"
+)
+
+
+def path_template(path: str) -> str:
+    """The endpoint a request path belongs to, e.g. `api/organizations/{id}/members`"""
+    path = httpx.URL(path).path.strip("/")
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+class TokenBucket:
+    """`rate` tokens per second, holding at most `burst`"""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = Lock()
+
+    def reserve(self) -> float:
+        """Takes a token, returning how many seconds to wait before it may be spent.
+        Tokens may be taken on credit, which is what queues up concurrent callers fairly.
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RateLimiter:
+    """A client-side token-bucket rate limiter for requests to the engine.
+
+    Every request takes a token from the overall bucket and, if its path template has
+    one, from that endpoint's bucket too. Sync clients block and async clients await
+    until their tokens are available. Pass the same limiter to several clients (via
+    `ClientConfig(rate_limiter=...)`) to keep all of them under one budget.
+
+    Example:
+
+        limiter = RateLimiter(
+            rate=20,
+            burst=40,
+            endpoints={"api/organizations/{id}/members": (5, 10)},
+        )
+
+    Args:
+        rate: requests per second across all endpoints
+        burst: how many requests may go out at once after a quiet period, defaults to `rate`
+        endpoints: extra (rate, burst) limits keyed on path template, see `path_template`
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        endpoints: Optional[Dict[str, Tuple[float, int]]] = None,
+        clock: Callable[[], float] = monotonic,
+    ):
+        self.bucket = TokenBucket(rate, burst or max(int(rate), 1), clock)
+        self.endpoints = {
+            template.strip("/"): TokenBucket(endpoint_rate, endpoint_burst, clock)
+            for template, (endpoint_rate, endpoint_burst) in (endpoints or {}).items()
+        }
+
+    def reserve(self, path: str) -> float:
+        """Takes the tokens for a request to `path`, returning the seconds to wait first"""
+        wait = self.bucket.reserve()
+        endpoint = self.endpoints.get(path_template(path))
+        if endpoint is not None:
+            wait = max(wait, endpoint.reserve())
+        return wait
+
+    def acquire(self, path: str):
+        """Blocks until a request to `path` may be sent"""
+        wait = self.reserve(path)
+        if wait:
+            sleep(wait)
+
+    async def acquire_async(self, path: str):
+        """Waits, without blocking the event loop, until a request to `path` may be sent"""
+        wait = self.reserve(path)
+        if wait:
+            await asyncio.sleep(wait)
@@ -0,0 +1,103 @@
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import FrozenSet, Optional
+import random
+
+import httpx
+from pydantic import BaseModel
+
+
+class RetryPolicy(BaseModel):
+    """How a client retries requests that failed for transient reasons.
+
+    Delays grow exponentially from `backoff_base` up to `backoff_max` with full jitter,
+    so many clients failing at once don't retry in lockstep. A `Retry-After` header from
+    the engine is honored when it asks for a longer wait. Retrying stops after
+    `max_retries`, or once the next wait would overrun `total_budget` seconds.
+
+    Only idempotent methods are retried by default; add "POST" (or "PATCH") to
+    `methods` to opt in for writes that are safe to repeat.
+    """
+
+    max_retries: int = 3
+    methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    total_budget: float = 60.0
+    respect_retry_after: bool = True
+
+    def retryable(
+        self,
+        method: str,
+        response: Optional["httpx.Response"] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        if method.upper() not in self.methods:
+            return False
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return response is not None and response.status_code in self.statuses
+
+    def delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        response: Optional["httpx.Response"] = None,
+    ) -> Optional[float]:
+        """Seconds to wait before retry number `attempt` (0-based), or None to give up"""
+        if attempt >= self.max_retries:
+            return None
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+        if self.respect_retry_after and response is not None:
+            delay = max(delay, retry_after(response) or 0.0)
+        if elapsed + delay > self.total_budget:
+            return None
+        return delay
+
+
+def retry_after(response: "httpx.Response") -> Optional[float]:
+    """The wait a response asks for in its Retry-After header, in seconds"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryStats:
+    """Counters for how much retrying a client is doing"""
+
+    def __init__(self):
+        self.retries = 0
+        self.exhausted = 0
+        self.reasons: Counter = Counter()
+        self._lock = Lock()
+
+    def record_retry(self, reason: str):
+        with self._lock:
+            self.retries += 1
+            self.reasons[reason] += 1
+
+    def record_exhausted(self):
+        with self._lock:
+            self.exhausted += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "reasons": dict(self.reasons),
+            }
@@ -1,11 +1,47 @@
-from typing import Optional
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+import os
 
+# the environment variables `Settings` reads (pydantic-settings matches them case-insensitively)
+ENV_VARS = ("hyphen_client_id", "hyphen_client_secret")
 
-class Settings(BaseSettings):
-    hyphen_client_id: Optional[str] = None
-    hyphen_client_secret: Optional[str] = None
 
+@lru_cache(maxsize=None)
+def settings_class() -> type:
+    """Builds `Settings` on first use; pydantic-settings is slow to import"""
+    # only needed when credentials come from the environment, so it's imported late
+    from pydantic_settings import (  # pylint: disable=import-outside-toplevel
+        BaseSettings,
+    )
 
-# singleton
-settings = Settings()
+    class Settings(BaseSettings):
+        hyphen_client_id: Optional[str] = None
+        hyphen_client_secret: Optional[str] = None
+
+    return Settings
+
+
+@lru_cache(maxsize=None)
+def get_settings():
+    """The process-wide settings, read from the environment on first use"""
+    return settings_class()()
+
+
+def env_m2m_credentials() -> Optional[Tuple[str, str]]:
+    """m2m credentials from HYPHEN_CLIENT_ID/HYPHEN_CLIENT_SECRET, if both are set"""
+    # most processes set neither, and then there's no need to load pydantic-settings
+    if not any(name.lower() in ENV_VARS for name in os.environ):
+        return None
+    settings = get_settings()
+    if settings.hyphen_client_id and settings.hyphen_client_secret:
+        return settings.hyphen_client_id, settings.hyphen_client_secret
+    return None
+
+
+def __getattr__(name: str) -> Any:
+    # `Settings` and the `settings` singleton used to be built on import
+    if name == "Settings":
+        return settings_class()
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
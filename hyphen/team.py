@@ -1,7 +1,7 @@
-from typing import TYPE_CHECKING, Optional, List
+from typing import TYPE_CHECKING, Optional
 from pydantic import BaseModel
 
-from hyphen.base_factory import BaseFactory, CollectionList
+from hyphen.base_factory import BaseFactory, AsyncBaseFactory, collection_for
 from hyphen.member import MemberFactory, AsyncMemberFactory
 
 if TYPE_CHECKING:
@@ -13,19 +13,26 @@ class Team(BaseModel):
     name: str
 
     _member_factory: Optional["MemberFactory"] = None
+    _team_factory: Optional["TeamFactory"] = None
 
     @property
     def member(self) -> "MemberFactory":
+        """The team's member factory, built on first access"""
+        if self._member_factory is None and self._team_factory is not None:
+            self._member_factory = self._team_factory._member_factory_for(  # noqa pylint: disable=protected-access
+                self
+            )
         return self._member_factory
 
     @property
     def members(self) -> "MemberFactory":
         """allow both forms for a better Developer experience"""
-        return self._member_factory
+        return self.member
 
 
 class TeamFactory(BaseFactory):
     _object_class = Team
+    _member_factory_class = MemberFactory
 
     def __init__(self, client: "HTTPRequestClient"):
         super().__init__(client)
@@ -39,18 +46,18 @@ class TeamFactory(BaseFactory):
         created = self.client.post(self.url_path, Team, instance)
         return self._add_member_factory(created)
 
-    def read(self, id: str) -> "Team":  # noqa pylint: redefined-builtin
+    def read(
+        self, id: str, trusted: Optional[bool] = None
+    ) -> "Team":  # noqa pylint: redefined-builtin
         """Read an existing team"""
-        team = super().read(id)
+        team = super().read(id, trusted=trusted)
         return self._add_member_factory(team)  # noqa pylint: protected-access
 
-    def list(self) -> "Team":
+    def list(self, trusted: Optional[bool] = None) -> "Team":
         """List all teams available with the provided credentials."""
-
-        class HyphenCollection(CollectionList):
-            data: List[Team]
-
-        collection = self.client.get(self.url_path, HyphenCollection)
+        collection = self.client.get(
+            self.url_path, collection_for(Team), trusted=trusted
+        )
         updated_collection = []
         for team in collection:
             updated_collection.append(
@@ -63,41 +70,43 @@ class TeamFactory(BaseFactory):
         team = super().update(target)
         return self._add_member_factory(team)  # noqa pylint: protected-access
 
+    def _scope(self, target: "Team") -> "Team":
+        return self._add_member_factory(target)
+
     def _add_member_factory(self, team: "Team") -> "Team":
-        if self.__class__.__name__ == "AsyncTeamFactory":
-            team._member_factory = AsyncMemberFactory(  # noqa pylint: protected-access
-                self.client
-            )
-        else:
-            team._member_factory = MemberFactory(  # noqa pylint: protected-access
-                self.client
-            )
-        team._member_factory.url_path = (  # noqa pylint: protected-access
-            f"{self.url_path}/{team.id}/members"
-        )
+        """links the team back to this factory; its member factory is built on first use"""
+        team._team_factory = self  # noqa pylint: protected-access
         return team
 
+    def _member_factory_for(self, team: "Team") -> "MemberFactory":
+        member_factory = self._member_factory_class(self.client)
+        member_factory.url_path = f"{self.url_path}/{team.id}/members"
+        return member_factory
+
 
-class AsyncTeamFactory(TeamFactory):
+class AsyncTeamFactory(AsyncBaseFactory, TeamFactory):
+    _member_factory_class = AsyncMemberFactory
 
-    async def create(self, name: str) -> "Team":
+    async def create(  # noqa pylint: disable=arguments-differ
+        self, name: str
+    ) -> "Team":
         """Create a new team"""
         instance = Team(name=name)
         created = await self.client.post(self.url_path, Team, instance)
         return self._add_member_factory(created)
 
-    async def read(self, id: str) -> "Team":  # noqa pylint: redefined-builtin
+    async def read(
+        self, id: str, trusted: Optional[bool] = None
+    ) -> "Team":  # noqa pylint: redefined-builtin
         """Read an existing team"""
-        team = await self.client.get(f"{self.url_path}/{id}", Team)
+        team = await self.client.get(f"{self.url_path}/{id}", Team, trusted=trusted)
         return self._add_member_factory(team)
 
-    async def list(self) -> "Team":
+    async def list(self, trusted: Optional[bool] = None) -> "Team":
         """List all teams available with the provided credentials."""
-
-        class HyphenCollection(CollectionList):
-            data: List[Team]
-
-        collection = await self.client.get(self.url_path, HyphenCollection)
+        collection = await self.client.get(
+            self.url_path, collection_for(Team), trusted=trusted
+        )
         updated_collection = []
         for team in collection:
             updated_collection.append(self._add_member_factory(team))
@@ -105,5 +114,5 @@ class AsyncTeamFactory(TeamFactory):
 
     async def update(self, target: "Team") -> "Team":
         """Update an existing team"""
-        team = super().update(target)
-        return await self._add_member_factory(team)
+        team = await super().update(target)
+        return self._add_member_factory(team)
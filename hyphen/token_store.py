@@ -0,0 +1,161 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+import os
+from pathlib import Path
+import stat
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Union
+import warnings
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+class CachedToken(BaseModel):
+    """An m2m token as kept by a `TokenStore`"""
+
+    authorization: str
+    expires_at: float
+
+
+class TokenStore(ABC):
+    """Where m2m tokens are kept between clients, keyed by client id.
+
+    Besides the tokens themselves, a store hands out short leases on the right to fetch a
+    new token. Whoever holds the lease calls the engine; everyone else waits for the token
+    to show up in the store instead of stampeding `/api/auth/m2m`.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedToken]:
+        """Return the stored token for `key`, if there is one"""
+
+    @abstractmethod
+    def set(self, key: str, token: CachedToken) -> None:
+        """Store a new token for `key`"""
+
+    @abstractmethod
+    def acquire_lease(self, key: str, ttl: float) -> bool:
+        """Claim the right to fetch a token for `key` for `ttl` seconds.
+        Returns False if someone else holds an unexpired lease.
+        """
+
+    @abstractmethod
+    def release_lease(self, key: str) -> None:
+        """Give up a lease taken with `acquire_lease`"""
+
+
+class MemoryTokenStore(TokenStore):
+    """Shares tokens between clients within one process"""
+
+    def __init__(self):
+        self._tokens: Dict[str, CachedToken] = {}
+        self._leases: Dict[str, float] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[CachedToken]:
+        return self._tokens.get(key)
+
+    def set(self, key: str, token: CachedToken) -> None:
+        self._tokens[key] = token
+
+    def acquire_lease(self, key: str, ttl: float) -> bool:
+        now = datetime.now().timestamp()
+        with self._lock:
+            if self._leases.get(key, 0.0) > now:
+                return False
+            self._leases[key] = now + ttl
+            return True
+
+    def release_lease(self, key: str) -> None:
+        with self._lock:
+            self._leases.pop(key, None)
+
+
+class SQLiteTokenStore(TokenStore):
+    """Shares tokens between processes on one host through a sqlite file.
+    Sqlite's own locking keeps lease handout atomic across processes.
+
+    The file holds live bearer tokens in plaintext. It is created readable by its owner
+    only, and opening an existing file that others can read warns.
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 10.0):
+        self.path = str(path)
+        self.timeout = timeout
+        self._secure_file()
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tokens "
+                "(key TEXT PRIMARY KEY, authorization TEXT, expires_at REAL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, until REAL)"
+            )
+
+    def _secure_file(self):
+        """creates the database owner-only, or warns if an existing one is shared"""
+        try:
+            # an empty file is a valid database, and sqlite gives its journal the same mode
+            os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+        except FileExistsError:
+            mode = os.stat(self.path).st_mode
+            if mode & (stat.S_IRWXG | stat.S_IRWXO):
+                warnings.warn(
+                    f"Token store {self.path} holds bearer tokens but is accessible to "
+                    f"other users (mode {stat.filemode(mode)}), consider `chmod 600`.",
+                    stacklevel=3,
+                )
+
+    @contextmanager
+    def _connect(self) -> Iterator["sqlite3.Connection"]:
+        # imported here so clients that never use a SQLite store don't pay for it
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        # a connection per call keeps the store safe to use from any thread
+        connection = sqlite3.connect(
+            self.path, timeout=self.timeout, isolation_level=None
+        )
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def get(self, key: str) -> Optional[CachedToken]:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT authorization, expires_at FROM tokens WHERE key = ?", (key,)
+            ).fetchone()
+        if not row:
+            return None
+        return CachedToken(authorization=row[0], expires_at=row[1])
+
+    def set(self, key: str, token: CachedToken) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?)",
+                (key, token.authorization, token.expires_at),
+            )
+
+    def acquire_lease(self, key: str, ttl: float) -> bool:
+        now = datetime.now().timestamp()
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT until FROM leases WHERE key = ?", (key,)
+            ).fetchone()
+            if row and row[0] > now:
+                connection.execute("ROLLBACK")
+                return False
+            connection.execute(
+                "INSERT OR REPLACE INTO leases VALUES (?, ?)", (key, now + ttl)
+            )
+            connection.execute("COMMIT")
+            return True
+
+    def release_lease(self, key: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM leases WHERE key = ?", (key,))
@@ -0,0 +1,175 @@
+from typing import Any, Callable, Dict, Optional, Union, get_args
+
+from hyphen.base_factory import CollectionList
+from hyphen.connected_accounts.slack import Slack
+from hyphen.member import Member, parse_connected_accounts
+from hyphen.roles import Role
+
+
+class TrustedRole:
+    """A `Role` built without validation, see `decode`"""
+
+    __slots__ = ("name", "context", "context_id")
+
+    def __init__(
+        self,
+        name: str,
+        context: Optional[str] = None,
+        context_id: Optional[str] = None,
+    ):
+        self.name = name
+        self.context = context
+        self.context_id = context_id
+
+    def __repr__(self):
+        return f"Role(name={self.name!r}, context={self.context!r}, context_id={self.context_id!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, str):
+            return self.name == other
+        return (self.name, self.context, self.context_id) == (
+            getattr(other, "name", None),
+            getattr(other, "context", None),
+            getattr(other, "context_id", None),
+        )
+
+    __hash__ = None
+
+
+class TrustedSlack:
+    """A `Slack` account built without validation, see `decode`"""
+
+    __slots__ = ("id", "team_id", "additional_prop_1")
+    type = "slack"
+
+    def __init__(  # noqa pylint: disable=redefined-builtin
+        self, id: str, team_id: str, additional_prop_1: Optional[dict] = None
+    ):
+        self.id = id
+        self.team_id = team_id
+        self.additional_prop_1 = additional_prop_1
+
+    def __repr__(self):
+        return f"Slack(id={self.id!r}, team_id={self.team_id!r}, additional_prop_1={self.additional_prop_1!r})"
+
+
+class TrustedMember:
+    """A `Member` built without validation, see `decode`"""
+
+    __slots__ = (
+        "id",
+        "first_name",
+        "last_name",
+        "connected_accounts",
+        "roles",
+        "roles_context",
+    )
+
+    __repr__ = Member.__repr__
+    slack = Member.slack
+    update_context = Member.update_context
+
+
+def decode_role(value: Union[str, dict]) -> TrustedRole:
+    if isinstance(value, str):
+        return TrustedRole(value)
+    return TrustedRole(value["name"], value.get("context"), value.get("context_id"))
+
+
+def decode_slack(account: dict) -> TrustedSlack:
+    return TrustedSlack(
+        account.get("identifier", account.get("id")),
+        account.get("teamId", account.get("team_id")),
+        account.get("additionalProp1", account.get("additional_prop_1")),
+    )
+
+
+def decode_member(data: dict) -> TrustedMember:
+    member = TrustedMember()
+    member.id = data.get("id")
+    member.first_name = data.get("firstName", data.get("first_name"))
+    member.last_name = data.get("lastName", data.get("last_name"))
+    # the same accounts `Member.parse_connected_accounts` would parse
+    member.connected_accounts = parse_connected_accounts(
+        data.get("connectedAccounts", data.get("connected_accounts")), decode_slack
+    )
+    member.roles = [decode_role(role) for role in data.get("roles") or ()]
+    member.roles_context = None
+    return member
+
+
+def encode_member(member: TrustedMember) -> Member:
+    # unscoped members have no roles context, which the model only takes unset
+    scope = {"roles_context": member.roles_context} if member.roles_context else {}
+    return Member(
+        id=member.id,
+        first_name=member.first_name,
+        last_name=member.last_name,
+        connected_accounts=[
+            encode_slack(account) if isinstance(account, TrustedSlack) else account
+            for account in member.connected_accounts
+        ],
+        roles=[encode_role(role) for role in member.roles],
+        **scope,
+    )
+
+
+def encode_role(role: TrustedRole) -> Role:
+    return Role(name=role.name, context=role.context, context_id=role.context_id)
+
+
+def encode_slack(account: TrustedSlack) -> Slack:
+    return Slack(
+        id=account.id,
+        team_id=account.team_id,
+        additional_prop_1=account.additional_prop_1,
+    )
+
+
+# the models with a trusted stand-in; anything else is validated as usual
+decoders: Dict[type, Callable[[Any], Any]] = {
+    Member: decode_member,
+    Role: decode_role,
+    Slack: decode_slack,
+}
+
+
+encoders: Dict[type, Callable[[Any], Any]] = {
+    TrustedMember: encode_member,
+    TrustedRole: encode_role,
+    TrustedSlack: encode_slack,
+}
+
+
+def encode(instance: Any) -> Any:
+    """The validated model for a record built by `decode`, so it can be sent back to
+    the engine. Anything else is returned as-is.
+    """
+    encoder = encoders.get(type(instance))
+    return instance if encoder is None else encoder(instance)
+
+
+def decode(model: type, data: Any) -> Any:
+    """Builds `model` from decoded json without validating it.
+
+    Members, with their roles and Slack accounts, are built as lightweight `__slots__`
+    records with the same attributes (and `slack`/`update_context`) as the models,
+    several times faster than validation. They are not pydantic models, so there is no
+    `model_dump`, and nothing in the response is checked: only decode engines you trust.
+    They can still be written back, see `encode`.
+    Collections of them keep their paging fields. Other models are validated as usual.
+    """
+    if issubclass(model, CollectionList):
+        (item_class,) = get_args(model.model_fields["data"].annotation) or (None,)
+        decoder = decoders.get(item_class)
+        if decoder is not None:
+            return model.model_construct(
+                data=[decoder(item) for item in data["data"]],
+                total=data.get("total"),
+                page_num=data.get("pageNum"),
+                page_size=data.get("pageSize"),
+            )
+    decoder = decoders.get(model)
+    if decoder is not None:
+        return decoder(data)
+    return model.model_validate(data)
@@ -30,6 +30,9 @@ setup(
         'httpx>=0.25.0',
         'json_log_formatter~=0.5.2',
     ],
+    extras_require={
+        'http2': ['httpx[http2]>=0.25.0'],
+    },
     python_requires=">=3.6",
     project_urls={
         "Bug Tracker": "https://github.com/hyphen/hyphen-python/issues",
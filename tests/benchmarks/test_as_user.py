@@ -0,0 +1,40 @@
+from timeit import timeit
+
+import httpx
+from pytest import mark as m
+
+from hyphen import HyphenClient
+from hyphen.config import ClientConfig
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+
+
+@m.describe("When a gateway acts on behalf of many users")
+class TestAsUserCost:
+
+    @m.it("should create a view far more cheaply than a client")
+    def test_creation(self, record_property):
+        config = ClientConfig(
+            transport=httpx.MockTransport(lambda _: httpx.Response(200))
+        )
+
+        def build_client():
+            return HyphenClient(
+                ORG_ID,
+                host="http://engine.test",
+                legacy_api_key="key",
+                impersonate_id="member",
+                config=config,
+            )
+
+        client = build_client()
+
+        def view():
+            return client.as_user("member")
+
+        runs = 200
+        per_client = timeit(build_client, number=runs) / runs
+        per_view = timeit(view, number=runs) / runs
+        record_property("new_client_us", per_client * 1e6)
+        record_property("as_user_view_us", per_view * 1e6)
+        assert per_view * 5 < per_client
@@ -0,0 +1,41 @@
+from typing import List
+from timeit import timeit
+from pytest import mark as m
+
+from hyphen.base_factory import CollectionList, collection_for
+from hyphen.member import Member, MemberFactory
+from hyphen.team import Team
+
+PAYLOAD = {
+    "data": [
+        {"id": "65dfd847846e0004123c6899", "firstName": "Normal", "lastName": "User"},
+        {"id": "65dfe4c2846e0004123c68a7", "firstName": "Leader", "lastName": "User"},
+    ]
+}
+
+
+@m.describe("When listing objects repeatedly")
+class TestCollectionRegistry:
+
+    @m.it("should reuse one collection model per object class")
+    def test_collection_is_shared(self):
+        assert collection_for(Member) is collection_for(Member)
+        assert collection_for(Member) is not collection_for(Team)
+        assert issubclass(collection_for(Team), CollectionList)
+
+    @m.it("should not pay for model construction on every list call")
+    def test_list_overhead(self, echo_client, record_property):
+        factory = MemberFactory(echo_client(PAYLOAD))
+
+        def per_call_model():
+            class HyphenCollection(CollectionList):
+                data: List[Member]
+
+            return echo_client(PAYLOAD).get(factory.url_path, HyphenCollection)
+
+        runs = 200
+        before = timeit(per_call_model, number=runs)
+        after = timeit(factory.list, number=runs)
+        record_property("per_call_model_s", before)
+        record_property("shared_model_s", after)
+        assert after * 5 < before
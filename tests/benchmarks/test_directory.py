@@ -0,0 +1,50 @@
+from timeit import timeit
+
+from pytest import mark as m
+
+from hyphen.directory import OrgDirectory
+from hyphen.member import Member
+
+MEMBER_COUNT = 10_000
+MEMBERS = [
+    Member.model_validate(
+        {
+            "id": f"{i:024x}",
+            "firstName": "Member",
+            "lastName": str(i),
+            "connectedAccounts": [
+                {"type": "slack", "identifier": f"U{i}", "teamId": "T0001"}
+            ],
+        }
+    )
+    for i in range(MEMBER_COUNT)
+]
+
+
+@m.describe("When resolving Slack users against a large organization")
+class TestDirectoryLookups:
+
+    @m.it("should resolve in constant time instead of scanning every member")
+    def test_by_slack(self, record_property):
+        directory = OrgDirectory(MEMBERS)
+        slack_id = f"U{MEMBER_COUNT - 1}"
+
+        def scan():
+            return next(m for m in MEMBERS if m.slack and m.slack.id == slack_id)
+
+        def lookup():
+            return directory.by_slack(slack_id, "T0001")
+
+        assert scan() is lookup()
+        before = timeit(scan, number=3) / 3
+        after = timeit(lookup, number=1000) / 1000
+        record_property("scan_ms", before * 1000)
+        record_property("indexed_us", after * 1e6)
+        assert after * 100 < before
+
+    @m.it("should apply an unchanged snapshot without re-indexing")
+    def test_refresh(self):
+        directory = OrgDirectory(MEMBERS)
+        changes = directory.apply([m.model_copy() for m in MEMBERS], [])
+        assert not changes
+        assert directory.get(MEMBERS[0].id) is MEMBERS[0]
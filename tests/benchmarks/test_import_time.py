@@ -0,0 +1,30 @@
+from pytest import mark as m
+
+from tests.unit.test_cold_start import BUILD_CLIENT, IMPORT_PACKAGE, cold
+
+
+def fastest(script: str, runs: int = 3) -> dict:
+    return min((cold(script) for _ in range(runs)), key=lambda r: r["elapsed"])
+
+
+@m.describe("When a short-lived process starts up")
+class TestColdStart:
+
+    # budgets are relative to the eager work timed in the same interpreter, so a loaded
+    # machine slows both sides alike
+
+    @m.it("should import the package in a fraction of what its dependencies take")
+    def test_import(self, record_property):
+        result = fastest(IMPORT_PACKAGE)
+        record_property("import_ms", result["elapsed"] * 1e3)
+        record_property("client_and_dependencies_ms", result["eager"] * 1e3)
+
+        assert result["elapsed"] < result["eager"] * 0.1
+
+    @m.it("should construct a client in a fraction of building its pool and factories")
+    def test_construction(self, record_property):
+        result = fastest(BUILD_CLIENT)
+        record_property("construction_ms", result["elapsed"] * 1e3)
+        record_property("pool_and_factories_ms", result["eager"] * 1e3)
+
+        assert result["elapsed"] < result["eager"] * 0.5
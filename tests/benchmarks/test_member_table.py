@@ -0,0 +1,32 @@
+from pytest import mark as m
+
+from hyphen.base_factory import collection_for
+from hyphen.client import HTTPRequestClient
+from hyphen.member import Member
+from hyphen.member_table import MemberTable
+
+from tests.benchmarks.test_response_parsing import CONTENT, MEMBER_COUNT
+from tests.benchmarks.test_team_memory import traced
+
+
+@m.describe("When holding a large organization's members in memory")
+class TestMemberTableMemory:
+
+    @m.it("should take a fraction of the memory of a list of Members")
+    def test_memory(self, record_property):
+        model = collection_for(Member)
+
+        def members():
+            return HTTPRequestClient._parse(model, CONTENT).data
+
+        def table():
+            records = HTTPRequestClient._parse(model, CONTENT, trusted=True).data
+            return MemberTable.from_members(records)
+
+        listed, list_bytes = traced(members)
+        packed, table_bytes = traced(table)
+        assert len(packed) == len(listed) == MEMBER_COUNT
+
+        record_property("list_mb", list_bytes / 1e6)
+        record_property("table_mb", table_bytes / 1e6)
+        assert table_bytes * 3 < list_bytes
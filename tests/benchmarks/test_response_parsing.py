@@ -0,0 +1,87 @@
+from timeit import timeit
+import json
+
+import httpx
+import pydantic_core
+from pytest import mark as m
+
+from hyphen.base_factory import collection_for
+from hyphen.client import VALIDATE_JSON
+from hyphen.member import Member
+
+MEMBER_COUNT = 5_000
+CONTENT = json.dumps(
+    {
+        "data": [
+            {
+                "id": f"{i:024x}",
+                "firstName": "Member",
+                "lastName": str(i),
+                "roles": ["teamMember", "teamAdmin"],
+                "connectedAccounts": [
+                    {"type": "slack", "id": f"U{i:08}", "teamId": "T0001"}
+                ],
+            }
+            for i in range(MEMBER_COUNT)
+        ]
+    }
+).encode()
+
+
+def fastest(*paths, runs: int = 15) -> list:
+    """the best time of each path, interleaving their runs so load drift hits all alike"""
+    best = [float("inf")] * len(paths)
+    for _ in range(runs):
+        for index, path in enumerate(paths):
+            best[index] = min(best[index], timeit(path, number=1))
+    return best
+
+
+def legacy_handle(model, response: httpx.Response):
+    """the old parse path: decode to text for the emptiness check, json(), then validate"""
+    if not response.text:
+        return None
+    return model.model_validate(response.json())
+
+
+def paths(request_client) -> tuple:
+    """the old parse path, the client's, and model_validate_json on its own"""
+    model = collection_for(Member)
+
+    def before_path():
+        return legacy_handle(model, httpx.Response(200, content=CONTENT))
+
+    def after_path():
+        response = httpx.Response(200, content=CONTENT)
+        return request_client._handle_response(response, model=model)
+
+    def validate_json():
+        return model.model_validate_json(CONTENT)
+
+    return before_path, after_path, validate_json
+
+
+@m.describe("When parsing a large member list")
+class TestResponseParsing:
+
+    @m.it("should parse from bytes into the same members as json() + model_validate")
+    def test_parse_equality(self, fake_client):
+        before_path, after_path, validate_json = paths(fake_client().client)
+
+        assert len(after_path().data) == MEMBER_COUNT
+        assert after_path() == before_path() == validate_json()
+
+    # older cores parse through json.loads + model_validate, the same work as before,
+    # so there is nothing to time there
+    @m.skipif(not VALIDATE_JSON, reason="pydantic-core < 2.18 has no one-pass path")
+    @m.it("should parse in one pass at least as fast as json() + model_validate")
+    def test_parse_throughput(self, fake_client, record_property):
+        before_path, after_path, validate_json = paths(fake_client().client)
+
+        before, after, one_pass = fastest(before_path, after_path, validate_json)
+        record_property("pydantic_core", pydantic_core.__version__)
+        record_property("before_ms", before * 1000)
+        record_property("after_ms", after * 1000)
+        record_property("members_per_s", MEMBER_COUNT / after)
+        record_property("model_validate_json_ms", one_pass * 1000)
+        assert after < before * 1.1
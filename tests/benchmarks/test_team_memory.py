@@ -0,0 +1,45 @@
+import tracemalloc
+
+from pytest import mark as m
+
+from hyphen.member import MemberFactory
+from hyphen.team import TeamFactory
+
+TEAM_COUNT = 10_000
+PAYLOAD = {
+    "data": [{"id": f"{i:024x}", "name": f"team {i}"} for i in range(TEAM_COUNT)]
+}
+
+
+def traced(build):
+    """how many bytes the result of `build` holds on to"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+@m.describe("When listing a large set of teams")
+class TestTeamMemory:
+
+    @m.it("should not build member factories until they are used")
+    def test_lazy_member_factories(self, echo_client, record_property):
+        factory = TeamFactory(echo_client(PAYLOAD))
+
+        teams, lazy_bytes = traced(factory.list)
+        assert all(team._member_factory is None for team in teams)
+
+        def touch_members():
+            return [team.member for team in teams]
+
+        member_factories, eager_bytes = traced(touch_members)
+        assert isinstance(member_factories[0], MemberFactory)
+        assert member_factories[1].url_path.endswith(f"{1:024x}/members")
+        assert teams[1].members is member_factories[1]
+
+        record_property("list_mb", lazy_bytes / 1e6)
+        record_property("member_factories_mb", eager_bytes / 1e6)
+        assert eager_bytes > lazy_bytes / 5
@@ -0,0 +1,28 @@
+from pytest import mark as m
+
+from hyphen.base_factory import collection_for
+from hyphen.client import HTTPRequestClient
+from hyphen.member import Member
+
+from tests.benchmarks.test_response_parsing import CONTENT, MEMBER_COUNT, fastest
+
+
+@m.describe("When decoding a large member list from a trusted engine")
+class TestTrustedDecoding:
+
+    @m.it("should decode several times faster than validating")
+    def test_decode_throughput(self, record_property):
+        model = collection_for(Member)
+
+        def validated():
+            return HTTPRequestClient._parse(model, CONTENT)
+
+        def trusted():
+            return HTTPRequestClient._parse(model, CONTENT, trusted=True)
+
+        assert len(trusted().data) == MEMBER_COUNT
+
+        before, after = fastest(validated, trusted)
+        record_property("validated_ms", before * 1000)
+        record_property("trusted_ms", after * 1000)
+        assert after * 2 < before
@@ -1,12 +1,20 @@
 from datetime import datetime
 from pathlib import Path
+from threading import Lock
+from time import sleep
+from types import SimpleNamespace
+import asyncio
 import json
+import httpx
 import pytest
 from pymongo import MongoClient
 import bson
 
 from pydantic_settings import BaseSettings
 
+from hyphen import HyphenClient
+from hyphen.config import ClientConfig
+
 CASSETTE_LIBRARY_DIR = "/app/tests/assets/tools/vcr_cassettes"
 
 
@@ -116,3 +124,162 @@ def client_args(settings):
         "client_secret": settings.test_hyphen_client_secret,
         "host": settings.test_hyphen_url,
     }
+
+
+class FakeEngine:
+    """A tiny in-memory stand-in for the Hyphen engine.
+    Routes are keyed on (method, path) and return either an httpx.Response
+    or a callable taking the request and returning one.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def route(self, method: str, path: str, response):
+        self.routes[(method.upper(), path)] = response
+
+    def calls(self, method: str, path: str) -> list:
+        return [r for r in self.requests if r.method == method and r.url.path == path]
+
+    def __call__(self, request: "httpx.Request") -> "httpx.Response":
+        self.requests.append(request)
+        response = self.routes.get((request.method, request.url.path))
+        if response is None:
+            return httpx.Response(404, json={"message": "not found"})
+        if callable(response):
+            return response(request)
+        # canned responses are reused, so hand each request its own copy
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=response.content
+        )
+
+
+@pytest.fixture(scope="function")
+def fake_engine():
+    return FakeEngine()
+
+
+@pytest.fixture(scope="function")
+def fake_client(fake_engine):
+    """returns a factory for HyphenClients that talk to `fake_engine`"""
+
+    def build(async_: bool = False, **kwargs) -> "HyphenClient":
+        kwargs.setdefault("organization_id", "65dfaa909ea1295731011c5a")
+        kwargs.setdefault("host", "http://engine.test")
+        if not kwargs.get("client_id"):
+            kwargs.setdefault("legacy_api_key", "test-api-key")
+        kwargs["config"] = kwargs.get("config", ClientConfig()).model_copy(
+            update={"transport": httpx.MockTransport(fake_engine)}
+        )
+        return HyphenClient(async_=async_, **kwargs)
+
+    return build
+
+
+class FakeClock:
+    """a clock that only moves when a test sets `now`"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(scope="function")
+def fake_clock():
+    return FakeClock()
+
+
+@pytest.fixture(scope="function")
+def m2m_token():
+    """returns a factory for m2m endpoints, answering in the engine's millisecond format
+    with tokens numbered token-0, token-1, ... in the order they're issued
+    """
+
+    def build(expires_in: float = 3600, delay: float = 0, async_: bool = False):
+        issued = []
+        lock = Lock()
+
+        def issue() -> "httpx.Response":
+            with lock:
+                issued.append(f"token-{len(issued)}")
+                token = issued[-1]
+            return httpx.Response(
+                200,
+                json={
+                    "access_token": token,
+                    "access_token_expires_in": expires_in * 1000,
+                    "access_token_expires_at": (datetime.now().timestamp() + expires_in)
+                    * 1000,
+                    "token_type": "Bearer",
+                },
+            )
+
+        def handler(request: "httpx.Request") -> "httpx.Response":
+            sleep(delay)
+            return issue()
+
+        async def async_handler(request: "httpx.Request") -> "httpx.Response":
+            await asyncio.sleep(delay)
+            return issue()
+
+        return async_handler if async_ else handler
+
+    return build
+
+
+def plain_member(i: int) -> dict:
+    return {"id": str(i), "firstName": "Member", "lastName": str(i)}
+
+
+@pytest.fixture(scope="function")
+def paged_members():
+    """returns a factory for member list endpoints that honor pageNum/pageSize, up to
+    `max_page_size`, building member `i` with `member(i)`
+    """
+
+    def build(
+        count: int,
+        total: bool = True,
+        max_page_size: int = 1000,
+        member=plain_member,
+    ):
+        def handler(request: "httpx.Request") -> "httpx.Response":
+            page_num = int(request.url.params["pageNum"])
+            page_size = min(int(request.url.params["pageSize"]), max_page_size)
+            start = (page_num - 1) * page_size
+            ids = range(start, min(start + page_size, count))
+            body = {
+                "data": [member(i) for i in ids],
+                "pageNum": page_num,
+                "pageSize": page_size,
+            }
+            if total:
+                body["total"] = count
+            return httpx.Response(200, json=body)
+
+        return handler
+
+    return build
+
+
+class EchoClient:
+    """Validates a canned payload so only the model cost is measured"""
+
+    hyphen_client = SimpleNamespace(organization_id="65dfaa909ea1295731011c5a")
+
+    def __init__(self, payload: dict):
+        self.payload = payload
+
+    def get(self, path, model, **_):
+        return model.model_validate(self.payload)
+
+
+@pytest.fixture(scope="function")
+def echo_client():
+    """returns a factory for stand-in request clients that answer every GET with
+    `payload`
+    """
+    return EchoClient
@@ -0,0 +1,116 @@
+from datetime import datetime
+import gc
+import inspect
+import warnings
+
+import httpx
+from pytest import mark as m
+
+from hyphen.member import AsyncMemberFactory
+from hyphen.organization import AsyncOrganizationFactory
+from hyphen.team import AsyncTeamFactory, Team
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+TEAM_ID = "65dfb23ed3b7fc20de65a34c"
+TEAMS_PATH = f"/api/organizations/{ORG_ID}/teams"
+
+
+@m.describe("When managing an async client's lifecycle")
+class TestAsyncLifecycle:
+
+    @m.it("should close its connection pool when leaving async with")
+    async def test_async_with(self, fake_engine, fake_client):
+        fake_engine.route(
+            "GET", "/api/quote", httpx.Response(200, json={"quote": "hi"})
+        )
+
+        async with fake_client(async_=True) as client:
+            pool = client.client.client
+            assert (await client.movie_quote.get()).quote == "hi"
+            assert (await client.movie_quote.get()).quote == "hi"
+            # every request goes through the one long-lived pool
+            assert client.client.client is pool
+            assert not pool.is_closed
+
+        assert pool.is_closed
+        await client.aclose()  # closing twice is harmless
+
+    @m.it("should stop the background token refresh on aclose")
+    async def test_aclose_background_refresh(self, fake_engine, fake_client):
+        fake_engine.route(
+            "POST",
+            "/api/auth/m2m",
+            httpx.Response(
+                200,
+                json={
+                    "access_token": "token",
+                    "access_token_expires_in": 3600000,
+                    "access_token_expires_at": (datetime.now().timestamp() + 3600)
+                    * 1000,
+                    "token_type": "Bearer",
+                },
+            ),
+        )
+        fake_engine.route(
+            "GET", "/api/quote", httpx.Response(200, json={"quote": "hi"})
+        )
+        client = fake_client(
+            async_=True,
+            client_id="id",
+            client_secret="secret",
+            background_token_refresh=True,
+        )
+        await client.movie_quote.get()
+        task = client.client._background_refresh_task
+        assert task is not None and not task.done()
+
+        await client.aclose()
+
+        assert task.cancelled()
+
+    @m.it("should warn instead of closing from a finalizer")
+    async def test_unclosed_warning(self, fake_engine, fake_client):
+        fake_engine.route(
+            "GET", "/api/quote", httpx.Response(200, json={"quote": "hi"})
+        )
+        client = fake_client(async_=True)
+        await client.movie_quote.get()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            del client
+            gc.collect()
+        assert any(issubclass(w.category, ResourceWarning) for w in caught)
+
+    @m.it("should check health through the authenticated request path")
+    async def test_healthcheck(self, fake_engine, fake_client):
+        fake_engine.route("GET", "/healthcheck", httpx.Response(200, text="ok"))
+        async with fake_client(async_=True) as client:
+            assert await client.async_healthcheck()
+
+
+@m.describe("When using async factories")
+class TestAsyncFactoryParity:
+
+    @m.it("should only expose coroutines")
+    def test_coroutines(self):
+        for factory in (AsyncMemberFactory, AsyncTeamFactory, AsyncOrganizationFactory):
+            for name, method in inspect.getmembers(factory, inspect.isfunction):
+                if name.startswith("_"):
+                    continue
+                assert inspect.iscoroutinefunction(
+                    method
+                ) or inspect.isasyncgenfunction(method), f"{factory.__name__}.{name}"
+
+    @m.it("should update a team and link its member factory")
+    async def test_team_update(self, fake_engine, fake_client):
+        fake_engine.route(
+            "PATCH",
+            f"{TEAMS_PATH}/{TEAM_ID}",
+            httpx.Response(200, json={"id": TEAM_ID, "name": "growth"}),
+        )
+        async with fake_client(async_=True) as client:
+            team = await client.team.update(Team(id=TEAM_ID, name="growth"))
+
+        assert team.name == "growth"
+        assert isinstance(team.member, AsyncMemberFactory)
+        assert team.member.url_path.endswith(f"{TEAM_ID}/members")
@@ -0,0 +1,171 @@
+import asyncio
+from datetime import datetime
+import threading
+import httpx
+from pytest import mark as m
+
+from hyphen.token_store import CachedToken, MemoryTokenStore
+
+M2M_PATH = "/api/auth/m2m"
+QUOTE_PATH = "/api/quote"
+
+
+class ThreadRecordingStore(MemoryTokenStore):
+    """a memory store that notes which thread each call ran on"""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, token):
+        self.threads.append(threading.get_ident())
+        super().set(key, token)
+
+    def acquire_lease(self, key, ttl):
+        self.threads.append(threading.get_ident())
+        return super().acquire_lease(key, ttl)
+
+    def release_lease(self, key):
+        self.threads.append(threading.get_ident())
+        super().release_lease(key)
+
+
+@m.describe("When many async requests need a fresh m2m token")
+class TestAsyncTokenRefresh:
+
+    @m.it("should refresh once and share the token with every request")
+    async def test_single_flight(self, fake_engine, fake_client, m2m_token):
+        fake_engine.route("POST", M2M_PATH, m2m_token(delay=0.01, async_=True))
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        client = fake_client(async_=True, client_id="id", client_secret="secret")
+
+        await asyncio.gather(*(client.movie_quote.get() for _ in range(50)))
+
+        assert len(fake_engine.calls("POST", M2M_PATH)) == 1
+        quotes = fake_engine.calls("GET", QUOTE_PATH)
+        assert len(quotes) == 50
+        assert {q.headers["Authorization"] for q in quotes} == {"Bearer token-0"}
+
+    @m.it("should refresh ahead of expiry in the background when asked to")
+    async def test_background_refresh(self, fake_engine, fake_client, m2m_token):
+        fake_engine.route("POST", M2M_PATH, m2m_token(delay=0.01, async_=True))
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        client = fake_client(
+            async_=True,
+            client_id="id",
+            client_secret="secret",
+            background_token_refresh=True,
+        )
+        client.client.refresh_ahead = 3599.9
+        client.client.refresh_ahead_fraction = 1.0
+        client.client.min_refresh_interval = 0.1
+
+        await client.movie_quote.get()
+        await asyncio.sleep(0.3)
+        assert len(fake_engine.calls("POST", M2M_PATH)) >= 2
+        # the token never expired, so the hot path didn't have to wait on it
+        await client.movie_quote.get()
+        latest = fake_engine.calls("GET", QUOTE_PATH)[-1]
+        assert latest.headers["Authorization"] != "Bearer token-0"
+        client.client._background_refresh_task.cancel()
+
+    @m.it("should not hammer the engine when tokens live shorter than refresh_ahead")
+    async def test_short_lived_token(self, fake_engine, fake_client, m2m_token):
+        fake_engine.route(
+            "POST", M2M_PATH, m2m_token(expires_in=200, delay=0.01, async_=True)
+        )
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        client = fake_client(
+            async_=True,
+            client_id="id",
+            client_secret="secret",
+            background_token_refresh=True,
+        )
+        assert client.client.refresh_ahead > 200
+
+        await client.movie_quote.get()
+        await asyncio.sleep(0.5)
+        # refreshed halfway through its life, not as fast as the event loop allows
+        assert len(fake_engine.calls("POST", M2M_PATH)) == 1
+        assert 0 < client.client._refresh_window() <= 100
+        await client.aclose()
+
+    @m.it("should space background refreshes at least min_refresh_interval apart")
+    async def test_min_refresh_interval(self, fake_engine, fake_client, m2m_token):
+        fake_engine.route(
+            "POST", M2M_PATH, m2m_token(expires_in=200, delay=0.01, async_=True)
+        )
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        client = fake_client(
+            async_=True,
+            client_id="id",
+            client_secret="secret",
+            background_token_refresh=True,
+        )
+        # refresh as early as possible, leaving only the interval to pace it
+        client.client.refresh_ahead_fraction = 1.0
+        client.client.min_refresh_interval = 0.2
+
+        await client.movie_quote.get()
+        await asyncio.sleep(0.5)
+        assert 2 <= len(fake_engine.calls("POST", M2M_PATH)) <= 4
+        await client.aclose()
+
+    @m.it("should fetch past a stored token that is inside the refresh window")
+    async def test_background_refresh_with_store(
+        self, fake_engine, fake_client, m2m_token
+    ):
+        fake_engine.route("POST", M2M_PATH, m2m_token(delay=0.01, async_=True))
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        store = MemoryTokenStore()
+        store.set(
+            "id",
+            CachedToken(
+                authorization="Bearer shared",
+                expires_at=datetime.now().timestamp() + 200,
+            ),
+        )
+        client = fake_client(
+            async_=True,
+            client_id="id",
+            client_secret="secret",
+            background_token_refresh=True,
+            token_store=store,
+        )
+        client.client.refresh_ahead_fraction = 1.0
+        client.client.min_refresh_interval = 0.05
+        refreshes = []
+        refresh = client.client._refresh_m2m_token
+        client.client._refresh_m2m_token = lambda *a: refreshes.append(a) or refresh(*a)
+
+        await client.movie_quote.get()
+        assert fake_engine.calls("GET", QUOTE_PATH)[0].headers["Authorization"] == (
+            "Bearer shared"
+        )
+        await asyncio.sleep(0.5)
+        # the shared token was replaced once, instead of re-adopted in a tight loop
+        assert len(fake_engine.calls("POST", M2M_PATH)) == 1
+        assert len(refreshes) == 2
+        assert store.get("id").authorization == "Bearer token-0"
+        await client.aclose()
+
+    @m.it("should keep token store calls off the event loop")
+    async def test_store_off_loop(self, fake_engine, fake_client, m2m_token):
+        fake_engine.route("POST", M2M_PATH, m2m_token(delay=0.01, async_=True))
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        store = ThreadRecordingStore()
+        client = fake_client(
+            async_=True, client_id="id", client_secret="secret", token_store=store
+        )
+
+        await client.movie_quote.get()
+
+        # get twice, then acquire, set and release, each on an executor thread
+        assert len(store.threads) == 5
+        assert threading.get_ident() not in store.threads
+        assert store.get("id").authorization == "Bearer token-0"
+        await client.aclose()
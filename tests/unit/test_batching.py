@@ -0,0 +1,183 @@
+from concurrent.futures import Future
+from threading import Event, Timer
+import asyncio
+import json
+
+import httpx
+from pytest import mark as m
+
+from hyphen.batching import RoleBatching
+from hyphen.config import ClientConfig
+from hyphen.member import Member
+from hyphen.trusted import decode_member
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+TEAM_ID = "65dfb23ed3b7fc20de65a34c"
+TEAM_PATH = f"/api/organizations/{ORG_ID}/teams/{TEAM_ID}"
+ROSTER_PATH = f"{TEAM_PATH}/members"
+
+
+def member(member_id: str) -> Member:
+    return Member(id=member_id, first_name="Member", last_name=member_id)
+
+
+def setup_batching(fake_engine, fake_client, async_=False, **batching):
+    fake_engine.route(
+        "GET", TEAM_PATH, httpx.Response(200, json={"id": TEAM_ID, "name": "marketing"})
+    )
+    fake_engine.route("PUT", ROSTER_PATH, httpx.Response(200, text=""))
+    config = ClientConfig(role_batching=RoleBatching(**batching))
+    return fake_client(async_=async_, config=config)
+
+
+def sent_members(fake_engine) -> list:
+    return [
+        json.loads(request.content)["members"]
+        for request in fake_engine.calls("PUT", ROSTER_PATH)
+    ]
+
+
+@m.describe("When role assignments are batched")
+class TestRoleBatching:
+
+    @m.it("should merge assignments to one team into a single PUT on flush")
+    def test_flush(self, fake_engine, fake_client):
+        client = setup_batching(fake_engine, fake_client, window=60)
+        team = client.team.read(TEAM_ID)
+
+        first = team.member.assign_role("teamAdmin", [member("1")])
+        second = team.member.assign_role("teamAdmin", [member("2")])
+        third = team.member.assign_role("teamLead", [member("1")])
+        assert isinstance(first, Future) and not first.done()
+        assert not fake_engine.calls("PUT", ROSTER_PATH)
+
+        client.flush()
+
+        assert sent_members(fake_engine) == [
+            [
+                {"id": "1", "roles": ["teamAdmin", "teamLead"]},
+                {"id": "2", "roles": ["teamAdmin"]},
+            ]
+        ]
+        assert [m.id for m in second.result()] == ["2"]
+        assert third.result()[0].roles_context == "team"
+
+    @m.it("should send a batch once it reaches the max size or the window passes")
+    def test_triggers(self, fake_engine, fake_client):
+        client = setup_batching(fake_engine, fake_client, window=0.01, max_batch_size=2)
+        team = client.team.read(TEAM_ID)
+
+        team.member.assign_role("teamAdmin", [member("1")])
+        full = team.member.assign_role("teamAdmin", [member("2")])
+        assert full.done()
+        late = team.member.assign_role("teamAdmin", [member("3")])
+        late.result(timeout=5)
+
+        assert [len(batch) for batch in sent_members(fake_engine)] == [2, 1]
+
+    @m.it("should flush on close and fail every caller in a failed batch")
+    def test_close(self, fake_engine, fake_client):
+        client = setup_batching(fake_engine, fake_client, window=60)
+        team = client.team.read(TEAM_ID)
+        fake_engine.route("PUT", ROSTER_PATH, httpx.Response(500, text="boom"))
+
+        futures = [team.member.assign_role("teamAdmin", [member(i)]) for i in "12"]
+        client.close()
+
+        assert len(sent_members(fake_engine)) == 1
+        assert all(future.exception() is not None for future in futures)
+
+    @m.it("should coalesce concurrent async assignments")
+    async def test_async(self, fake_engine, fake_client):
+        client = setup_batching(fake_engine, fake_client, async_=True, window=0.01)
+        team = await client.team.read(TEAM_ID)
+
+        results = await asyncio.gather(
+            *(team.member.assign_role("teamAdmin", [member(str(i))]) for i in range(5))
+        )
+
+        assert [result[0].id for result in results] == ["0", "1", "2", "3", "4"]
+        assert [len(batch) for batch in sent_members(fake_engine)] == [5]
+
+    @m.it("should flush pending async assignments on aclose")
+    async def test_async_aclose(self, fake_engine, fake_client):
+        client = setup_batching(fake_engine, fake_client, async_=True, window=60)
+        team = await client.team.read(TEAM_ID)
+
+        pending = asyncio.ensure_future(
+            team.member.assign_role("teamAdmin", [member("1")])
+        )
+        await asyncio.sleep(0)
+        await client.aclose()
+
+        assert (await pending)[0].id == "1"
+        assert len(sent_members(fake_engine)) == 1
+
+    @m.it("should wait on close for a batch the timer is already sending")
+    def test_close_in_flight(self, fake_engine, fake_client):
+        client = setup_batching(fake_engine, fake_client, window=0.01)
+        team = client.team.read(TEAM_ID)
+        sending, release = Event(), Event()
+
+        def slow_put(request: "httpx.Request") -> "httpx.Response":
+            sending.set()
+            release.wait(5)
+            return httpx.Response(200, text="")
+
+        fake_engine.route("PUT", ROSTER_PATH, slow_put)
+        future = team.member.assign_role("teamAdmin", [member("1")])
+        assert sending.wait(5)
+        Timer(0.05, release.set).start()
+        client.close()
+
+        assert future.done() and future.result()[0].id == "1"
+
+    @m.it("should wait on aclose for a batch the timer is already sending")
+    async def test_aclose_in_flight(self, fake_engine, fake_client):
+        client = setup_batching(fake_engine, fake_client, async_=True, window=0.01)
+        team = await client.team.read(TEAM_ID)
+        sending = asyncio.Event()
+
+        async def slow_put(request: "httpx.Request") -> "httpx.Response":
+            sending.set()
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, text="")
+
+        fake_engine.route("PUT", ROSTER_PATH, slow_put)
+        pending = asyncio.ensure_future(
+            team.member.assign_role("teamAdmin", [member("1")])
+        )
+        await sending.wait()
+        await client.aclose()
+
+        assert pending.done() and pending.result()[0].id == "1"
+
+    @m.it("should merge trusted members assigned twice in one window")
+    def test_trusted_members(self, fake_engine, fake_client):
+        client = setup_batching(fake_engine, fake_client, window=0.01)
+        team = client.team.read(TEAM_ID)
+        trusted = decode_member({"id": "1", "firstName": "Member", "lastName": "1"})
+
+        first = team.member.assign_role("teamAdmin", [trusted])
+        second = team.member.assign_role("teamLead", [trusted])
+
+        assert [m.name for m in first.result(timeout=5)[0].roles] == ["teamAdmin"]
+        assert [m.name for m in second.result(timeout=5)[0].roles] == ["teamLead"]
+        assert sent_members(fake_engine) == [
+            [{"id": "1", "roles": ["teamAdmin", "teamLead"]}]
+        ]
+
+    @m.it("should fail every caller if the batch can't be built")
+    def test_merge_failure(self, fake_engine, fake_client, monkeypatch):
+        client = setup_batching(fake_engine, fake_client, window=60)
+        team = client.team.read(TEAM_ID)
+
+        def broken(members):
+            raise ValueError("bad member")
+
+        monkeypatch.setattr("hyphen.batching.merge_members", broken)
+        futures = [team.member.assign_role("teamAdmin", [member(i)]) for i in "12"]
+        client.flush()
+
+        assert all(isinstance(f.exception(), ValueError) for f in futures)
+        assert not fake_engine.calls("PUT", ROSTER_PATH)
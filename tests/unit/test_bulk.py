@@ -0,0 +1,121 @@
+from threading import Lock
+from time import sleep
+import asyncio
+import json
+
+import httpx
+import pytest
+from pytest import mark as m
+
+from hyphen.exceptions import BulkOperationException, HyphenApiException
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+TEAMS_PATH = f"/api/organizations/{ORG_ID}/teams"
+TEAM_IDS = [f"65dfb23ed3b7fc20de65a3{i:02d}" for i in range(10)]
+
+
+class InFlight:
+    """counts how many requests the engine is handling at once"""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self._lock = Lock()
+
+    def __enter__(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *_):
+        with self._lock:
+            self.current -= 1
+
+
+def route_teams(fake_engine, in_flight: InFlight):
+    def create(request):
+        name = json.loads(request.content)["name"]
+        if name == "taken":
+            return httpx.Response(409, json={"message": "name taken"})
+        return httpx.Response(200, json={"id": TEAM_IDS[0], "name": name})
+
+    def read(request):
+        with in_flight:
+            sleep(0.01)
+            return httpx.Response(
+                200, json={"id": request.url.path.split("/")[-1], "name": "team"}
+            )
+
+    async def read_async(request):
+        with in_flight:
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200, json={"id": request.url.path.split("/")[-1], "name": "team"}
+            )
+
+    fake_engine.route("POST", TEAMS_PATH, create)
+    for team_id in TEAM_IDS:
+        fake_engine.route("GET", f"{TEAMS_PATH}/{team_id}", read)
+        fake_engine.route("DELETE", f"{TEAMS_PATH}/{team_id}", httpx.Response(200))
+    return read_async
+
+
+@m.describe("When using the bulk factory methods")
+class TestBulk:
+
+    @m.it("should keep input order and report failures per item")
+    def test_create_many(self, fake_engine, fake_client):
+        route_teams(fake_engine, InFlight())
+        client = fake_client()
+
+        result = client.team.create_many(
+            [{"name": "marketing"}, {"name": "taken"}, {"name": "sales"}]
+        )
+
+        assert not result.ok
+        assert [team.name for team in result.successes] == ["marketing", "sales"]
+        assert result[1] is None
+        assert isinstance(result.errors[1], HyphenApiException)
+        assert result[2].member is not None
+        with pytest.raises(BulkOperationException):
+            result.raise_for_errors()
+
+    @m.it("should read each distinct id once, under the concurrency limit")
+    def test_read_many(self, fake_engine, fake_client):
+        in_flight = InFlight()
+        route_teams(fake_engine, in_flight)
+        client = fake_client()
+        ids = [*TEAM_IDS, *reversed(TEAM_IDS)]
+
+        result = client.team.read_many(ids, concurrency=3)
+
+        assert result.ok
+        assert [team.id for team in result] == ids
+        assert len(fake_engine.requests) == len(TEAM_IDS)
+        assert 1 < in_flight.peak <= 3
+
+    @m.it("should map a failed read onto every repeat of its id")
+    def test_read_many_errors(self, fake_engine, fake_client):
+        route_teams(fake_engine, InFlight())
+        client = fake_client()
+
+        result = client.team.read_many([TEAM_IDS[0], "missing", "missing"])
+
+        assert result[0].id == TEAM_IDS[0]
+        assert list(result.errors) == [1, 2]
+
+    @m.it("should run async bulk calls under the concurrency limit")
+    async def test_async_read_many(self, fake_engine, fake_client):
+        in_flight = InFlight()
+        read_async = route_teams(fake_engine, in_flight)
+        for team_id in TEAM_IDS:
+            fake_engine.route("GET", f"{TEAMS_PATH}/{team_id}", read_async)
+        client = fake_client(async_=True)
+
+        result = await client.team.read_many(TEAM_IDS, concurrency=4)
+
+        assert [team.id for team in result] == TEAM_IDS
+        assert 1 < in_flight.peak <= 4
+
+        deleted = await client.team.delete_many(list(result))
+        assert deleted.ok and len(deleted) == len(TEAM_IDS)
@@ -0,0 +1,159 @@
+import asyncio
+
+import httpx
+from pytest import mark as m
+
+from hyphen.cache import MISSING, ResponseCache
+from hyphen.config import ClientConfig
+from hyphen.team import Team
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+TEAM_ID = "65dfb23ed3b7fc20de65a34c"
+TEAMS_PATH = f"/api/organizations/{ORG_ID}/teams"
+ROSTER_PATH = f"{TEAMS_PATH}/{TEAM_ID}/members"
+MEMBERS_PATH = f"/api/organizations/{ORG_ID}/members"
+
+
+def route_team(fake_engine):
+    team = httpx.Response(200, json={"id": TEAM_ID, "name": "marketing"})
+    fake_engine.route("GET", f"{TEAMS_PATH}/{TEAM_ID}", team)
+    fake_engine.route("PATCH", f"{TEAMS_PATH}/{TEAM_ID}", team)
+    fake_engine.route("GET", TEAMS_PATH, httpx.Response(200, json={"data": []}))
+    fake_engine.route(
+        "GET",
+        ROSTER_PATH,
+        httpx.Response(
+            200,
+            json={"data": [{"id": "1", "firstName": "Normal", "lastName": "User"}]},
+        ),
+    )
+    fake_engine.route("PUT", ROSTER_PATH, httpx.Response(200, text=""))
+
+
+@m.describe("When reads go through a response cache")
+class TestResponseCache:
+
+    @m.it("should serve repeat reads from the cache and count hits and misses")
+    def test_read_through(self, fake_engine, fake_client):
+        route_team(fake_engine)
+        client = fake_client(config=ClientConfig(cache=ResponseCache()))
+
+        team = client.team.read(TEAM_ID)
+        assert client.team.read(TEAM_ID).name == team.name
+        assert [m.id for m in team.member.list()] == ["1"]
+        assert [m.id for m in team.member.list()] == ["1"]
+
+        assert len(fake_engine.requests) == 2
+        assert client.cache_stats == {
+            "hits": 2,
+            "misses": 2,
+            "revalidations": 0,
+            "size": 2,
+        }
+
+    @m.it("should invalidate the affected paths when the client writes")
+    def test_write_invalidation(self, fake_engine, fake_client):
+        route_team(fake_engine)
+        client = fake_client(config=ClientConfig(cache=ResponseCache()))
+        team = client.team.read(TEAM_ID)
+        client.team.list()
+        team.member.list()
+
+        team.member.assign_role("teamLead", team.member.list())
+        team.member.list()
+        assert len(fake_engine.calls("GET", ROSTER_PATH)) == 2
+
+        client.team.update(team)
+        client.team.read(TEAM_ID)
+        client.team.list()
+        assert len(fake_engine.calls("GET", f"{TEAMS_PATH}/{TEAM_ID}")) == 2
+        assert len(fake_engine.calls("GET", TEAMS_PATH)) == 2
+
+    @m.it("should not let team writes change cached members")
+    def test_writes_copy_members(self, fake_engine, fake_client):
+        route_team(fake_engine)
+        fake_engine.route(
+            "GET",
+            MEMBERS_PATH,
+            httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {
+                            "id": "1",
+                            "firstName": "Normal",
+                            "lastName": "User",
+                            "roles": [{"name": "organizationMember"}],
+                        }
+                    ]
+                },
+            ),
+        )
+        client = fake_client(config=ClientConfig(cache=ResponseCache()))
+        member = client.member.list()[0]
+        team = client.team.read(TEAM_ID)
+
+        team.member.add(member)
+        team.member.assign_role("teamLead", [member])
+
+        (cached,) = client.member.list()
+        assert cached is member
+        assert [(r.name, r.context) for r in cached.roles] == [
+            ("organizationMember", "organization")
+        ]
+        assert len(fake_engine.calls("GET", MEMBERS_PATH)) == 1
+        (sent_add, sent_role) = [
+            r.content for r in fake_engine.calls("PUT", ROSTER_PATH)
+        ]
+        assert b'"roles":["teamMember"]' in sent_add
+        assert b'"roles":["organizationMember","teamLead"]' in sent_role
+
+    @m.it("should expire entries per resource and evict the least recently used")
+    def test_ttl_and_lru(self, fake_clock):
+        cache = ResponseCache(
+            max_entries=2, ttl=10, ttls={"api/quote": 1}, clock=fake_clock
+        )
+        cache.set("quote", "api/quote", "a")
+        cache.set("team", f"{TEAMS_PATH}/{TEAM_ID}", "b")
+        fake_clock.now = 2
+        assert cache.get("quote") is MISSING
+        assert cache.get("team") == "b"
+
+        cache.set("one", "api/one", 1)
+        cache.set("two", "api/two", 2)
+        assert cache.get("team") is MISSING
+        assert cache.stats()["size"] == 2
+
+    @m.it("should cache async reads too")
+    async def test_async(self, fake_engine, fake_client):
+        route_team(fake_engine)
+        client = fake_client(async_=True, config=ClientConfig(cache=ResponseCache()))
+        await client.team.read(TEAM_ID)
+        await client.team.read(TEAM_ID)
+        assert len(fake_engine.requests) == 1
+
+    @m.it("should not cache a GET that a write overtook while it was in flight")
+    async def test_write_during_read(self, fake_engine, fake_client):
+        state = {"name": "marketing"}
+
+        async def read_team(request: "httpx.Request") -> "httpx.Response":
+            name = state["name"]
+            await asyncio.sleep(0.05)  # slow enough for the write to land first
+            return httpx.Response(200, json={"id": TEAM_ID, "name": name})
+
+        def update_team(request: "httpx.Request") -> "httpx.Response":
+            state["name"] = "sales"
+            return httpx.Response(200, json={"id": TEAM_ID, "name": "sales"})
+
+        fake_engine.route("GET", f"{TEAMS_PATH}/{TEAM_ID}", read_team)
+        fake_engine.route("PATCH", f"{TEAMS_PATH}/{TEAM_ID}", update_team)
+        config = ClientConfig(cache=ResponseCache(ttl=300), coalesce_gets=True)
+        async with fake_client(async_=True, config=config) as client:
+            before = asyncio.ensure_future(client.team.read(TEAM_ID))
+            await asyncio.sleep(0.01)
+            await client.team.update(Team(id=TEAM_ID, name="sales"))
+            assert (await before).name == "marketing"
+
+            assert (await client.team.read(TEAM_ID)).name == "sales"
+            assert (await client.team.read(TEAM_ID)).name == "sales"
+        assert len(fake_engine.calls("GET", f"{TEAMS_PATH}/{TEAM_ID}")) == 2
@@ -0,0 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from time import sleep
+import asyncio
+
+import httpx
+from pytest import mark as m
+
+from hyphen.config import ClientConfig
+from hyphen.exceptions import HyphenApiException
+from hyphen.team import Team
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+TEAM_ID = "65dfb23ed3b7fc20de65a34c"
+TEAM_PATH = f"/api/organizations/{ORG_ID}/teams/{TEAM_ID}"
+COALESCING = ClientConfig(coalesce_gets=True)
+
+
+def slow_team(status: int = 200):
+    """an async engine route slow enough for callers to pile up on it"""
+
+    async def handler(request: "httpx.Request") -> "httpx.Response":
+        await asyncio.sleep(0.02)
+        caller = request.headers.get("x-hyphen-impersonate", "owner")
+        return httpx.Response(status, json={"id": TEAM_ID, "name": caller})
+
+    return handler
+
+
+@m.describe("When identical GETs are in flight at the same time")
+class TestCoalescing:
+
+    @m.it("should share one async request and parsed result")
+    async def test_async(self, fake_engine, fake_client):
+        fake_engine.route("GET", TEAM_PATH, slow_team())
+        async with fake_client(async_=True, config=COALESCING) as client:
+            teams = await asyncio.gather(
+                *(client.team.read(TEAM_ID) for _ in range(20))
+            )
+            again = await client.team.read(TEAM_ID)
+
+        assert len(fake_engine.calls("GET", TEAM_PATH)) == 2
+        assert all(team is teams[0] for team in teams)
+        assert again is not teams[0]
+
+    @m.it("should keep requests for different members apart")
+    async def test_impersonation(self, fake_engine, fake_client):
+        fake_engine.route("GET", TEAM_PATH, slow_team())
+        async with fake_client(async_=True, config=COALESCING) as client:
+            teams = await asyncio.gather(
+                client.team.read(TEAM_ID),
+                client.as_user("a").team.read(TEAM_ID),
+                client.as_user("a").team.read(TEAM_ID),
+            )
+
+        assert [team.name for team in teams] == ["owner", "a", "a"]
+        assert len(fake_engine.calls("GET", TEAM_PATH)) == 2
+
+    @m.it("should not let a cancelled caller cancel the shared request")
+    async def test_cancel(self, fake_engine, fake_client):
+        fake_engine.route("GET", TEAM_PATH, slow_team())
+        async with fake_client(async_=True, config=COALESCING) as client:
+            first = asyncio.ensure_future(client.team.read(TEAM_ID))
+            second = asyncio.ensure_future(client.team.read(TEAM_ID))
+            await asyncio.sleep(0.005)
+            first.cancel()
+
+            assert (await second).id == TEAM_ID
+        assert first.cancelled()
+        assert len(fake_engine.calls("GET", TEAM_PATH)) == 1
+
+    @m.it("should hand every waiter the shared error")
+    async def test_errors(self, fake_engine, fake_client):
+        fake_engine.route("GET", TEAM_PATH, slow_team(status=404))
+        async with fake_client(async_=True, config=COALESCING) as client:
+            results = await asyncio.gather(
+                *(client.team.read(TEAM_ID) for _ in range(3)), return_exceptions=True
+            )
+
+        assert all(isinstance(result, HyphenApiException) for result in results)
+        assert len(fake_engine.calls("GET", TEAM_PATH)) == 1
+
+    @m.it("should start a fresh request after a write to the same resource")
+    async def test_write(self, fake_engine, fake_client):
+        fake_engine.route("GET", TEAM_PATH, slow_team())
+        fake_engine.route("DELETE", TEAM_PATH, httpx.Response(200))
+        async with fake_client(async_=True, config=COALESCING) as client:
+            before = asyncio.ensure_future(client.team.read(TEAM_ID))
+            await asyncio.sleep(0)
+            await client.team.delete(Team(id=TEAM_ID, name="owner"))
+            after = asyncio.ensure_future(client.team.read(TEAM_ID))
+            await asyncio.gather(before, after)
+
+        assert len(fake_engine.calls("GET", TEAM_PATH)) == 2
+
+    @m.it("should share one request between sync threads")
+    def test_threads(self, fake_engine, fake_client):
+        arrived, release = Event(), Event()
+
+        def handler(request: "httpx.Request") -> "httpx.Response":
+            arrived.set()
+            release.wait(5)
+            return httpx.Response(200, json={"id": TEAM_ID, "name": "owner"})
+
+        fake_engine.route("GET", TEAM_PATH, handler)
+        client = fake_client(config=COALESCING)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(client.team.read, TEAM_ID) for _ in range(8)]
+            arrived.wait(5)
+            # give the other threads time to join the flight before it lands
+            sleep(0.05)
+            release.set()
+            teams = [future.result() for future in futures]
+
+        assert len(fake_engine.calls("GET", TEAM_PATH)) == 1
+        assert all(team is teams[0] for team in teams)
+
+    @m.it("should be off unless configured")
+    async def test_default(self, fake_engine, fake_client):
+        fake_engine.route("GET", TEAM_PATH, slow_team())
+        async with fake_client(async_=True) as client:
+            await asyncio.gather(*(client.team.read(TEAM_ID) for _ in range(3)))
+
+        assert len(fake_engine.calls("GET", TEAM_PATH)) == 3
@@ -0,0 +1,82 @@
+from pathlib import Path
+import json
+import os
+import subprocess
+import sys
+
+from pytest import mark as m
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# what `import hyphen` used to pull in, before anything was asked of it
+HEAVY_MODULES = ["httpx", "pydantic", "pydantic_settings", "sqlite3", "humps"]
+
+
+def cold(script: str) -> dict:
+    """runs `script` in a fresh interpreter and returns the json it prints"""
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+        # as if no m2m credentials were set, however the developer's shell is set up
+        env={k: v for k, v in os.environ.items() if not k.startswith("HYPHEN_")},
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+IMPORT_PACKAGE = f"""
+import json, sys, time
+start = time.perf_counter()
+import hyphen
+elapsed = time.perf_counter() - start
+loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+# what the import would cost if it loaded the client and its dependencies
+start = time.perf_counter()
+from hyphen import HyphenClient
+eager = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "eager": eager, "loaded": loaded}}))
+"""
+
+BUILD_CLIENT = """
+import json, sys, time
+from hyphen import HyphenClient
+start = time.perf_counter()
+client = HyphenClient(
+    "65dfaa909ea1295731011c5a",
+    host="http://engine.test",
+    legacy_api_key="key",
+)
+elapsed = time.perf_counter() - start
+result = {
+    "elapsed": elapsed,
+    "pool_built": client.client._http_client is not None,
+    "factories": [name for name in ("organization", "member", "movie_quote", "team")
+                  if name in vars(client)],
+    "loaded": [name for name in ("pydantic_settings", "sqlite3") if name in sys.modules],
+}
+# what construction would cost if it built the pool and factories up front
+start = time.perf_counter()
+client.client.client
+client.organization, client.member, client.movie_quote, client.team
+result["eager"] = time.perf_counter() - start
+print(json.dumps(result))
+"""
+
+
+@m.describe("When a short-lived process starts up")
+class TestColdStart:
+
+    @m.it("should import the package without its dependencies")
+    def test_import(self):
+        assert cold(IMPORT_PACKAGE)["loaded"] == []
+
+    @m.it("should construct a client without building its pool or factories")
+    def test_construction(self):
+        result = cold(BUILD_CLIENT)
+
+        assert not result["pool_built"]
+        assert result["factories"] == []
+        # no env credentials, so neither settings nor the token store were needed
+        assert result["loaded"] == []
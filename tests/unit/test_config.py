@@ -0,0 +1,49 @@
+import httpx
+from pytest import mark as m
+
+from hyphen import HyphenClient
+from hyphen.config import ClientConfig
+
+QUOTE_PATH = "/api/quote"
+
+
+@m.describe("When configuring the connection behind a client")
+class TestClientConfig:
+
+    @m.it("should pass timeouts and pool limits through to httpx")
+    def test_timeouts_and_limits(self, fake_client):
+        timeout = httpx.Timeout(10.0, connect=2.0)
+        config = ClientConfig(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=7, max_keepalive_connections=3),
+        )
+        client = fake_client(config=config)
+        assert client.client.client.timeout == timeout
+
+        async_client = fake_client(async_=True, config=config)
+        assert async_client.client.client.timeout == timeout
+
+    @m.it("should default to the original five second timeout")
+    def test_default_timeout(self, fake_client):
+        client = fake_client()
+        assert client.client.client.timeout == httpx.Timeout(5.0)
+
+    @m.it("should send requests through an injected http client without changing it")
+    def test_injected_client(self, fake_engine):
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        shared = httpx.Client(transport=httpx.MockTransport(fake_engine))
+        client = HyphenClient(
+            organization_id="65dfaa909ea1295731011c5a",
+            host="http://engine.test",
+            legacy_api_key="test-api-key",
+            config=ClientConfig(http_client=shared),
+        )
+
+        assert client.movie_quote.get().quote == "!"
+        request = fake_engine.requests[-1]
+        assert str(request.url) == "http://engine.test/api/quote"
+        assert request.headers["x-api-key"] == "test-api-key"
+        assert "x-api-key" not in shared.headers
+
+        del client
+        assert not shared.is_closed
@@ -0,0 +1,112 @@
+import httpx
+from pytest import mark as m
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+MEMBERS_PATH = f"/api/organizations/{ORG_ID}/members"
+TEAMS_PATH = f"/api/organizations/{ORG_ID}/teams"
+TEAM_ID = "65dfb23ed3b7fc20de65a34c"
+
+
+def member(member_id: str, first_name: str, slack_id: str = None, roles=()) -> dict:
+    body = {
+        "id": member_id,
+        "firstName": first_name,
+        "lastName": "User",
+        "roles": ["organizationMember", *roles],
+    }
+    if slack_id:
+        body["connectedAccounts"] = [
+            {"type": "slack", "identifier": slack_id, "teamId": "T0001"}
+        ]
+    return body
+
+
+TEAM_ADMIN = {"name": "teamAdmin", "context": "team", "context_id": TEAM_ID}
+
+
+def setup_directory(fake_engine, members: list, teams: list):
+    """serves whatever `members` and `teams` hold at the time of each request"""
+    fake_engine.route(
+        "GET", MEMBERS_PATH, lambda _: httpx.Response(200, json={"data": members})
+    )
+    fake_engine.route(
+        "GET", TEAMS_PATH, lambda _: httpx.Response(200, json={"data": teams})
+    )
+
+
+@m.describe("When resolving members through an OrgDirectory")
+class TestOrgDirectory:
+
+    @m.it("should look members up by id, Slack identity, name and role")
+    def test_lookups(self, fake_engine, fake_client):
+        setup_directory(
+            fake_engine,
+            [
+                member("1", "Ada", slack_id="U1", roles=[TEAM_ADMIN]),
+                member("2", "Grace", slack_id="U2"),
+                member("3", "Ada"),
+            ],
+            [{"id": TEAM_ID, "name": "Marketing"}],
+        )
+        directory = fake_client().directory()
+        assert len(fake_engine.requests) == 2
+
+        assert len(directory) == 3 and "2" in directory
+        assert directory.get("2").first_name == "Grace"
+        assert directory.by_slack("U1").id == "1"
+        assert directory.by_slack("U2", "T0001").id == "2"
+        assert directory.by_slack("U2", "T9999") is None
+        assert [m.id for m in directory.by_name("ada  USER")] == ["1", "3"]
+        assert [m.id for m in directory.with_role("teamAdmin")] == ["1"]
+        assert directory.with_role("teamAdmin", "team", TEAM_ID)[0].id == "1"
+        assert len(directory.with_role("organizationMember", "organization")) == 3
+        assert directory.with_role("teamAdmin", "organization") == []
+        assert directory.team(TEAM_ID).name == "Marketing"
+        assert directory.team_by_name("marketing")[0].id == TEAM_ID
+        # lookups are answered from the indexes, not the engine
+        assert len(fake_engine.requests) == 2
+
+    @m.it("should only re-index what changed on refresh")
+    def test_refresh(self, fake_engine, fake_client):
+        members = [
+            member("1", "Ada", slack_id="U1", roles=[TEAM_ADMIN]),
+            member("2", "Grace", slack_id="U2"),
+            member("3", "Alan"),
+        ]
+        teams = [{"id": TEAM_ID, "name": "Marketing"}]
+        setup_directory(fake_engine, members, teams)
+        directory = fake_client().directory()
+        grace = directory.get("2")
+
+        members[0] = member("1", "Ada", slack_id="U9")
+        del members[2]
+        members.append(member("4", "Edsger"))
+        teams[0] = {"id": TEAM_ID, "name": "Growth"}
+        changes = directory.refresh()
+
+        assert (changes.added, changes.updated, changes.removed) == (
+            ["4"],
+            ["1", TEAM_ID],
+            ["3"],
+        )
+        assert directory.get("2") is grace
+        assert directory.by_slack("U1") is None
+        assert directory.by_slack("U9").id == "1"
+        assert directory.with_role("teamAdmin") == []
+        assert directory.get("3") is None and directory.by_name("alan user") == []
+        assert directory.by_name("edsger user")[0].id == "4"
+        assert directory.team_by_name("marketing") == []
+        assert directory.team_by_name("growth")[0].id == TEAM_ID
+        assert not directory.refresh()
+
+    @m.it("should load and refresh from async clients")
+    async def test_async(self, fake_engine, fake_client):
+        members = [member("1", "Ada", slack_id="U1")]
+        setup_directory(fake_engine, members, [])
+        directory = await fake_client(async_=True).directory()
+
+        assert directory.by_slack("U1").id == "1"
+        members.append(member("2", "Grace", slack_id="U2"))
+        changes = await directory.refresh()
+        assert changes.added == ["2"]
+        assert directory.by_slack("U2").id == "2"
@@ -0,0 +1,84 @@
+import httpx
+from pytest import mark as m
+
+from hyphen.cache import ResponseCache
+from hyphen.config import ClientConfig
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+TEAM_ID = "65dfb23ed3b7fc20de65a34c"
+TEAM_PATH = f"/api/organizations/{ORG_ID}/teams/{TEAM_ID}"
+
+
+class ETagServer:
+    """stands in for an engine that tags the team with an ETag and honors If-None-Match"""
+
+    def __init__(self):
+        self.version = 1
+
+    @property
+    def etag(self) -> str:
+        return f'"v{self.version}"'
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(
+            200,
+            headers={"ETag": self.etag},
+            json={"id": TEAM_ID, "name": f"marketing v{self.version}"},
+        )
+
+
+def setup_etag(fake_engine, clock):
+    server = ETagServer()
+    fake_engine.route("GET", TEAM_PATH, server)
+    cache = ResponseCache(ttl=30, clock=clock)
+    return server, ClientConfig(cache=cache)
+
+
+@m.describe("When cached responses carry an ETag")
+class TestETagRevalidation:
+
+    @m.it("should revalidate an expired entry and reuse it on a 304")
+    def test_not_modified(self, fake_engine, fake_client, fake_clock):
+        _, config = setup_etag(fake_engine, fake_clock)
+        client = fake_client(config=config)
+
+        team = client.team.read(TEAM_ID)
+        fake_clock.now = 60
+        assert client.team.read(TEAM_ID) is team
+
+        revalidation = fake_engine.calls("GET", TEAM_PATH)[1]
+        assert revalidation.headers["If-None-Match"] == '"v1"'
+        assert client.cache_stats["revalidations"] == 1
+
+        # the 304 renewed the entry, so this read is a plain hit
+        assert client.team.read(TEAM_ID) is team
+        assert len(fake_engine.calls("GET", TEAM_PATH)) == 2
+
+    @m.it("should replace the entry when the resource changed")
+    def test_modified(self, fake_engine, fake_client, fake_clock):
+        server, config = setup_etag(fake_engine, fake_clock)
+        client = fake_client(config=config)
+
+        client.team.read(TEAM_ID)
+        server.version = 2
+        fake_clock.now = 60
+        assert client.team.read(TEAM_ID).name == "marketing v2"
+        assert client.cache_stats["revalidations"] == 0
+
+        fake_clock.now = 120
+        client.team.read(TEAM_ID)
+        assert (
+            fake_engine.calls("GET", TEAM_PATH)[-1].headers["If-None-Match"] == '"v2"'
+        )
+
+    @m.it("should revalidate from an async client too")
+    async def test_async_not_modified(self, fake_engine, fake_client, fake_clock):
+        _, config = setup_etag(fake_engine, fake_clock)
+        client = fake_client(async_=True, config=config)
+
+        team = await client.team.read(TEAM_ID)
+        fake_clock.now = 60
+        assert await client.team.read(TEAM_ID) is team
+        assert client.cache_stats["revalidations"] == 1
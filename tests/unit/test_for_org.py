@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+from pytest import mark as m
+
+from tests.unit.test_impersonation import M2M_PATH
+
+ORG_IDS = [f"{i:024x}" for i in range(12)]
+
+
+def teams_response(request: "httpx.Request", failing: str = None) -> "httpx.Response":
+    """every org has one team named after it; `failing` answers 500"""
+    org_id = request.url.path.split("/")[3]
+    if org_id == failing:
+        return httpx.Response(500, text="boom")
+    return httpx.Response(200, json={"data": [{"id": "1", "name": org_id}]})
+
+
+def serve_teams(fake_engine, m2m_token, failing: str = None):
+    for org_id in ORG_IDS:
+        fake_engine.route(
+            "GET",
+            f"/api/organizations/{org_id}/teams",
+            lambda request: teams_response(request, failing),
+        )
+    fake_engine.route("POST", M2M_PATH, m2m_token())
+
+
+def serve_teams_slowly(fake_engine, m2m_token) -> list:
+    """like `serve_teams`, but async and slow, recording the peak in-flight count"""
+    in_flight, peak = [0], [0]
+
+    async def handler(request: "httpx.Request") -> "httpx.Response":
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return teams_response(request)
+
+    serve_teams(fake_engine, m2m_token)
+    for org_id in ORG_IDS:
+        fake_engine.route("GET", f"/api/organizations/{org_id}/teams", handler)
+    return peak
+
+
+@m.describe("When working across organizations with for_org views")
+class TestForOrg:
+
+    @m.it("should scope factories to the org while sharing the pool and token")
+    def test_for_org(self, fake_engine, fake_client, m2m_token):
+        serve_teams(fake_engine, m2m_token)
+        client = fake_client(client_id="id", client_secret="secret")
+
+        views = [client.for_org(org_id) for org_id in ORG_IDS[:3]]
+
+        assert [view.team.list()[0].name for view in views] == ORG_IDS[:3]
+        assert views[0].member.url_path == f"api/organizations/{ORG_IDS[0]}/members"
+        assert views[1].organization_id == ORG_IDS[1]
+        assert all(view.client.client is client.client.client for view in views)
+        assert client.organization_id != ORG_IDS[0]
+        assert len(fake_engine.calls("POST", M2M_PATH)) == 1
+        impersonated = views[2].as_user("member")
+        assert impersonated.team.list()[0].name == ORG_IDS[2]
+        assert fake_engine.requests[-1].headers["x-hyphen-impersonate"] == "member"
+
+    @m.it("should fan out across orgs in order and keep per-org errors")
+    def test_across_orgs(self, fake_engine, fake_client, m2m_token):
+        serve_teams(fake_engine, m2m_token, failing=ORG_IDS[4])
+        client = fake_client(client_id="id", client_secret="secret")
+
+        result = client.across_orgs(ORG_IDS, lambda org: org.team.list())
+
+        assert [teams[0].name for teams in result.successes] == [
+            org_id for org_id in ORG_IDS if org_id != ORG_IDS[4]
+        ]
+        assert list(result.errors) == [4]
+
+    @m.it("should fan out async operations under a concurrency limit")
+    async def test_across_orgs_async(self, fake_engine, fake_client, m2m_token):
+        peak = serve_teams_slowly(fake_engine, m2m_token)
+        async with fake_client(
+            async_=True, client_id="id", client_secret="secret"
+        ) as client:
+            result = await client.across_orgs(
+                ORG_IDS, lambda org: org.team.list(), concurrency=3
+            )
+
+        assert result.ok
+        assert [teams[0].name for teams in result] == ORG_IDS
+        assert peak[0] == 3
+        assert len(fake_engine.calls("POST", M2M_PATH)) == 1
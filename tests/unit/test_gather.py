@@ -0,0 +1,86 @@
+from concurrent.futures import CancelledError
+from functools import partial
+
+import httpx
+import pytest
+from pytest import mark as m
+
+from hyphen.exceptions import HyphenApiException, IncorrectMethodException
+
+from tests.unit.test_bulk import TEAM_IDS, TEAMS_PATH, InFlight, route_teams
+
+MISSING_ID = "65dfb23ed3b7fc20de65a399"
+
+
+def setup_gather(fake_engine, fake_client):
+    in_flight = InFlight()
+    route_teams(fake_engine, in_flight)
+    fake_engine.route("GET", f"{TEAMS_PATH}/{MISSING_ID}", httpx.Response(404))
+    return fake_client(), in_flight
+
+
+@m.describe("When running sync factory calls concurrently")
+class TestGather:
+
+    @m.it("should gather results in order under the concurrency cap")
+    def test_gather(self, fake_engine, fake_client):
+        client, in_flight = setup_gather(fake_engine, fake_client)
+
+        result = client.gather(
+            *(partial(client.team.read, team_id) for team_id in TEAM_IDS),
+            concurrency=4,
+        )
+
+        assert result.ok
+        assert [team.id for team in result] == TEAM_IDS
+        assert 1 < in_flight.peak <= 4
+
+    @m.it("should capture each failing call without failing the rest")
+    def test_errors(self, fake_engine, fake_client):
+        client, _ = setup_gather(fake_engine, fake_client)
+
+        result = client.gather(
+            partial(client.team.read, TEAM_IDS[0]),
+            partial(client.team.read, MISSING_ID),
+            client.team.list,
+        )
+
+        assert result[0].id == TEAM_IDS[0]
+        assert list(result.errors) == [1, 2]
+        assert isinstance(result.errors[1], HyphenApiException)
+
+    @m.it("should resolve futures for calls queued on a batch")
+    def test_batch(self, fake_engine, fake_client):
+        client, in_flight = setup_gather(fake_engine, fake_client)
+
+        with client.batch(concurrency=8) as batch:
+            teams = [batch.add(client.team.read, team_id) for team_id in TEAM_IDS]
+            missing = batch.add(client.team.read, id=MISSING_ID)
+            cancelled = batch.add(client.team.read, TEAM_IDS[0])
+            assert cancelled.cancel()
+            assert not teams[0].done()
+
+        assert [future.result().id for future in teams] == TEAM_IDS
+        assert isinstance(missing.exception(), HyphenApiException)
+        assert cancelled.cancelled()
+        assert len(batch) == 0
+        assert in_flight.peak > 1
+
+    @m.it("should not send a batch whose block raised")
+    def test_batch_abandoned(self, fake_engine, fake_client):
+        client, _ = setup_gather(fake_engine, fake_client)
+
+        with pytest.raises(RuntimeError):
+            with client.batch() as batch:
+                team = batch.add(client.team.read, TEAM_IDS[0])
+                raise RuntimeError("render failed")
+
+        with pytest.raises(CancelledError):
+            team.result()
+        assert not fake_engine.requests
+
+    @m.it("should point async clients at asyncio.gather")
+    def test_async_client(self, fake_client):
+        client = fake_client(async_=True)
+        with pytest.raises(IncorrectMethodException):
+            client.gather(client.team.list)
@@ -0,0 +1,86 @@
+import httpx
+from pytest import mark as m
+
+from hyphen.cache import ResponseCache
+from hyphen.config import ClientConfig
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+TEAMS_PATH = f"/api/organizations/{ORG_ID}/teams"
+M2M_PATH = "/api/auth/m2m"
+LEADER_MEMBER_ID = "65dfe4c2846e0004123c68a7"
+NORMAL_MEMBER_ID = "65dfd847846e0004123c6899"
+
+
+def teams_for_caller(request: "httpx.Request") -> "httpx.Response":
+    """each caller sees a team named after who they're acting as"""
+    caller = request.headers.get("x-hyphen-impersonate", "owner")
+    return httpx.Response(200, json={"data": [{"id": "1", "name": caller}]})
+
+
+def setup_impersonation(fake_engine, fake_client, m2m_token, async_=False, **kwargs):
+    fake_engine.route("GET", TEAMS_PATH, teams_for_caller)
+    fake_engine.route("POST", M2M_PATH, m2m_token())
+    return fake_client(async_=async_, client_id="id", client_secret="secret", **kwargs)
+
+
+@m.describe("When acting on behalf of members through as_user views")
+class TestAsUser:
+
+    @m.it("should send the impersonation header only from the view")
+    def test_header(self, fake_engine, fake_client, m2m_token):
+        client = setup_impersonation(fake_engine, fake_client, m2m_token)
+        leader = client.as_user(LEADER_MEMBER_ID)
+
+        assert leader.team.list()[0].name == LEADER_MEMBER_ID
+        assert client.team.list()[0].name == "owner"
+        assert client.as_user(NORMAL_MEMBER_ID).team.list()[0].name == NORMAL_MEMBER_ID
+        assert leader.debug_profile["on_behalf_of"] == LEADER_MEMBER_ID
+
+    @m.it("should share the parent's pool and m2m token")
+    def test_shared(self, fake_engine, fake_client, m2m_token):
+        client = setup_impersonation(fake_engine, fake_client, m2m_token)
+        views = [client.as_user(str(i)) for i in range(20)]
+
+        for view in views:
+            view.team.list()
+        client.team.list()
+
+        assert all(view.client.client is client.client.client for view in views)
+        assert len(fake_engine.calls("POST", M2M_PATH)) == 1
+        assert all(
+            request.headers["Authorization"] == "Bearer token-0"
+            for request in fake_engine.calls("GET", TEAMS_PATH)
+        )
+
+    @m.it("should cache each member's reads apart")
+    def test_cache(self, fake_engine, fake_client, m2m_token):
+        config = ClientConfig(cache=ResponseCache(ttl=60))
+        client = setup_impersonation(fake_engine, fake_client, m2m_token, config=config)
+
+        assert client.as_user("a").team.list()[0].name == "a"
+        assert client.as_user("b").team.list()[0].name == "b"
+        assert client.as_user("a").team.list()[0].name == "a"
+        assert client.team.list()[0].name == "owner"
+        assert len(fake_engine.calls("GET", TEAMS_PATH)) == 3
+
+    @m.it("should leave the shared pool open when a view is closed")
+    def test_close(self, fake_engine, fake_client, m2m_token):
+        client = setup_impersonation(fake_engine, fake_client, m2m_token)
+        view = client.as_user(LEADER_MEMBER_ID)
+
+        view.close()
+        del view
+
+        assert not client.client.client.is_closed
+        assert client.team.list()[0].name == "owner"
+
+    @m.it("should work from async clients")
+    async def test_async(self, fake_engine, fake_client, m2m_token):
+        async with setup_impersonation(
+            fake_engine, fake_client, m2m_token, async_=True
+        ) as client:
+            leader = client.as_user(LEADER_MEMBER_ID)
+            assert (await leader.team.list())[0].name == LEADER_MEMBER_ID
+            await leader.aclose()
+            assert (await client.team.list())[0].name == "owner"
+            assert len(fake_engine.calls("POST", M2M_PATH)) == 1
@@ -0,0 +1,144 @@
+import json
+
+import httpx
+from pytest import mark as m
+
+from hyphen.member import Member
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+TEAM_ID = "65dfb23ed3b7fc20de65a34c"
+TEAM_PATH = f"/api/organizations/{ORG_ID}/teams/{TEAM_ID}"
+ROSTER_PATH = f"{TEAM_PATH}/members"
+
+
+class FakeRoster:
+    """a team roster that grows with every PUT"""
+
+    def __init__(self):
+        self.member_ids = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "PUT":
+            body = json.loads(request.content)
+            self.member_ids.extend(member["id"] for member in body["members"])
+            return httpx.Response(200, text="")
+        return httpx.Response(
+            200,
+            json={
+                "data": [
+                    {"id": member_id, "firstName": "Member", "lastName": member_id}
+                    for member_id in self.member_ids
+                ]
+            },
+        )
+
+
+def setup_team(fake_engine):
+    roster = FakeRoster()
+    fake_engine.route(
+        "GET", TEAM_PATH, httpx.Response(200, json={"id": TEAM_ID, "name": "marketing"})
+    )
+    fake_engine.route("PUT", ROSTER_PATH, roster)
+    fake_engine.route("GET", ROSTER_PATH, roster)
+    return roster
+
+
+def new_members(count: int):
+    return [
+        Member(id=str(i), first_name="Member", last_name=str(i)) for i in range(count)
+    ]
+
+
+@m.describe("When adding many members to a team")
+class TestAddMany:
+
+    @m.it("should PUT in chunks and fetch the roster once")
+    def test_add_many(self, fake_engine, fake_client):
+        roster = setup_team(fake_engine)
+        team = fake_client().team.read(TEAM_ID)
+        team.member.add_chunk_size = 100
+
+        added = team.member.add_many(new_members(250))
+
+        assert len(fake_engine.calls("PUT", ROSTER_PATH)) == 3
+        assert len(fake_engine.calls("GET", ROSTER_PATH)) == 1
+        assert len(roster.member_ids) == 250
+        assert sorted(added, key=int) == [str(i) for i in range(250)]
+        assert added["7"].roles_context == "team"
+
+    @m.it("should only return the members it added")
+    def test_add_many_existing_roster(self, fake_engine, fake_client):
+        roster = setup_team(fake_engine)
+        roster.member_ids.append("already-there")
+        team = fake_client().team.read(TEAM_ID)
+
+        assert list(team.member.add_many(new_members(2))) == ["0", "1"]
+        assert team.member.add(Member(id="2", first_name="A", last_name="B")).id == "2"
+
+    @m.it("should add many members from an async client")
+    async def test_async_add_many(self, fake_engine, fake_client):
+        setup_team(fake_engine)
+        team = await fake_client(async_=True).team.read(TEAM_ID)
+        team.member.add_chunk_size = 2
+
+        added = await team.member.add_many(new_members(5))
+
+        assert len(added) == 5
+        assert len(fake_engine.calls("PUT", ROSTER_PATH)) == 3
+        assert len(fake_engine.calls("GET", ROSTER_PATH)) == 1
+
+    @m.it("should send nothing when there are no members to add")
+    async def test_add_none(self, fake_engine, fake_client):
+        setup_team(fake_engine)
+        team = fake_client().team.read(TEAM_ID)
+        async_team = await fake_client(async_=True).team.read(TEAM_ID)
+        read = len(fake_engine.requests)
+
+        assert team.member.add_many([]) == {}
+        assert await async_team.member.add_many(iter([])) == {}
+        assert len(fake_engine.requests) == read
+
+
+def route_revocations(fake_engine, member_ids, failing=()):
+    def revoke(request):
+        if request.url.path.split("/")[-2] in failing:
+            return httpx.Response(500, json={"message": "boom"})
+        return httpx.Response(200, text="")
+
+    for member_id in member_ids:
+        fake_engine.route("DELETE", f"{ROSTER_PATH}/{member_id}/roles", revoke)
+
+
+def revocations(fake_engine):
+    return [r for r in fake_engine.requests if r.method == "DELETE"]
+
+
+@m.describe("When revoking roles from many members")
+class TestRevokeRoles:
+
+    @m.it("should send one DELETE per member with every role in its body")
+    def test_revoke_roles(self, fake_engine, fake_client):
+        setup_team(fake_engine)
+        route_revocations(fake_engine, [str(i) for i in range(20)])
+        team = fake_client().team.read(TEAM_ID)
+        members = new_members(20)
+
+        result = team.member.revoke_roles(
+            ["teamMember", "teamAdmin"], members + members[:5], concurrency=4
+        )
+
+        assert result.ok and len(result) == 20
+        sent = revocations(fake_engine)
+        assert len(sent) == 20
+        assert {json.loads(r.content)["roles"][1] for r in sent} == {"teamAdmin"}
+
+    @m.it("should report the members whose revocation failed")
+    async def test_async_revoke_roles(self, fake_engine, fake_client):
+        setup_team(fake_engine)
+        route_revocations(fake_engine, ["0", "1", "2"], failing={"1"})
+        team = await fake_client(async_=True).team.read(TEAM_ID)
+
+        result = await team.member.revoke_roles("teamAdmin", new_members(3))
+
+        assert list(result.errors) == [1]
+        assert len(revocations(fake_engine)) == 3
@@ -0,0 +1,106 @@
+from pytest import mark as m, raises
+
+from hyphen.member import Member
+from hyphen.member_table import MemberTable
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+MEMBERS_PATH = f"/api/organizations/{ORG_ID}/members"
+
+
+def member_body(i: int) -> dict:
+    """member `i`, every third an admin of team t{i % 2}"""
+    body = {"id": str(i), "firstName": "Member", "lastName": str(i)}
+    body["roles"] = ["organizationMember"]
+    if i % 3 == 0:
+        body["roles"].append(
+            {"name": "teamAdmin", "context": "team", "context_id": f"t{i % 2}"}
+        )
+        body["connectedAccounts"] = [
+            {"type": "slack", "identifier": f"U{i}", "teamId": "T0001"}
+        ]
+    return body
+
+
+@m.describe("When loading members into a MemberTable")
+class TestMemberTable:
+
+    @m.it("should hold every member and build Members only on row access")
+    def test_table(self, fake_engine, fake_client, paged_members):
+        fake_engine.route("GET", MEMBERS_PATH, paged_members(250, member=member_body))
+        client = fake_client()
+
+        table = client.member.table(page_size=100)
+
+        assert len(table) == 250
+        assert len(fake_engine.requests) == 3
+        # organizationMember plus the two teamAdmin roles
+        assert len(table.role_keys) == 3
+        member = table[3]
+        assert isinstance(member, Member)
+        assert (member.id, member.last_name) == ("3", "3")
+        assert member.roles_context == "organization"
+        assert member.roles[0].context_id == ORG_ID
+        assert member.slack.id == "U3"
+        assert table[-1].id == "249"
+        assert [member.id for member in table][:3] == ["0", "1", "2"]
+        with raises(IndexError):
+            table[250]
+
+    @m.it("should filter by role and context without building members")
+    def test_filter(self, fake_engine, fake_client, paged_members):
+        fake_engine.route("GET", MEMBERS_PATH, paged_members(12, member=member_body))
+        table = fake_client().member.table()
+
+        admins = table.filter(role="teamAdmin")
+        assert admins.ids == ["0", "3", "6", "9"]
+        assert table.filter(context="team", context_id="t1").ids == ["3", "9"]
+        assert len(table.filter(context="organization")) == 12
+        assert len(table.filter(role="missing")) == 0
+        assert admins[1].slack.id == "U3"
+
+    @m.it("should export rows as plain dicts")
+    def test_to_dicts(self, fake_engine, fake_client, paged_members):
+        fake_engine.route("GET", MEMBERS_PATH, paged_members(2, member=member_body))
+        rows = fake_client().member.table().to_dicts()
+
+        assert rows[0] == {
+            "id": "0",
+            "first_name": "Member",
+            "last_name": "0",
+            "roles": [
+                {
+                    "name": "organizationMember",
+                    "context": "organization",
+                    "context_id": ORG_ID,
+                },
+                {"name": "teamAdmin", "context": "team", "context_id": "t0"},
+            ],
+            "connected_accounts": [
+                {
+                    "type": "slack",
+                    "id": "U0",
+                    "team_id": "T0001",
+                    "additional_prop_1": None,
+                }
+            ],
+        }
+        assert rows[1]["connected_accounts"] == []
+
+    @m.it("should accept validated members too")
+    def test_from_members(self, fake_engine, fake_client, paged_members):
+        fake_engine.route("GET", MEMBERS_PATH, paged_members(4, member=member_body))
+        members = list(fake_client().member.iter_list())
+
+        table = MemberTable.from_members(members)
+
+        assert [m.model_dump() for m in table] == [m.model_dump() for m in members]
+
+    @m.it("should build the table from async factories")
+    async def test_async_table(self, fake_engine, fake_client, paged_members):
+        fake_engine.route("GET", MEMBERS_PATH, paged_members(150, member=member_body))
+        client = fake_client(async_=True)
+
+        table = await client.member.table(page_size=100)
+
+        assert len(table) == 150
+        assert table.filter(role="teamAdmin")[0].roles_context == "organization"
@@ -0,0 +1,93 @@
+import httpx
+from pytest import mark as m
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+MEMBERS_PATH = f"/api/organizations/{ORG_ID}/members"
+TEAMS_PATH = f"/api/organizations/{ORG_ID}/teams"
+
+
+def unpaged_teams(count: int, echo_page: bool = False):
+    """serves all `count` teams for every page, like an engine that ignores paging"""
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        body = {"data": [{"id": str(i), "name": f"Team {i}"} for i in range(count)]}
+        if echo_page:
+            body["pageNum"] = 1
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+@m.describe("When iterating over a large collection")
+class TestPagination:
+
+    @m.it("should fetch page by page and scope every member")
+    def test_iter_list(self, fake_engine, fake_client, paged_members):
+        fake_engine.route("GET", MEMBERS_PATH, paged_members(250))
+        client = fake_client()
+
+        members = client.member.iter_list(page_size=100)
+        first = next(members)
+        assert first.id == "0"
+        assert first.roles_context == "organization"
+        assert len(fake_engine.requests) == 1
+
+        assert len([first, *members]) == 250
+        assert len(fake_engine.requests) == 3
+
+    @m.it("should stop on a short page when the engine sends no total")
+    def test_iter_list_without_total(self, fake_engine, fake_client, paged_members):
+        fake_engine.route("GET", MEMBERS_PATH, paged_members(200, total=False))
+        client = fake_client()
+
+        assert len(list(client.member.iter_list(page_size=100))) == 200
+        # the third, empty page is what tells us we're done
+        assert len(fake_engine.requests) == 3
+
+    @m.it("should keep going when the engine caps the page size")
+    def test_iter_list_capped_page_size(self, fake_engine, fake_client, paged_members):
+        fake_engine.route("GET", MEMBERS_PATH, paged_members(250, max_page_size=100))
+        client = fake_client()
+
+        assert len(list(client.member.iter_list(page_size=500))) == 250
+        assert len(fake_engine.requests) == 3
+
+    @m.it("should keep going on a capped page when the engine sends no total")
+    async def test_async_iter_list_capped_page_size(
+        self, fake_engine, fake_client, paged_members
+    ):
+        fake_engine.route(
+            "GET", MEMBERS_PATH, paged_members(150, total=False, max_page_size=100)
+        )
+        client = fake_client(async_=True)
+
+        ids = [member.id async for member in client.member.iter_list(page_size=500)]
+        assert ids == [str(i) for i in range(150)]
+
+    @m.it("should stop when an engine that ignores paging fills exactly one page")
+    def test_iter_list_ignored_paging(self, fake_engine, fake_client):
+        fake_engine.route("GET", TEAMS_PATH, unpaged_teams(3))
+        client = fake_client()
+
+        ids = [team.id for team in client.team.iter_list(page_size=3)]
+        assert ids == ["0", "1", "2"]
+        # the second page repeated the first, so it was dropped
+        assert len(fake_engine.requests) == 2
+
+    @m.it("should stop when the engine answers with a different page number")
+    async def test_iter_list_wrong_page_num(self, fake_engine, fake_client):
+        fake_engine.route("GET", TEAMS_PATH, unpaged_teams(3, echo_page=True))
+        client = fake_client(async_=True)
+
+        ids = [team.id async for team in client.team.iter_list(page_size=3)]
+        assert ids == ["0", "1", "2"]
+        assert len(fake_engine.requests) == 2
+
+    @m.it("should support async for on async factories")
+    async def test_async_iter_list(self, fake_engine, fake_client, paged_members):
+        fake_engine.route("GET", MEMBERS_PATH, paged_members(150))
+        client = fake_client(async_=True)
+
+        ids = [member.id async for member in client.member.iter_list(page_size=50)]
+        assert ids == [str(i) for i in range(150)]
+        assert len(fake_engine.requests) == 3
@@ -0,0 +1,61 @@
+from time import monotonic
+import httpx
+from pytest import mark as m
+
+from hyphen.config import ClientConfig
+from hyphen.rate_limit import RateLimiter, path_template
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+QUOTE_PATH = "/api/quote"
+
+
+@m.describe("When limiting the request rate client-side")
+class TestRateLimit:
+
+    @m.it("should let a burst through and then space requests out")
+    def test_token_bucket(self, fake_clock):
+        limiter = RateLimiter(rate=10, burst=3, clock=fake_clock)
+        waits = [limiter.reserve("api/quote") for _ in range(5)]
+        assert waits == [0.0, 0.0, 0.0, 0.1, 0.2]
+
+        fake_clock.now = 10.0  # a quiet period refills the bucket, up to the burst size
+        assert [limiter.reserve("api/quote") for _ in range(4)][-1] > 0
+
+    @m.it("should apply per-endpoint limits on path templates")
+    def test_endpoint_buckets(self, fake_clock):
+        limiter = RateLimiter(
+            rate=1000,
+            endpoints={"api/organizations/{id}/members": (1, 1)},
+            clock=fake_clock,
+        )
+        members = f"api/organizations/{ORG_ID}/members"
+        assert path_template(f"/{members}?pageNum=2") == (
+            "api/organizations/{id}/members"
+        )
+        assert limiter.reserve(members) == 0.0
+        assert limiter.reserve(members) == 1.0
+        assert limiter.reserve(f"api/organizations/{ORG_ID}/teams") == 0.0
+
+    @m.it("should hold several clients to one shared budget")
+    def test_shared_limiter(self, fake_engine, fake_client):
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        config = ClientConfig(rate_limiter=RateLimiter(rate=50, burst=2))
+        clients = [fake_client(config=config), fake_client(config=config)]
+
+        started = monotonic()
+        for _ in range(3):
+            for client in clients:
+                client.movie_quote.get()
+        # 6 requests, 2 free from the burst, then 50/s
+        assert monotonic() - started >= 4 / 50
+
+    @m.it("should await rather than block in async clients")
+    async def test_async_limiter(self, fake_engine, fake_client):
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        config = ClientConfig(rate_limiter=RateLimiter(rate=50, burst=1))
+        client = fake_client(async_=True, config=config)
+
+        started = monotonic()
+        for _ in range(4):
+            await client.movie_quote.get()
+        assert monotonic() - started >= 3 / 50
@@ -0,0 +1,39 @@
+from json.decoder import JSONDecodeError
+
+import httpx
+import pytest
+from pydantic import ValidationError
+from pytest import mark as m
+
+from hyphen import client as client_module
+from hyphen.team import Team
+
+
+@m.describe("When parsing response bodies")
+class TestResponseParsing:
+
+    @pytest.fixture(params=[True, False], ids=["validate_json", "json_loads"])
+    def request_client(self, request, fake_client, monkeypatch):
+        monkeypatch.setattr(client_module, "VALIDATE_JSON", request.param)
+        return fake_client().client
+
+    @m.it("should parse raw bytes into the model")
+    def test_parse(self, request_client):
+        response = httpx.Response(200, content=b'{"id": "1", "name": "marketing"}')
+        team = request_client._handle_response(response, model=Team)
+        assert team.name == "marketing"
+        assert request_client._handle_response(httpx.Response(200), model=Team) is None
+
+    @m.it("should keep raising JSONDecodeError for bodies that aren't json")
+    def test_invalid_json(self, request_client, caplog):
+        response = httpx.Response(200, content=b"<html>bad gateway</html>")
+        with pytest.raises(JSONDecodeError):
+            request_client._handle_response(response, model=Team)
+        assert "<html>bad gateway</html>" in caplog.text
+
+    @m.it("should log the body when it doesn't match the model")
+    def test_validation_error(self, request_client, caplog):
+        response = httpx.Response(200, content=b'{"id": "1"}')
+        with pytest.raises(ValidationError):
+            request_client._handle_response(response, model=Team)
+        assert "Unable to parse" in caplog.text and '{"id": "1"}' in caplog.text
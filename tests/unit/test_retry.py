@@ -0,0 +1,102 @@
+import httpx
+from pytest import mark as m
+from pytest import raises
+
+from hyphen.config import ClientConfig
+from hyphen.exceptions import HyphenApiException
+from hyphen.retry import RetryPolicy, retry_after
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+TEAMS_PATH = f"/api/organizations/{ORG_ID}/teams"
+FAST = RetryPolicy(backoff_base=0.001, backoff_max=0.01)
+
+
+def flaky(*responses: "httpx.Response"):
+    """answers with `responses` in order, then keeps repeating the last one"""
+    remaining = list(responses)
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        response = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=response.content
+        )
+
+    return handler
+
+
+TEAMS = httpx.Response(200, json={"data": [{"id": "1", "name": "marketing"}]})
+UNAVAILABLE = httpx.Response(503, text="unavailable")
+
+
+@m.describe("When the engine fails transiently")
+class TestRetry:
+
+    @m.it("should retry idempotent requests and count the retries")
+    def test_retries_get(self, fake_engine, fake_client):
+        fake_engine.route("GET", TEAMS_PATH, flaky(UNAVAILABLE, UNAVAILABLE, TEAMS))
+        client = fake_client(config=ClientConfig(retry=FAST))
+
+        assert [team.name for team in client.team.list()] == ["marketing"]
+        assert len(fake_engine.requests) == 3
+        assert client.retry_stats == {
+            "retries": 2,
+            "exhausted": 0,
+            "reasons": {"503": 2},
+        }
+
+    @m.it("should give up after max_retries")
+    def test_gives_up(self, fake_engine, fake_client):
+        fake_engine.route("GET", TEAMS_PATH, flaky(UNAVAILABLE))
+        client = fake_client(config=ClientConfig(retry=FAST))
+
+        with raises(HyphenApiException):
+            client.team.list()
+        assert len(fake_engine.requests) == FAST.max_retries + 1
+        assert client.retry_stats["exhausted"] == 1
+
+    @m.it("should only retry POST when opted in")
+    def test_post_is_opt_in(self, fake_engine, fake_client):
+        created = httpx.Response(200, json={"id": "1", "name": "Red Team"})
+        fake_engine.route("POST", TEAMS_PATH, flaky(UNAVAILABLE, created))
+        with raises(HyphenApiException):
+            fake_client(config=ClientConfig(retry=FAST)).team.create("Red Team")
+
+        fake_engine.route("POST", TEAMS_PATH, flaky(UNAVAILABLE, created))
+        opted_in = FAST.model_copy(update={"methods": FAST.methods | {"POST"}})
+        client = fake_client(config=ClientConfig(retry=opted_in))
+        assert client.team.create("Red Team").id == "1"
+
+    @m.it("should stop when Retry-After would overrun the time budget")
+    def test_retry_after_budget(self, fake_engine, fake_client):
+        limited = httpx.Response(429, headers={"Retry-After": "30"}, text="slow down")
+        fake_engine.route("GET", TEAMS_PATH, flaky(limited, TEAMS))
+        policy = FAST.model_copy(update={"total_budget": 5.0})
+        client = fake_client(config=ClientConfig(retry=policy))
+
+        with raises(HyphenApiException):
+            client.team.list()
+        assert len(fake_engine.requests) == 1
+        assert retry_after(limited) == 30.0
+
+    @m.it("should back off with full jitter")
+    def test_full_jitter(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+        delays = [policy.delay(2, 0.0) for _ in range(200)]
+        assert all(0 <= delay <= 4.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    @m.it("should retry connection errors for async clients too")
+    async def test_async_connection_error(self, fake_engine, fake_client):
+        failures = []
+
+        def handler(request: "httpx.Request") -> "httpx.Response":
+            if not failures:
+                failures.append(request)
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, content=TEAMS.content)
+
+        fake_engine.route("GET", TEAMS_PATH, handler)
+        client = fake_client(async_=True, config=ClientConfig(retry=FAST))
+
+        assert [team.id for team in await client.team.list()] == ["1"]
+        assert client.retry_stats["reasons"] == {"ConnectError": 1}
@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+from pytest import mark as m
+
+M2M_PATH = "/api/auth/m2m"
+QUOTE_PATH = "/api/quote"
+
+
+@m.describe("When sharing one sync client between threads")
+class TestThreadSafety:
+
+    @m.it("should refresh the m2m token once for all threads")
+    def test_single_refresh(self, fake_engine, fake_client, m2m_token):
+        fake_engine.route("POST", M2M_PATH, m2m_token(delay=0.05))
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        client = fake_client(client_id="id", client_secret="secret")
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            quotes = list(pool.map(lambda _: client.movie_quote.get(), range(64)))
+
+        assert all(quote.quote == "!" for quote in quotes)
+        assert len(fake_engine.calls("POST", M2M_PATH)) == 1
+        requests = fake_engine.calls("GET", QUOTE_PATH)
+        assert {r.headers["Authorization"] for r in requests} == {"Bearer token-0"}
+
+    @m.it("should never put the token on the shared httpx client")
+    def test_per_request_auth(self, fake_engine, fake_client, m2m_token):
+        fake_engine.route("POST", M2M_PATH, m2m_token(delay=0.05))
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+        client = fake_client(client_id="id", client_secret="secret")
+
+        client.movie_quote.get()
+        client.client._auth_token_expires = 0.0  # force a refresh
+        client.movie_quote.get()
+
+        assert "Authorization" not in client.client.client.headers
+        assert "Authorization" not in fake_engine.calls("POST", M2M_PATH)[1].headers
+        latest = fake_engine.calls("GET", QUOTE_PATH)[-1]
+        assert latest.headers["Authorization"] == "Bearer token-1"
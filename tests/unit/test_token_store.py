@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import os
+import stat
+import httpx
+import pytest
+from pytest import mark as m
+
+from hyphen import HyphenClient
+from hyphen.config import ClientConfig
+from hyphen.token_store import CachedToken, MemoryTokenStore, SQLiteTokenStore
+
+M2M_PATH = "/api/auth/m2m"
+QUOTE_PATH = "/api/quote"
+
+
+@m.describe("When many clients share one set of m2m credentials")
+class TestTokenStore:
+
+    def route(self, fake_engine, m2m_token):
+        # slow enough for every worker to pile up
+        fake_engine.route("POST", M2M_PATH, m2m_token(delay=0.05))
+        fake_engine.route("GET", QUOTE_PATH, httpx.Response(200, json={"quote": "!"}))
+
+    @m.it("should reuse a stored token across clients in one process")
+    def test_memory_store(self, fake_engine, fake_client, m2m_token):
+        self.route(fake_engine, m2m_token)
+        store = MemoryTokenStore()
+        for _ in range(3):
+            client = fake_client(client_id="id", client_secret="s", token_store=store)
+            client.movie_quote.get()
+        assert len(fake_engine.calls("POST", M2M_PATH)) == 1
+        assert store.get("id").authorization == "Bearer token-0"
+
+    @m.it("should let only one worker fetch a token through a sqlite store")
+    def test_sqlite_store(self, fake_engine, fake_client, m2m_token, tmp_path):
+        self.route(fake_engine, m2m_token)
+        path = tmp_path / "tokens.sqlite"
+
+        def worker(_):
+            # a store per worker, as separate processes would have
+            client = fake_client(
+                client_id="id", client_secret="s", token_store=SQLiteTokenStore(path)
+            )
+            return client.movie_quote.get()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(quote.quote == "!" for quote in pool.map(worker, range(8)))
+        assert len(fake_engine.calls("POST", M2M_PATH)) == 1
+
+    @m.it("should not hand out a token that is about to expire")
+    def test_expiring_token(self, fake_engine, fake_client, m2m_token, tmp_path):
+        self.route(fake_engine, m2m_token)
+        store = SQLiteTokenStore(tmp_path / "tokens.sqlite")
+        store.set(
+            "id",
+            CachedToken(
+                authorization="Bearer stale",
+                expires_at=datetime.now().timestamp() + 10,
+            ),
+        )
+        client = fake_client(client_id="id", client_secret="s", token_store=store)
+        client.movie_quote.get()
+        assert len(fake_engine.calls("POST", M2M_PATH)) == 1
+        assert store.get("id").authorization == "Bearer token-0"
+
+    @m.it("should return one cached client per credential set")
+    def test_shared(self):
+        args = {"legacy_api_key": "key", "host": "http://engine.test"}
+        client = HyphenClient.shared("org-a", **args)
+        assert HyphenClient.shared("org-a", **args) is client
+        assert HyphenClient.shared("org-b", **args) is not client
+
+    @m.it("should share clients built with a config, one per config object")
+    def test_shared_with_config(self):
+        args = {"legacy_api_key": "key", "host": "http://engine.test"}
+        config = ClientConfig(timeout=1.0)
+        client = HyphenClient.shared("org-a", config=config, **args)
+        assert HyphenClient.shared("org-a", config=config, **args) is client
+        assert client.client.config is config
+        other = HyphenClient.shared("org-a", config=ClientConfig(timeout=1.0), **args)
+        assert other is not client
+
+    @m.it("should keep a sqlite store's tokens readable by its owner only")
+    def test_sqlite_permissions(self, tmp_path):
+        path = tmp_path / "tokens.sqlite"
+        store = SQLiteTokenStore(path)
+        store.set("id", CachedToken(authorization="Bearer t", expires_at=0.0))
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+        os.chmod(path, 0o644)
+        with pytest.warns(UserWarning, match="bearer tokens"):
+            SQLiteTokenStore(path)
@@ -0,0 +1,110 @@
+import json
+
+import httpx
+from pytest import mark as m
+
+from hyphen.cache import ResponseCache
+from hyphen.config import ClientConfig
+from hyphen.member import Member
+from hyphen.trusted import TrustedMember
+
+ORG_ID = "65dfaa909ea1295731011c5a"
+MEMBERS_PATH = f"/api/organizations/{ORG_ID}/members"
+MEMBERS = {
+    "data": [
+        {
+            "id": "65dfd847846e0004123c6899",
+            "firstName": "Normal",
+            "lastName": "User",
+            "roles": ["organizationMember", {"name": "teamAdmin", "context": "team"}],
+            "connectedAccounts": [
+                {"type": "github", "login": "normal"},
+                {"type": "slack", "identifier": "U0001", "teamId": "T0001"},
+            ],
+        },
+        {"id": "65dfe4c2846e0004123c68a7", "firstName": "Leader", "lastName": "User"},
+    ],
+    "total": 2,
+}
+
+
+def attributes(member) -> tuple:
+    return (
+        member.id,
+        member.first_name,
+        member.last_name,
+        member.roles_context,
+        [(r.name, r.context, r.context_id) for r in member.roles],
+        [
+            a if isinstance(a, dict) else (a.type, a.id, a.team_id)
+            for a in member.connected_accounts
+        ],
+    )
+
+
+@m.describe("When decoding trusted responses")
+class TestTrustedDecoding:
+
+    @m.it("should match validated members attribute for attribute")
+    def test_same_attributes(self, fake_engine, fake_client):
+        fake_engine.route("GET", MEMBERS_PATH, httpx.Response(200, json=MEMBERS))
+        client = fake_client()
+
+        validated = client.member.list()
+        trusted = client.member.list(trusted=True)
+
+        assert isinstance(validated[0], Member)
+        assert isinstance(trusted[0], TrustedMember)
+        assert [attributes(m) for m in trusted] == [attributes(m) for m in validated]
+        assert trusted[0].slack.id == "U0001"
+        assert trusted[1].slack is None
+        assert repr(trusted[0]) == repr(validated[0])
+        assert trusted[0].roles == validated[0].roles
+
+    @m.it("should decode trusted by default when the client opts in")
+    async def test_client_default(self, fake_engine, fake_client):
+        fake_engine.route("GET", MEMBERS_PATH, httpx.Response(200, json=MEMBERS))
+        client = fake_client(async_=True, config=ClientConfig(trusted_decoding=True))
+
+        assert isinstance((await client.member.list())[0], TrustedMember)
+        assert isinstance((await client.member.list(trusted=False))[0], Member)
+
+    @m.it("should cache trusted and validated reads apart")
+    def test_cache(self, fake_engine, fake_client):
+        fake_engine.route("GET", MEMBERS_PATH, httpx.Response(200, json=MEMBERS))
+        client = fake_client(config=ClientConfig(cache=ResponseCache()))
+
+        client.member.list(trusted=True)
+        assert isinstance(client.member.list()[0], Member)
+        assert isinstance(client.member.list(trusted=True)[0], TrustedMember)
+        assert len(fake_engine.requests) == 2
+
+    @m.it("should write back members read with trusted decoding")
+    def test_write_back(self, fake_engine, fake_client):
+        member = MEMBERS["data"][0]
+        member_path = f"{MEMBERS_PATH}/{member['id']}"
+        fake_engine.route("GET", member_path, httpx.Response(200, json=member))
+        fake_engine.route("PATCH", member_path, httpx.Response(200, json=member))
+        client = fake_client(config=ClientConfig(trusted_decoding=True))
+
+        read = client.member.read(member["id"])
+        assert isinstance(read, TrustedMember)
+        read.first_name = "Renamed"
+        client.member.update(read)
+        assert client.member.update_many([read]).errors == {}
+
+        patches = [
+            json.loads(r.content) for r in fake_engine.calls("PATCH", member_path)
+        ]
+        assert patches[0] == patches[1]
+        assert patches[0]["firstName"] == "Renamed"
+        assert patches[0]["roles"] == ["organizationMember", "teamAdmin"]
+        assert patches[0]["connectedAccounts"] == [
+            {"type": "github", "login": "normal"},
+            {
+                "identifier": "U0001",
+                "teamId": "T0001",
+                "additionalProp1": None,
+                "type": "slack",
+            },
+        ]